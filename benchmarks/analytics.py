@@ -0,0 +1,109 @@
+"""/analytics/* against pulling the dataset and aggregating on the client.
+
+Inserts ``--cats`` cats and ``--missions`` missions (half complete, the rest
+partly assigned) straight into a throwaway database, then times each
+analytics endpoint next to what the finance scripts did before: download
+``/cats/export`` and ``/missions/export`` and aggregate in Python. Usage:
+
+    python -m benchmarks.analytics [--cats 20000] [--missions 100000]
+"""
+
+import argparse
+import json
+import random
+import time
+from collections import defaultdict
+from statistics import median
+
+from sqlalchemy import insert
+
+from benchmarks.common import BREEDS_FIXTURE, benchmark_client
+from db.models import Mission, SpyCat
+
+BATCH_SIZE = 10_000
+
+
+def populate(engine, cats: int, missions: int, rng: random.Random):
+    with open(BREEDS_FIXTURE) as f:
+        breeds = [breed["name"] for breed in json.load(f)]
+    with engine.begin() as conn:
+        for start in range(0, cats, BATCH_SIZE):
+            conn.execute(
+                insert(SpyCat),
+                [
+                    {
+                        "name": f"Cat {i}",
+                        "breed": rng.choice(breeds),
+                        "years_of_experience": rng.randint(0, 15),
+                        "salary": round(rng.uniform(500, 5000), 2),
+                    }
+                    for i in range(start, min(start + BATCH_SIZE, cats))
+                ],
+            )
+        # Every cat has at most one active mission; completed ones pile up.
+        idle = list(range(1, cats + 1))
+        rng.shuffle(idle)
+        rows = []
+        for _ in range(missions):
+            if rng.random() < 0.5:
+                owner = {"cat_id": None, "completed_by": rng.randint(1, cats)}
+                rows.append({"complete": True, **owner})
+            else:
+                owner = {"cat_id": idle.pop() if idle else None, "completed_by": None}
+                rows.append({"complete": False, **owner})
+        for start in range(0, missions, BATCH_SIZE):
+            conn.execute(insert(Mission), rows[start : start + BATCH_SIZE])
+
+
+def client_side(client) -> dict:
+    """The pre-analytics approach: everything over the wire, then Python."""
+    cats = {}
+    for line in client.get("/cats/export").iter_lines():
+        if line:
+            cat = json.loads(line)
+            cats[cat["id"]] = cat
+    active = defaultdict(int)
+    for line in client.get("/missions/export").iter_lines():
+        if line:
+            mission = json.loads(line)
+            if mission["cat_id"] is not None:
+                active[cats[mission["cat_id"]]["breed"]] += 1
+    salaries = defaultdict(float)
+    for cat in cats.values():
+        salaries[cat["breed"]] += cat["salary"]
+    return {"breeds": len(salaries), "active": sum(active.values())}
+
+
+def timed_median(call, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - start)
+    return median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--cats", type=int, default=20_000)
+    parser.add_argument("--missions", type=int, default=100_000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with benchmark_client() as (client, engine):
+        populate(engine, args.cats, args.missions, random.Random(0))
+
+        def get(url):
+            return lambda: client.get(url).raise_for_status()
+
+        for label, call in (
+            ("GET /analytics/payroll", get("/analytics/payroll")),
+            ("GET /analytics/breeds", get("/analytics/breeds")),
+            ("GET /analytics/cats/1/history", get("/analytics/cats/1/history")),
+            ("exports + Python", lambda: client_side(client)),
+        ):
+            print(f"{label:<32} {timed_median(call, args.runs):9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""Archival of completed missions and its effect on the hot read paths.
+
+Inserts ``--completed`` missions completed long ago and ``--live`` active
+ones (two targets each) straight into a throwaway database, times a few
+live-data reads, archives the completed missions in batches of
+``--batch-size`` and times the same reads again. Usage:
+
+    python -m benchmarks.archive [--completed 100000] [--live 10000]
+"""
+
+import argparse
+import time
+from datetime import timedelta
+from statistics import median
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session
+
+from benchmarks.common import benchmark_client
+from db.models import Mission, Target
+from services.archive_service import archive_completed_missions
+from services.clock import utcnow
+
+BATCH_SIZE = 10_000
+READS = {
+    "GET /missions/?complete=false": ("/missions/", {"complete": "false"}),
+    "GET /missions/?country=Japan": ("/missions/", {"country": "Japan"}),
+    "GET /missions/summary": ("/missions/summary", {}),
+}
+
+
+def populate(engine, completed: int, live: int):
+    long_ago = utcnow() - timedelta(days=365)
+    total = completed + live
+    with engine.begin() as conn:
+        for start in range(0, total, BATCH_SIZE):
+            rows = [
+                {
+                    "complete": index < completed,
+                    "completed_at": long_ago if index < completed else None,
+                    "targets_total": 2,
+                    "targets_completed": 0,
+                }
+                for index in range(start, min(start + BATCH_SIZE, total))
+            ]
+            conn.execute(insert(Mission), rows)
+        ids = conn.execute(select(Mission.id)).scalars().all()
+        for start in range(0, len(ids), BATCH_SIZE):
+            conn.execute(
+                insert(Target),
+                [
+                    {
+                        "mission_id": mission_id,
+                        "name": f"Target {mission_id}-{t}",
+                        "country": ("Japan", "France")[t],
+                        "notes": "",
+                    }
+                    for mission_id in ids[start : start + BATCH_SIZE]
+                    for t in range(2)
+                ],
+            )
+
+
+def time_reads(client, runs: int) -> dict:
+    timings = {}
+    for label, (url, params) in READS.items():
+        samples = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            client.get(url, params=params).raise_for_status()
+            samples.append(time.perf_counter() - start)
+        timings[label] = median(samples) * 1000
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--completed", type=int, default=100_000)
+    parser.add_argument("--live", type=int, default=10_000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    with benchmark_client() as (client, engine):
+        populate(engine, args.completed, args.live)
+        before = time_reads(client, args.runs)
+
+        start = time.perf_counter()
+        with Session(engine) as db:
+            archived = archive_completed_missions(
+                db, timedelta(days=30), args.batch_size
+            )
+        elapsed = time.perf_counter() - start
+        # Measure the steady state, not reads through a WAL full of deletes.
+        with engine.connect() as conn:
+            conn.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+        after = time_reads(client, args.runs)
+
+    print(
+        f"archived {archived} missions in {elapsed:.1f} s"
+        f" ({archived / elapsed:,.0f} missions/s, batches of {args.batch_size})"
+    )
+    print(f"{'read':<34} {'before ms':>10} {'after ms':>10}")
+    for label in READS:
+        print(f"{label:<34} {before[label]:>10.2f} {after[label]:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
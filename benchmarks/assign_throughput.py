@@ -0,0 +1,80 @@
+"""Concurrent PATCH /missions/{id}/assign throughput and correctness.
+
+Every thread assigns cats to missions while other threads compete for the
+same cats; afterwards no cat may hold more than one active mission. Usage:
+
+    python -m benchmarks.assign_throughput [--threads 16] [--cats 50]
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import func, select
+
+from benchmarks.common import benchmark_client, mission_payload
+from db.models import Mission
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--cats", type=int, default=50)
+    parser.add_argument("--missions-per-cat", type=int, default=4)
+    args = parser.parse_args()
+
+    with benchmark_client() as (client, engine):
+        cats = [
+            {
+                "name": f"Cat {i}",
+                "breed": "Bengal",
+                "years_of_experience": 1,
+                "salary": 1,
+            }
+            for i in range(args.cats)
+        ]
+        cat_ids = [
+            r["id"] for r in client.post("/cats/bulk", json=cats).json()["results"]
+        ]
+        payloads = [
+            mission_payload(i) for i in range(args.cats * args.missions_per_cat)
+        ]
+        mission_ids = [
+            r["id"]
+            for r in client.post("/missions/bulk", json=payloads).json()["results"]
+        ]
+        attempts = [
+            (mission_id, cat_ids[i % len(cat_ids)])
+            for i, mission_id in enumerate(mission_ids)
+        ]
+
+        def assign(attempt):
+            mission_id, cat_id = attempt
+            return client.patch(
+                f"/missions/{mission_id}/assign", json={"cat_id": cat_id}
+            ).status_code
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.threads) as pool:
+            statuses = list(pool.map(assign, attempts))
+        elapsed = time.perf_counter() - start
+
+        with engine.connect() as conn:
+            busiest = conn.execute(
+                select(func.count())
+                .select_from(Mission)
+                .where(Mission.complete == False, Mission.cat_id.isnot(None))
+                .group_by(Mission.cat_id)
+                .order_by(func.count().desc())
+                .limit(1)
+            ).scalar()
+
+    print(f"{len(attempts)} assign requests in {elapsed * 1000:.1f} ms")
+    print(f"{len(attempts) / elapsed:.1f} requests/s")
+    print(f"succeeded={statuses.count(200)} conflicts={statuses.count(400)}")
+    print(f"max active missions per cat: {busiest}")
+    assert busiest == 1 and statuses.count(200) == args.cats
+
+
+if __name__ == "__main__":
+    main()
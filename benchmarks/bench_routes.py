@@ -0,0 +1,218 @@
+"""Per-route micro-benchmarks in pytest-benchmark style.
+
+Runs in-process through ``TestClient`` against a seeded throwaway database
+with TheCatAPI stubbed. The file is not collected by the regular test run;
+invoke it explicitly (requires the pytest-benchmark plugin):
+
+    python -m pytest benchmarks/bench_routes.py --benchmark-autosave
+    python -m pytest benchmarks/bench_routes.py --benchmark-compare
+
+Dataset size follows BENCH_CATS / BENCH_MISSIONS (default 500 / 1000).
+"""
+
+import itertools
+import os
+import random
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from benchmarks.common import benchmark_client  # noqa: E402
+from benchmarks.dataset import (  # noqa: E402
+    breeds,
+    cat_payload,
+    random_mission_payload,
+    seed,
+)
+from services.response_cache import response_cache  # noqa: E402
+
+CATS = int(os.getenv("BENCH_CATS", "500"))
+MISSIONS = int(os.getenv("BENCH_MISSIONS", "1000"))
+
+
+@pytest.fixture(scope="module")
+def seeded():
+    with benchmark_client() as (client, _):
+        yield client, seed(client, CATS, MISSIONS)
+
+
+@pytest.fixture
+def client(seeded):
+    return seeded[0]
+
+
+@pytest.fixture
+def dataset(seeded):
+    return seeded[1]
+
+
+@pytest.fixture
+def rng():
+    return random.Random(0)
+
+
+def ok(response, status=200):
+    assert response.status_code == status, response.text
+    return response
+
+
+def test_get_cat_cached(benchmark, client, dataset):
+    cat_id = dataset.cat_ids[0]
+    benchmark(lambda: ok(client.get(f"/cats/{cat_id}")))
+
+
+def test_get_mission_cached(benchmark, client, dataset):
+    mission_id = dataset.mission_ids[0]
+    benchmark(lambda: ok(client.get(f"/missions/{mission_id}")))
+
+
+def test_get_mission_uncached(benchmark, client, dataset):
+    mission_id = dataset.mission_ids[0]
+    benchmark.pedantic(
+        lambda: ok(client.get(f"/missions/{mission_id}")),
+        setup=response_cache.clear,
+        rounds=200,
+    )
+
+
+def test_get_mission_not_modified(benchmark, client, dataset):
+    url = f"/missions/{dataset.mission_ids[0]}"
+    headers = {"If-None-Match": ok(client.get(url)).headers["ETag"]}
+    benchmark(lambda: ok(client.get(url, headers=headers), 304))
+
+
+def test_list_cats(benchmark, client):
+    benchmark(lambda: ok(client.get("/cats/", params={"limit": 100})))
+
+
+def test_list_missions(benchmark, client):
+    benchmark(lambda: ok(client.get("/missions/", params={"limit": 100})))
+
+
+def test_list_missions_filtered(benchmark, client):
+    params = {"limit": 100, "complete": "false", "country": "Japan"}
+    benchmark(lambda: ok(client.get("/missions/", params=params)))
+
+
+def test_export_cats(benchmark, client):
+    benchmark(lambda: ok(client.get("/cats/export")))
+
+
+def test_export_missions(benchmark, client):
+    benchmark(lambda: ok(client.get("/missions/export")))
+
+
+def test_create_cat(benchmark, client, rng):
+    names = breeds()
+    benchmark(lambda: ok(client.post("/cats/", json=cat_payload(rng, names)), 201))
+
+
+def test_bulk_create_cats(benchmark, client, rng):
+    names = breeds()
+    payload = [cat_payload(rng, names) for _ in range(100)]
+    benchmark(lambda: ok(client.post("/cats/bulk", json=payload)))
+
+
+def test_bulk_create_cats_csv(benchmark, client, rng):
+    names = breeds()
+    rows = [cat_payload(rng, names) for _ in range(100)]
+    body = "name,years_of_experience,breed,salary\n" + "".join(
+        f"{r['name']},{r['years_of_experience']},{r['breed']},{r['salary']}\n"
+        for r in rows
+    )
+    headers = {"Content-Type": "text/csv"}
+    benchmark(lambda: ok(client.post("/cats/bulk/csv", content=body, headers=headers)))
+
+
+def test_create_mission(benchmark, client, rng):
+    benchmark(
+        lambda: ok(client.post("/missions/", json=random_mission_payload(rng)), 201)
+    )
+
+
+def test_bulk_create_missions(benchmark, client, rng):
+    payload = [random_mission_payload(rng) for _ in range(100)]
+    benchmark(lambda: ok(client.post("/missions/bulk", json=payload)))
+
+
+def test_update_cat(benchmark, client, dataset):
+    cat_ids = itertools.cycle(dataset.cat_ids)
+    benchmark(
+        lambda: ok(client.patch(f"/cats/{next(cat_ids)}", json={"salary": 1234.5}))
+    )
+
+
+def test_update_mission(benchmark, client, dataset):
+    # Unassigned missions toggle freely between complete and active.
+    mission_ids = itertools.cycle(
+        m for m in dataset.mission_ids if m not in dataset.assignments
+    )
+    flags = itertools.cycle([True, False])
+    benchmark(
+        lambda: ok(
+            client.patch(
+                f"/missions/{next(mission_ids)}", json={"complete": next(flags)}
+            )
+        )
+    )
+
+
+def test_update_target(benchmark, client, dataset):
+    targets = itertools.cycle(
+        t for t in dataset.targets if t[0] not in dataset.assignments
+    )
+
+    def update():
+        mission_id, target_id = next(targets)
+        url = f"/missions/{mission_id}/targets/{target_id}"
+        ok(client.patch(url, json={"complete": False}))
+
+    benchmark(update)
+
+
+def test_assign_cat(benchmark, client, rng):
+    names = breeds()
+
+    def setup():
+        cat = ok(client.post("/cats/", json=cat_payload(rng, names)), 201).json()
+        mission = ok(
+            client.post("/missions/", json=random_mission_payload(rng)), 201
+        ).json()
+        return (mission["id"], cat["id"]), {}
+
+    benchmark.pedantic(
+        lambda mission_id, cat_id: ok(
+            client.patch(f"/missions/{mission_id}/assign", json={"cat_id": cat_id})
+        ),
+        setup=setup,
+        rounds=200,
+    )
+
+
+def test_delete_cat(benchmark, client, rng):
+    names = breeds()
+
+    def setup():
+        cat = ok(client.post("/cats/", json=cat_payload(rng, names)), 201).json()
+        return (cat["id"],), {}
+
+    benchmark.pedantic(
+        lambda cat_id: ok(client.delete(f"/cats/{cat_id}"), 204),
+        setup=setup,
+        rounds=200,
+    )
+
+
+def test_delete_mission(benchmark, client, rng):
+    def setup():
+        mission = ok(
+            client.post("/missions/", json=random_mission_payload(rng)), 201
+        ).json()
+        return (mission["id"],), {}
+
+    benchmark.pedantic(
+        lambda mission_id: ok(client.delete(f"/missions/{mission_id}"), 204),
+        setup=setup,
+        rounds=200,
+    )
@@ -0,0 +1,45 @@
+"""Time POST /cats/bulk and POST /cats/bulk/csv on a large cohort.
+
+Usage: python -m benchmarks.bulk_cats [--count 100000]
+"""
+
+import argparse
+
+from benchmarks.common import benchmark_client, timed
+
+BREEDS = ["Bengal", "Bombay", "Persian", "Siamese"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100000)
+    args = parser.parse_args()
+    cats = [
+        {
+            "name": f"Cat {i}",
+            "breed": BREEDS[i % len(BREEDS)],
+            "years_of_experience": i % 15,
+            "salary": 1000 + i % 5000,
+        }
+        for i in range(args.count)
+    ]
+    csv_body = "name,breed,years_of_experience,salary\n" + "".join(
+        f"{c['name']},{c['breed']},{c['years_of_experience']},{c['salary']}\n"
+        for c in cats
+    )
+
+    with benchmark_client() as (client, _):
+        with timed(f"POST /cats/bulk ({args.count} rows)", args.count):
+            response = client.post("/cats/bulk", json=cats)
+            assert response.json()["created"] == args.count
+
+    with benchmark_client() as (client, _):
+        with timed(f"POST /cats/bulk/csv ({args.count} rows)", args.count):
+            response = client.post(
+                "/cats/bulk/csv", content=csv_body, headers={"Content-Type": "text/csv"}
+            )
+            assert response.json()["created"] == args.count
+
+
+if __name__ == "__main__":
+    main()
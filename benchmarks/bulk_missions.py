@@ -0,0 +1,29 @@
+"""Compare POST /missions/bulk with looping over POST /missions/.
+
+Usage: python -m benchmarks.bulk_missions [--count 500]
+"""
+
+import argparse
+
+from benchmarks.common import benchmark_client, mission_payload, timed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=500)
+    args = parser.parse_args()
+    payloads = [mission_payload(i) for i in range(args.count)]
+
+    with benchmark_client() as (client, _):
+        with timed(f"POST /missions/ x {args.count}", args.count):
+            for payload in payloads:
+                assert client.post("/missions/", json=payload).status_code == 201
+
+    with benchmark_client() as (client, _):
+        with timed(f"POST /missions/bulk ({args.count} items)", args.count):
+            response = client.post("/missions/bulk", json=payloads)
+            assert response.json()["created"] == args.count
+
+
+if __name__ == "__main__":
+    main()
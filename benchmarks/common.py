@@ -0,0 +1,72 @@
+import contextlib
+import os
+import tempfile
+import time
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from db.database import create_db_engine, get_db
+from db.migrations import upgrade
+from main import app
+from services.breed_catalog import catalog, file_fetcher
+from services.response_cache import response_cache
+
+BREEDS_FIXTURE = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)), "tests", "data", "breeds.json"
+)
+
+
+def mission_payload(index: int, targets: int = 2) -> dict:
+    return {
+        "complete": False,
+        "targets": [
+            {"name": f"Target {index}-{t}", "country": "Benchland"}
+            for t in range(targets)
+        ],
+    }
+
+
+@contextlib.contextmanager
+def benchmark_app():
+    """Bind ``app`` to a throwaway SQLite file and yield its engine.
+
+    TheCatAPI is replaced by the breed list in ``tests/data/breeds.json`` and
+    the response cache starts empty.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_db_engine(f"sqlite:///{tmp}/bench.db")
+        upgrade(engine)
+        SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        def override_get_db():
+            db = SessionLocal()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        app.dependency_overrides[get_db] = override_get_db
+        catalog.configure(fetcher=file_fetcher(BREEDS_FIXTURE), snapshot_path=None)
+        response_cache.clear()
+        try:
+            yield engine
+        finally:
+            app.dependency_overrides.pop(get_db, None)
+            response_cache.clear()
+            engine.dispose()
+
+
+@contextlib.contextmanager
+def benchmark_client():
+    """Yield ``(client, engine)`` for the app bound to a throwaway SQLite file."""
+    with benchmark_app() as engine:
+        yield TestClient(app), engine
+
+
+@contextlib.contextmanager
+def timed(label: str, operations: int):
+    start = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - start
+    print(f"{label:<40} {elapsed * 1000:10.1f} ms  {operations / elapsed:12.1f} ops/s")
@@ -0,0 +1,59 @@
+"""Compare two JSON results saved by ``benchmarks.load``.
+
+Prints p50/p99 per operation and overall throughput side by side with the
+relative change, flagging regressions beyond ``--threshold`` percent. Usage:
+
+    python -m benchmarks.compare BASELINE.json CANDIDATE.json [--threshold 10]
+"""
+
+import argparse
+import sys
+
+from benchmarks.report import load_results
+
+
+def change(old: float, new: float) -> float:
+    return (new - old) / old * 100 if old else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=10.0)
+    args = parser.parse_args()
+    old, new = load_results(args.baseline), load_results(args.candidate)
+
+    print(f"baseline  {old.get('git_revision')}  {old.get('timestamp')}")
+    print(f"candidate {new.get('git_revision')}  {new.get('timestamp')}")
+    print(f"{'operation':<36} {'p50 ms':>17} {'':>8} {'p99 ms':>17} {'':>8}")
+    regressions = []
+    rows = dict(new["operations"], all=new["overall"])
+    baseline_rows = dict(old["operations"], all=old["overall"])
+    for name, stats in rows.items():
+        base = baseline_rows.get(name)
+        if not base or not base.get("count") or not stats.get("count"):
+            continue
+        p50 = change(base["p50_ms"], stats["p50_ms"])
+        p99 = change(base["p99_ms"], stats["p99_ms"])
+        print(
+            f"{name:<36} {base['p50_ms']:>8.2f}{stats['p50_ms']:>9.2f} {p50:>+7.1f}%"
+            f" {base['p99_ms']:>8.2f}{stats['p99_ms']:>9.2f} {p99:>+7.1f}%"
+        )
+        if p50 > args.threshold:
+            regressions.append(f"{name} p50 {p50:+.1f}%")
+
+    throughput = change(old["throughput_rps"], new["throughput_rps"])
+    print(
+        f"throughput {old['throughput_rps']} -> {new['throughput_rps']} req/s"
+        f" ({throughput:+.1f}%)"
+    )
+    if -throughput > args.threshold:
+        regressions.append(f"throughput {throughput:+.1f}%")
+    if regressions:
+        print("regressions: " + ", ".join(regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Synthetic, reproducible cats and missions seeded through the HTTP API."""
+
+import json
+import random
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+from benchmarks.common import BREEDS_FIXTURE
+
+COUNTRIES = ("France", "Japan", "Brazil", "Kenya", "Canada", "Norway", "India")
+NAMES = ("Shadow", "Whiskers", "Luna", "Ghost", "Mittens", "Onyx", "Pixel", "Ziggy")
+
+# /missions/bulk refuses larger batches by default (MAX_BULK_MISSIONS).
+SEED_BATCH_SIZE = 1000
+
+
+def breeds() -> List[str]:
+    with open(BREEDS_FIXTURE) as f:
+        return [breed["name"] for breed in json.load(f)]
+
+
+def cat_payload(rng: random.Random, breed_names: List[str]) -> dict:
+    return {
+        "name": f"{rng.choice(NAMES)} {rng.randrange(10_000)}",
+        "years_of_experience": rng.randint(0, 15),
+        "breed": rng.choice(breed_names),
+        "salary": round(rng.uniform(500, 5000), 2),
+    }
+
+
+def random_mission_payload(rng: random.Random) -> dict:
+    return {
+        "complete": False,
+        "targets": [
+            {
+                "name": f"Target {rng.randrange(100_000)}",
+                "country": rng.choice(COUNTRIES),
+                "notes": "",
+            }
+            for _ in range(rng.randint(1, 3))
+        ],
+    }
+
+
+@dataclass
+class Dataset:
+    cat_ids: List[int] = field(default_factory=list)
+    mission_ids: List[int] = field(default_factory=list)
+    # (mission_id, target_id) for every seeded target.
+    targets: List[Tuple[int, int]] = field(default_factory=list)
+    # mission_id -> cat_id for the missions seeded as active assignments.
+    assignments: Dict[int, int] = field(default_factory=dict)
+
+
+def seed(
+    client,
+    cats: int,
+    missions: int,
+    assigned_fraction: float = 0.5,
+    seed: int = 0,
+) -> Dataset:
+    """Create ``cats`` cats and ``missions`` missions with 1-3 targets each.
+
+    ``client`` is any httpx-style sync client (``TestClient`` included). Up
+    to ``assigned_fraction`` of the missions get a distinct cat assigned.
+    """
+    rng = random.Random(seed)
+    breed_names = breeds()
+    dataset = Dataset()
+
+    payloads = [cat_payload(rng, breed_names) for _ in range(cats)]
+    for start in range(0, len(payloads), SEED_BATCH_SIZE):
+        response = client.post(
+            "/cats/bulk", json=payloads[start : start + SEED_BATCH_SIZE]
+        )
+        response.raise_for_status()
+        dataset.cat_ids.extend(r["id"] for r in response.json()["results"])
+
+    payloads = [random_mission_payload(rng) for _ in range(missions)]
+    for start in range(0, len(payloads), SEED_BATCH_SIZE):
+        response = client.post(
+            "/missions/bulk", json=payloads[start : start + SEED_BATCH_SIZE]
+        )
+        response.raise_for_status()
+        dataset.mission_ids.extend(r["id"] for r in response.json()["results"])
+
+    with client.stream("GET", "/missions/export") as response:
+        for line in response.iter_lines():
+            if line:
+                mission = json.loads(line)
+                dataset.targets.extend(
+                    (mission["id"], target["id"]) for target in mission["targets"]
+                )
+
+    assigned = min(
+        len(dataset.cat_ids), int(len(dataset.mission_ids) * assigned_fraction)
+    )
+    for mission_id, cat_id in zip(dataset.mission_ids[:assigned], dataset.cat_ids):
+        response = client.patch(
+            f"/missions/{mission_id}/assign", json={"cat_id": cat_id}
+        )
+        response.raise_for_status()
+        dataset.assignments[mission_id] = cat_id
+    return dataset
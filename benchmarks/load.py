@@ -0,0 +1,410 @@
+"""Concurrent load driver for every cat and mission route.
+
+Seeds a synthetic dataset, then runs ``--concurrency`` asyncio workers with
+httpx against a real HTTP server, picking operations from a weighted mix.
+Without ``--url`` the app is served by a ``serve.py`` subprocess on a
+throwaway SQLite file with TheCatAPI stubbed by ``tests/data/breeds.json``;
+with ``--url`` an already running server is used (and must be able to
+validate the fixture breeds). Prints p50/p99 per operation, throughput and peak
+memory, and saves the numbers as JSON for ``benchmarks.compare``. Usage:
+
+    python -m benchmarks.load [--cats 500] [--missions 1000] [--mix read]
+        [--concurrency 16] [--requests 5000 | --duration 30] [--output FILE]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import csv
+import io
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter, defaultdict
+from typing import Tuple
+
+import httpx
+
+from benchmarks.dataset import (
+    COUNTRIES,
+    breeds,
+    cat_payload,
+    random_mission_payload,
+    seed,
+)
+from benchmarks.report import peak_rss_mb, save_results, summarize
+from benchmarks.startup import ROOT, write_snapshot
+
+EXPORT_TAIL = 100
+
+
+class LoadState:
+    """Ids the operations pick from, grown by the create operations.
+
+    Only entities created during the run are deleted, so deletes do not
+    starve the read operations of seeded data.
+    """
+
+    def __init__(self, dataset):
+        self.dataset = dataset
+        self.breeds = breeds()
+        self.fresh_cats = []
+        self.fresh_missions = []
+
+
+async def create_cat(client, state, rng):
+    response = await client.post("/cats/", json=cat_payload(rng, state.breeds))
+    if response.status_code == 201:
+        state.fresh_cats.append(response.json()["id"])
+    return response
+
+
+async def bulk_create_cats(client, state, rng):
+    return await client.post(
+        "/cats/bulk", json=[cat_payload(rng, state.breeds) for _ in range(20)]
+    )
+
+
+async def bulk_create_cats_csv(client, state, rng):
+    buffer = io.StringIO()
+    writer = csv.DictWriter(
+        buffer, fieldnames=["name", "years_of_experience", "breed", "salary"]
+    )
+    writer.writeheader()
+    writer.writerows(cat_payload(rng, state.breeds) for _ in range(20))
+    return await client.post(
+        "/cats/bulk/csv",
+        content=buffer.getvalue(),
+        headers={"Content-Type": "text/csv"},
+    )
+
+
+async def list_cats(client, state, rng):
+    params = {"limit": 50}
+    if rng.random() < 0.3:
+        params["breed"] = rng.choice(state.breeds)
+    return await client.get("/cats/", params=params)
+
+
+async def export_cats(client, state, rng):
+    since_id = max(state.dataset.cat_ids[-1] - EXPORT_TAIL, 0)
+    return await client.get("/cats/export", params={"since_id": since_id})
+
+
+async def get_cat(client, state, rng):
+    return await client.get(f"/cats/{rng.choice(state.dataset.cat_ids)}")
+
+
+async def update_cat(client, state, rng):
+    cat_id = rng.choice(state.dataset.cat_ids)
+    return await client.patch(
+        f"/cats/{cat_id}", json={"salary": round(rng.uniform(500, 5000), 2)}
+    )
+
+
+async def delete_cat(client, state, rng):
+    if not state.fresh_cats:
+        return None
+    return await client.delete(f"/cats/{state.fresh_cats.pop()}")
+
+
+async def create_mission(client, state, rng):
+    response = await client.post("/missions/", json=random_mission_payload(rng))
+    if response.status_code == 201:
+        state.fresh_missions.append(response.json()["id"])
+    return response
+
+
+async def bulk_create_missions(client, state, rng):
+    return await client.post(
+        "/missions/bulk", json=[random_mission_payload(rng) for _ in range(10)]
+    )
+
+
+async def list_missions(client, state, rng):
+    params = {"limit": 50}
+    choice = rng.random()
+    if choice < 0.2:
+        params["complete"] = "false"
+    elif choice < 0.4:
+        params["country"] = rng.choice(COUNTRIES)
+    elif choice < 0.5:
+        params["breed"] = rng.choice(state.breeds)
+    return await client.get("/missions/", params=params)
+
+
+async def export_missions(client, state, rng):
+    since_id = max(state.dataset.mission_ids[-1] - EXPORT_TAIL, 0)
+    return await client.get("/missions/export", params={"since_id": since_id})
+
+
+async def get_mission(client, state, rng):
+    return await client.get(f"/missions/{rng.choice(state.dataset.mission_ids)}")
+
+
+async def update_mission(client, state, rng):
+    mission_id = rng.choice(state.dataset.mission_ids)
+    return await client.patch(
+        f"/missions/{mission_id}", json={"complete": rng.random() < 0.5}
+    )
+
+
+async def delete_mission(client, state, rng):
+    if not state.fresh_missions:
+        return None
+    return await client.delete(f"/missions/{state.fresh_missions.pop()}")
+
+
+async def assign_cat(client, state, rng):
+    # Mostly lands on busy cats or assigned missions and is refused with a
+    # 400, like contended assignments in production.
+    mission_id = rng.choice(state.dataset.mission_ids)
+    cat_id = rng.choice(state.dataset.cat_ids)
+    return await client.patch(f"/missions/{mission_id}/assign", json={"cat_id": cat_id})
+
+
+async def update_target(client, state, rng):
+    mission_id, target_id = rng.choice(state.dataset.targets)
+    return await client.patch(
+        f"/missions/{mission_id}/targets/{target_id}",
+        json={"notes": f"Seen at {rng.randrange(24):02d}:00"},
+    )
+
+
+OPERATIONS = {
+    "POST /cats/": create_cat,
+    "POST /cats/bulk": bulk_create_cats,
+    "POST /cats/bulk/csv": bulk_create_cats_csv,
+    "GET /cats/": list_cats,
+    "GET /cats/export": export_cats,
+    "GET /cats/{id}": get_cat,
+    "PATCH /cats/{id}": update_cat,
+    "DELETE /cats/{id}": delete_cat,
+    "POST /missions/": create_mission,
+    "POST /missions/bulk": bulk_create_missions,
+    "GET /missions/": list_missions,
+    "GET /missions/export": export_missions,
+    "GET /missions/{id}": get_mission,
+    "PATCH /missions/{id}": update_mission,
+    "DELETE /missions/{id}": delete_mission,
+    "PATCH /missions/{id}/assign": assign_cat,
+    "PATCH /missions/{id}/targets/{id}": update_target,
+}
+
+# Relative weights; every route appears in every mix.
+MIXES = {
+    "read": {
+        "GET /missions/{id}": 30,
+        "GET /cats/{id}": 20,
+        "GET /missions/": 15,
+        "GET /cats/": 10,
+        "PATCH /missions/{id}/targets/{id}": 5,
+        "PATCH /cats/{id}": 3,
+        "POST /missions/": 3,
+        "POST /cats/": 3,
+        "PATCH /missions/{id}/assign": 2,
+        "PATCH /missions/{id}": 1,
+        "DELETE /missions/{id}": 2,
+        "DELETE /cats/{id}": 2,
+        "GET /missions/export": 1,
+        "GET /cats/export": 1,
+        "POST /missions/bulk": 0.5,
+        "POST /cats/bulk": 0.5,
+        "POST /cats/bulk/csv": 0.5,
+    },
+    "write": {
+        "GET /missions/{id}": 10,
+        "GET /cats/{id}": 5,
+        "GET /missions/": 5,
+        "GET /cats/": 3,
+        "PATCH /missions/{id}/targets/{id}": 20,
+        "PATCH /cats/{id}": 10,
+        "POST /missions/": 12,
+        "POST /cats/": 8,
+        "PATCH /missions/{id}/assign": 8,
+        "PATCH /missions/{id}": 5,
+        "DELETE /missions/{id}": 6,
+        "DELETE /cats/{id}": 4,
+        "GET /missions/export": 0.5,
+        "GET /cats/export": 0.5,
+        "POST /missions/bulk": 1,
+        "POST /cats/bulk": 1,
+        "POST /cats/bulk/csv": 1,
+    },
+}
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(
+    tmp: str, workers: int = 1, **env: str
+) -> Tuple[subprocess.Popen, str]:
+    """Start ``serve.py`` on a throwaway SQLite file in ``tmp``, with breeds
+    from a snapshot of ``tests/data/breeds.json`` and ``env`` on top of ours.
+    Returns the process and its base URL once it answers."""
+    snapshot = os.path.join(tmp, "breeds_snapshot.json")
+    write_snapshot(snapshot)
+    env = dict(
+        os.environ,
+        DATABASE_PATH=os.path.join(tmp, "bench.db"),
+        BREED_CATALOG_SNAPSHOT_PATH=snapshot,
+        **env,
+    )
+    env.pop("DATABASE_URL", None)
+    port = free_port()
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            "serve.py",
+            f"--workers={workers}",
+            f"--port={port}",
+            "--log-level=warning",
+        ],
+        cwd=ROOT,
+        env=env,
+    )
+    base_url = f"http://127.0.0.1:{port}"
+    deadline = time.monotonic() + 60
+    while True:
+        if process.poll() is not None:
+            raise RuntimeError(f"serve.py exited with {process.returncode}")
+        try:
+            httpx.get(f"{base_url}/", timeout=1).raise_for_status()
+            return process, base_url
+        except httpx.HTTPError:
+            if time.monotonic() > deadline:
+                process.terminate()
+                raise RuntimeError("serve.py did not start")
+            time.sleep(0.1)
+
+
+@contextlib.contextmanager
+def local_server():
+    """Serve the app from a ``serve.py`` subprocess on a throwaway database,
+    yielding its base URL; the checked-in ``spy_cats.db`` is never opened."""
+    with tempfile.TemporaryDirectory() as tmp:
+        process, base_url = start_server(tmp)
+        try:
+            yield base_url
+        finally:
+            process.terminate()
+            process.wait()
+
+
+async def drive(base_url, state, mix, concurrency, requests, duration, seed):
+    names = list(mix)
+    weights = [mix[name] for name in names]
+    latencies = defaultdict(list)
+    statuses = defaultdict(Counter)
+    remaining = [requests]
+    deadline = time.perf_counter() + duration if duration else None
+
+    async def worker(index):
+        rng = random.Random(f"{seed}-{index}")
+        while True:
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            if deadline is None:
+                if remaining[0] <= 0:
+                    return
+                remaining[0] -= 1
+            name = rng.choices(names, weights)[0]
+            start = time.perf_counter()
+            response = await OPERATIONS[name](client, state, rng)
+            if response is None:
+                continue
+            latencies[name].append(time.perf_counter() - start)
+            statuses[name][str(response.status_code)] += 1
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=60
+    ) as client:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(i) for i in range(concurrency)))
+        elapsed = time.perf_counter() - start
+    return latencies, statuses, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--url", help="benchmark a running server instead")
+    parser.add_argument("--cats", type=int, default=500)
+    parser.add_argument("--missions", type=int, default=1000)
+    parser.add_argument("--mix", choices=sorted(MIXES), default="read")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument(
+        "--duration", type=float, help="run for this many seconds instead"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="JSON results path")
+    args = parser.parse_args()
+
+    server = contextlib.nullcontext(args.url) if args.url else local_server()
+    with server as base_url:
+        start = time.perf_counter()
+        with httpx.Client(base_url=base_url, timeout=300) as client:
+            dataset = seed(client, args.cats, args.missions, seed=args.seed)
+        seed_seconds = time.perf_counter() - start
+
+        state = LoadState(dataset)
+        latencies, statuses, elapsed = asyncio.run(
+            drive(
+                base_url,
+                state,
+                MIXES[args.mix],
+                args.concurrency,
+                args.requests,
+                args.duration,
+                args.seed,
+            )
+        )
+
+    operations = {
+        name: {**summarize(latencies[name]), "statuses": dict(statuses[name])}
+        for name in sorted(latencies)
+    }
+    total = sum(len(values) for values in latencies.values())
+    overall = summarize(value for values in latencies.values() for value in values)
+    results = {
+        "parameters": {
+            key: value for key, value in vars(args).items() if key != "output"
+        },
+        "seed_seconds": round(seed_seconds, 3),
+        "duration_seconds": round(elapsed, 3),
+        "requests": total,
+        "throughput_rps": round(total / elapsed, 1),
+        # The local server's (a child process) unless --url was given.
+        "peak_rss_mb": peak_rss_mb(children=not args.url),
+        "overall": overall,
+        "operations": operations,
+    }
+
+    print(f"{'operation':<36} {'count':>7} {'p50 ms':>9} {'p99 ms':>9}  statuses")
+    for name, stats in operations.items():
+        codes = " ".join(f"{k}:{v}" for k, v in sorted(stats["statuses"].items()))
+        print(
+            f"{name:<36} {stats['count']:>7} {stats['p50_ms']:>9.2f}"
+            f" {stats['p99_ms']:>9.2f}  {codes}"
+        )
+    print(f"{'all':<36} {total:>7} {overall['p50_ms']:>9.2f} {overall['p99_ms']:>9.2f}")
+    print(
+        f"throughput {results['throughput_rps']} req/s over {elapsed:.1f} s,"
+        f" peak RSS {results['peak_rss_mb']} MB"
+    )
+    print(f"saved {save_results('load', results, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Cost of the metrics middleware and SQL timing on hot read paths.
+
+Alternates rounds with ``registry.enabled`` on and off over the same app and
+reports the per-request difference. Usage:
+
+    python -m benchmarks.metrics_overhead [--requests 500] [--rounds 5]
+"""
+
+import argparse
+import time
+
+from benchmarks.common import benchmark_client, mission_payload
+from services.metrics import registry
+
+
+def run(client, paths, requests):
+    start = time.perf_counter()
+    for i in range(requests):
+        client.get(paths[i % len(paths)])
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with benchmark_client() as (client, engine):
+        payloads = [mission_payload(i) for i in range(100)]
+        ids = [
+            r["id"]
+            for r in client.post("/missions/bulk", json=payloads).json()["results"]
+        ]
+        scenarios = {
+            "GET /missions/{id} (cached)": [f"/missions/{i}" for i in ids],
+            "GET /missions/?limit=20": ["/missions/?limit=20"],
+        }
+        enabled = registry.enabled
+        try:
+            for label, paths in scenarios.items():
+                totals = {True: 0.0, False: 0.0}
+                run(client, paths, args.requests // 10)
+                for _ in range(args.rounds):
+                    for state in (False, True):
+                        registry.enabled = state
+                        totals[state] += run(client, paths, args.requests)
+                count = args.requests * args.rounds
+                off, on = totals[False] / count, totals[True] / count
+                print(
+                    f"{label:<32} off {off * 1e6:8.1f} us  on {on * 1e6:8.1f} us"
+                    f"  overhead {(on - off) / off * 100:+6.2f}%"
+                )
+        finally:
+            registry.enabled = enabled
+
+
+if __name__ == "__main__":
+    main()
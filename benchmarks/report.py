@@ -0,0 +1,82 @@
+"""Latency summaries and JSON result files shared by the load benchmarks."""
+
+import datetime
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+from typing import Iterable, List, Optional
+
+RESULTS_DIR = os.path.join(os.path.dirname(__file__), "results")
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(q / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(latencies: Iterable[float]) -> dict:
+    """Count, mean, p50, p99 and max of latencies given in seconds, in ms."""
+    values = sorted(latencies)
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "mean_ms": round(sum(values) / len(values) * 1000, 3),
+        "p50_ms": round(percentile(values, 50) * 1000, 3),
+        "p99_ms": round(percentile(values, 99) * 1000, 3),
+        "max_ms": round(values[-1] * 1000, 3),
+    }
+
+
+def peak_rss_mb(children: bool = False) -> float:
+    """Peak resident set size of this process, or with ``children`` of its
+    largest waited-for child (kilobytes on Linux, bytes on macOS)."""
+    who = resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF
+    peak = resource.getrusage(who).ru_maxrss
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(peak / divisor, 1)
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(__file__),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save_results(name: str, results: dict, path: Optional[str] = None) -> str:
+    """Write ``results`` with run metadata; defaults to benchmarks/results/."""
+    revision = git_revision()
+    now = datetime.datetime.now(datetime.timezone.utc)
+    document = {
+        "benchmark": name,
+        "git_revision": revision,
+        "timestamp": now.isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        **results,
+    }
+    if path is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        stamp = now.strftime("%Y%m%dT%H%M%S")
+        path = os.path.join(RESULTS_DIR, f"{name}-{stamp}-{revision or 'unknown'}.json")
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2)
+    return path
+
+
+def load_results(path: str) -> dict:
+    with open(path) as f:
+        return json.load(f)
@@ -0,0 +1,95 @@
+"""POST /missions/schedule over a large backlog, against one-by-one assigns.
+
+Inserts ``--missions`` unassigned missions and ``--cats`` idle cats straight
+into a throwaway database, then reports the scheduler's phase timings for a
+dry run of every policy and for one real run, next to the time a dispatcher
+would spend on ``--sample`` individual PATCH /missions/{id}/assign calls
+(extrapolated to the same number of assignments). Usage:
+
+    python -m benchmarks.scheduler [--missions 100000] [--cats 20000]
+"""
+
+import argparse
+import random
+import time
+
+from sqlalchemy import insert
+
+from benchmarks.common import benchmark_client
+from db.models import Mission, SpyCat
+from services.scheduler import POLICIES
+
+BATCH_SIZE = 10_000
+
+
+def populate(engine, cats: int, missions: int, rng: random.Random):
+    with engine.begin() as conn:
+        for start in range(0, cats, BATCH_SIZE):
+            conn.execute(
+                insert(SpyCat),
+                [
+                    {
+                        "name": f"Cat {i}",
+                        "breed": "Bengal",
+                        "years_of_experience": rng.randint(0, 15),
+                        "salary": round(rng.uniform(500, 5000), 2),
+                    }
+                    for i in range(start, min(start + BATCH_SIZE, cats))
+                ],
+            )
+        for start in range(0, missions, BATCH_SIZE):
+            count = min(BATCH_SIZE, missions - start)
+            conn.execute(insert(Mission), [{"complete": False}] * count)
+
+
+def report(label: str, result: dict, elapsed: float):
+    phases = "  ".join(f"{k} {v:8.1f}" for k, v in result["timings"].items())
+    print(
+        f"{label:<22} {len(result['assignments']):>7} assignments"
+        f"  request {elapsed * 1000:8.1f} ms  {phases}"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--missions", type=int, default=100_000)
+    parser.add_argument("--cats", type=int, default=20_000)
+    parser.add_argument("--sample", type=int, default=200)
+    args = parser.parse_args()
+
+    with benchmark_client() as (client, engine):
+        populate(engine, args.cats, args.missions, random.Random(0))
+
+        for policy in POLICIES:
+            start = time.perf_counter()
+            response = client.post(
+                "/missions/schedule", json={"policy": policy, "dry_run": True}
+            )
+            response.raise_for_status()
+            report(f"{policy} (dry run)", response.json(), time.perf_counter() - start)
+
+        # One at a time, as dispatchers do today: the last cats and missions,
+        # which the scheduler run below would otherwise take.
+        start = time.perf_counter()
+        for offset in range(args.sample):
+            response = client.patch(
+                f"/missions/{args.missions - offset}/assign",
+                json={"cat_id": args.cats - offset},
+            )
+            response.raise_for_status()
+        per_assign = (time.perf_counter() - start) / args.sample
+
+        start = time.perf_counter()
+        response = client.post("/missions/schedule", json={"policy": "fifo"})
+        response.raise_for_status()
+        result = response.json()
+        report("fifo (commit)", result, time.perf_counter() - start)
+        print(
+            f"{'PATCH .../assign':<22} {per_assign * 1000:.2f} ms each,"
+            f" {per_assign * len(result['assignments']):.1f} s for the same"
+            f" {len(result['assignments'])} assignments"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Latency of GET /targets/search over a large synthetic set of notes.
+
+Notes draw on a 20k-word vocabulary with Zipf-like frequencies, so the
+``WORDS`` used in queries range from very common to fairly rare. Targets are inserted straight into the throwaway database (the FTS triggers
+index them as they go), then each query shape is timed through the API.
+Usage:
+
+    python -m benchmarks.search [--targets 200000] [--requests 200]
+"""
+
+import argparse
+import random
+import time
+from itertools import accumulate
+
+from sqlalchemy import insert
+
+from benchmarks.common import benchmark_client
+from benchmarks.dataset import COUNTRIES
+from benchmarks.report import summarize
+from db.models import Mission, Target
+
+WORDS = (
+    "safehouse courier rooftop embassy cipher ledger tunnel dockyard"
+    " informant border checkpoint warehouse satellite archive diplomat"
+    " smuggler frequency dossier vault harbour"
+).split()
+SYLLABLES = "ka lo mi ne ru sa ti vo ze ba".split()
+TARGETS_PER_MISSION = 3
+BATCH_SIZE = 10_000
+
+
+def vocabulary(size: int, rng: random.Random):
+    """``WORDS`` followed by invented words, with cumulative Zipf-like weights."""
+    words = list(WORDS)
+    while len(words) < size:
+        words.append("".join(rng.choices(SYLLABLES, k=rng.randint(2, 4))))
+    return words, list(accumulate(1 / rank for rank in range(1, len(words) + 1)))
+
+
+def populate(engine, targets: int, rng: random.Random):
+    words, cum_weights = vocabulary(20_000, rng)
+    missions = targets // TARGETS_PER_MISSION
+    with engine.begin() as conn:
+        conn.execute(
+            insert(Mission),
+            [
+                {"complete": False, "targets_total": TARGETS_PER_MISSION}
+                for _ in range(missions)
+            ],
+        )
+        for start in range(0, missions * TARGETS_PER_MISSION, BATCH_SIZE):
+            conn.execute(
+                insert(Target),
+                [
+                    {
+                        "mission_id": index // TARGETS_PER_MISSION + 1,
+                        "name": f"{rng.choice(WORDS).title()} {index}",
+                        "country": rng.choice(COUNTRIES),
+                        "notes": " ".join(
+                            rng.choices(words, cum_weights=cum_weights, k=12)
+                        ),
+                        "complete": False,
+                    }
+                    for index in range(
+                        start, min(start + BATCH_SIZE, missions * TARGETS_PER_MISSION)
+                    )
+                ],
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--targets", type=int, default=200_000)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    with benchmark_client() as (client, engine):
+        start = time.perf_counter()
+        populate(engine, args.targets, rng)
+        print(f"indexed {args.targets} targets in {time.perf_counter() - start:.1f} s")
+        scenarios = {
+            "single term": lambda: {"q": rng.choice(WORDS)},
+            "two terms": lambda: {"q": " ".join(rng.sample(WORDS, 2))},
+            "prefix": lambda: {"q": rng.choice(WORDS)[:4] + "*"},
+            "two terms + country": lambda: {
+                "q": " ".join(rng.sample(WORDS, 2)),
+                "country": rng.choice(COUNTRIES),
+            },
+            "no match": lambda: {"q": "zeppelin"},
+        }
+        for label, params in scenarios.items():
+            latencies = []
+            for _ in range(args.requests):
+                start = time.perf_counter()
+                response = client.get("/targets/search", params=params())
+                latencies.append(time.perf_counter() - start)
+                response.raise_for_status()
+            stats = summarize(latencies)
+            print(
+                f"{label:<24} p50 {stats['p50_ms']:8.2f} ms  p99 {stats['p99_ms']:8.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""CPU cost of the list/export serialization paths at 10k missions.
+
+Compares the previous path (ORM entities with ``selectinload``, validated
+into the Pydantic response models and dumped by the stdlib ``json``, as
+FastAPI does for a ``response_model``) with the current one (column rows
+turned into dicts and dumped by orjson), for every page of ``GET /missions/``
+and for the full ``/missions/export`` stream. Reports the best CPU time of
+``--rounds`` runs per path. Usage:
+
+    python -m benchmarks.serialization [--missions 10000] [--rounds 5]
+"""
+
+import argparse
+import json
+import time
+from typing import List
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+
+import config
+import services.mission_service as crud
+from benchmarks.common import benchmark_client
+from benchmarks.dataset import seed
+from db.models import Mission
+from db.schemas import Mission as MissionSchema
+from routers.serialization import json_lines, json_response
+
+MISSION_LIST = TypeAdapter(List[MissionSchema])
+
+
+def orm_pages(db: Session, limit: int):
+    cursor = None
+    while True:
+        query = (
+            select(Mission).order_by(Mission.id).options(selectinload(Mission.targets))
+        )
+        if cursor is not None:
+            query = query.where(Mission.id > cursor)
+        missions, cursor = crud.paginate(
+            db.execute(query.limit(limit + 1)).scalars().all(), limit
+        )
+        yield missions
+        if cursor is None:
+            return
+
+
+def list_before(db: Session, limit: int) -> int:
+    size = 0
+    for missions in orm_pages(db, limit):
+        content = MISSION_LIST.dump_python(
+            MISSION_LIST.validate_python(missions, from_attributes=True), mode="json"
+        )
+        # What starlette's JSONResponse.render does.
+        body = json.dumps(
+            content, ensure_ascii=False, allow_nan=False, separators=(",", ":")
+        )
+        size += len(body.encode())
+    return size
+
+
+def list_after(db: Session, limit: int) -> int:
+    size, cursor = 0, None
+    while True:
+        missions, cursor = crud.list_missions(db, limit, cursor)
+        size += len(json_response(missions).body)
+        if cursor is None:
+            return size
+
+
+def export_before(db: Session) -> int:
+    query = (
+        select(Mission)
+        .options(selectinload(Mission.targets))
+        .order_by(Mission.id)
+        .execution_options(yield_per=config.EXPORT_BATCH_SIZE)
+    )
+    return sum(
+        len(MissionSchema.model_validate(mission).model_dump_json().encode())
+        for mission in db.execute(query).scalars()
+    )
+
+
+def export_after(db: Session) -> int:
+    return sum(len(line) for line in json_lines(crud.iter_missions(db)))
+
+
+def best_cpu(engine, run, rounds: int):
+    best, size = None, 0
+    for _ in range(rounds):
+        with Session(engine) as db:
+            start = time.process_time()
+            size = run(db)
+            elapsed = time.process_time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--missions", type=int, default=10_000)
+    parser.add_argument("--cats", type=int, default=1000)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--limit", type=int, default=config.MAX_PAGE_SIZE)
+    args = parser.parse_args()
+
+    with benchmark_client() as (client, engine):
+        seed(client, args.cats, args.missions)
+        scenarios = {
+            f"GET /missions/ (limit={args.limit})": (
+                lambda db: list_before(db, args.limit),
+                lambda db: list_after(db, args.limit),
+            ),
+            "GET /missions/export": (export_before, export_after),
+        }
+        print(f"{args.missions} missions, best CPU time of {args.rounds} rounds")
+        for label, (before, after) in scenarios.items():
+            old, old_size = best_cpu(engine, before, args.rounds)
+            new, new_size = best_cpu(engine, after, args.rounds)
+            assert old_size == new_size, (old_size, new_size)
+            print(
+                f"{label:<32} before {old * 1000:8.1f} ms  after {new * 1000:8.1f} ms"
+                f"  saved {(old - new) / old * 100:5.1f}%  ({new_size} bytes)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Concurrent write throughput of a bare SQLite engine vs create_db_engine.
+
+Each thread commits small transactions through its own session, the way the
+services do per request. Usage:
+
+    python -m benchmarks.sqlite_concurrency [--threads 16] [--writes 200]
+"""
+
+import argparse
+import tempfile
+import threading
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from db.database import Base, create_db_engine
+from db.models import SpyCat
+
+
+def run(engine, threads: int, writes: int):
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    errors = []
+
+    def worker(n):
+        for i in range(writes):
+            db = SessionLocal()
+            try:
+                db.add(
+                    SpyCat(
+                        name=f"Cat {n}-{i}",
+                        years_of_experience=1,
+                        breed="Bengal",
+                        salary=1000,
+                    )
+                )
+                db.commit()
+            except OperationalError as e:
+                db.rollback()
+                errors.append(e)
+            finally:
+                db.close()
+
+    pool = [threading.Thread(target=worker, args=(n,)) for n in range(threads)]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    engine.dispose()
+    committed = threads * writes - len(errors)
+    return committed / elapsed, len(errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--writes", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bare = create_engine(
+            f"sqlite:///{tmp}/bare.db", connect_args={"check_same_thread": False}
+        )
+        tuned = create_db_engine(f"sqlite:///{tmp}/tuned.db")
+        for label, engine in (("bare engine", bare), ("create_db_engine", tuned)):
+            rate, errors = run(engine, args.threads, args.writes)
+            print(f"{label:<20} {rate:10.1f} commits/s  {errors:6d} errors")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Cold-start time of a worker: importing the app, startup, first request.
+
+Each run is a fresh interpreter so import caches do not carry over. The
+first run against an empty database file creates the schema; the following
+ones take the "schema already current" path. Usage:
+
+    python -m benchmarks.startup [--runs 5]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from statistics import median
+
+from benchmarks.report import save_results
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BREEDS_FIXTURE = os.path.join(ROOT, "tests", "data", "breeds.json")
+
+# Runs in the child interpreter and prints its timings as JSON. The test
+# client is imported before the clock starts; it is not part of a worker.
+PROBE = """
+import json, sys, time, warnings
+warnings.simplefilter("ignore")
+from fastapi.testclient import TestClient
+start = time.perf_counter()
+from main import app
+imported = time.perf_counter()
+import os
+created_on_import = os.path.exists(os.environ["DATABASE_PATH"])
+with TestClient(app) as client:
+    started = time.perf_counter()
+    client.get("/")
+    answered = time.perf_counter()
+print(json.dumps({
+    "import_seconds": imported - start,
+    "startup_seconds": started - imported,
+    "first_request_seconds": answered - started,
+    "requests_imported": "requests" in sys.modules,
+    "database_created_on_import": created_on_import,
+}))
+"""
+
+
+def write_snapshot(path: str):
+    """A fresh breed catalog snapshot, as a deployed worker finds on disk."""
+    with open(BREEDS_FIXTURE) as f:
+        # Lower-cased, as the catalog stores them.
+        breeds = sorted(breed["name"].lower() for breed in json.load(f))
+    with open(path, "w") as f:
+        json.dump({"fetched_at": time.time(), "breeds": breeds}, f)
+
+
+def measure(database_path: str) -> dict:
+    """Time one cold start of the app on ``database_path``.
+
+    The breed catalog is read from a snapshot next to the database file, so
+    no run depends on TheCatAPI.
+    """
+    snapshot = os.path.join(os.path.dirname(database_path), "breeds_snapshot.json")
+    if not os.path.exists(snapshot):
+        write_snapshot(snapshot)
+    env = dict(
+        os.environ, DATABASE_PATH=database_path, BREED_CATALOG_SNAPSHOT_PATH=snapshot
+    )
+    env.pop("DATABASE_URL", None)
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--output", help="JSON results path")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "startup.db")
+        first = measure(path)
+        warm = [measure(path) for _ in range(args.runs)]
+
+    results = {"parameters": vars(args), "empty_database": first}
+    results["current_schema"] = {
+        key: round(median(run[key] for run in warm), 4)
+        for key in ("import_seconds", "startup_seconds", "first_request_seconds")
+    }
+    for label, run in (
+        ("empty database", first),
+        ("current schema (median)", results["current_schema"]),
+    ):
+        print(
+            f"{label:<26} import {run['import_seconds'] * 1000:7.1f} ms"
+            f"  startup {run['startup_seconds'] * 1000:7.1f} ms"
+            f"  first request {run['first_request_seconds'] * 1000:7.1f} ms"
+        )
+    print(f"saved {save_results('startup', results, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Read throughput of ``serve.py`` by number of worker processes.
+
+For each worker count a fresh server is started on a throwaway SQLite file
+(breeds from a snapshot of ``tests/data/breeds.json``), seeded over HTTP and
+loaded with a read-only mix from ``--clients`` driver processes, so the
+client side is not the bottleneck. Prints requests per second and the
+speed-up over one worker; scaling is bounded by the CPUs of the machine, which
+also run the drivers. Usage:
+
+    python -m benchmarks.worker_scaling [--workers 1 2 4] [--clients 4]
+        [--concurrency 16] [--duration 10] [--output FILE]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import tempfile
+from typing import Tuple
+
+import httpx
+
+from benchmarks.load import LoadState, drive, start_server
+from benchmarks.report import save_results
+from benchmarks.dataset import seed
+
+READ_MIX = {
+    "GET /missions/{id}": 45,
+    "GET /cats/{id}": 30,
+    "GET /missions/": 15,
+    "GET /cats/": 10,
+}
+
+
+def run_driver(arguments) -> Tuple[int, int]:
+    base_url, dataset, concurrency, duration, index = arguments
+    latencies, statuses, _ = asyncio.run(
+        drive(base_url, LoadState(dataset), READ_MIX, concurrency, 0, duration, index)
+    )
+    failed = sum(
+        count
+        for counter in statuses.values()
+        for code, count in counter.items()
+        if code != "200"
+    )
+    return sum(len(values) for values in latencies.values()), failed
+
+
+def measure(workers: int, args) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        process, base_url = start_server(tmp, workers, METRICS_ENABLED="false")
+        try:
+            with httpx.Client(base_url=base_url, timeout=300) as client:
+                dataset = seed(client, args.cats, args.missions)
+            jobs = [
+                (base_url, dataset, args.concurrency, args.duration, index)
+                for index in range(args.clients)
+            ]
+            with multiprocessing.Pool(args.clients) as pool:
+                results = pool.map(run_driver, jobs)
+        finally:
+            process.terminate()
+            process.wait()
+    requests = sum(count for count, _ in results)
+    return {
+        "workers": workers,
+        "requests": requests,
+        "failed": sum(failed for _, failed in results),
+        "throughput_rps": round(requests / args.duration, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--cats", type=int, default=500)
+    parser.add_argument("--missions", type=int, default=1000)
+    parser.add_argument("--output", help="JSON results path")
+    args = parser.parse_args()
+
+    runs = [measure(workers, args) for workers in args.workers]
+    baseline = runs[0]["throughput_rps"] / runs[0]["workers"]
+    print(f"cpus {os.cpu_count()}")
+    print(f"{'workers':>7} {'req/s':>9} {'speed-up':>9} {'failed':>7}")
+    for run in runs:
+        run["speedup"] = round(run["throughput_rps"] / baseline, 2)
+        print(
+            f"{run['workers']:>7} {run['throughput_rps']:>9.1f}"
+            f" {run['speedup']:>8.2f}x {run['failed']:>7}"
+        )
+    results = {
+        "parameters": {
+            key: value for key, value in vars(args).items() if key != "output"
+        },
+        "cpus": os.cpu_count(),
+        "runs": runs,
+    }
+    print(f"saved {save_results('worker_scaling', results, args.output)}")
+
+
+if __name__ == "__main__":
+    main()
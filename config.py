@@ -0,0 +1,93 @@
+import os
+
+BREED_CATALOG_SNAPSHOT_PATH = os.getenv(
+    "BREED_CATALOG_SNAPSHOT_PATH", "./breeds_snapshot.json"
+)
+BREED_CATALOG_TTL_SECONDS = float(os.getenv("BREED_CATALOG_TTL_SECONDS", "86400"))
+BREED_CATALOG_FETCH_TIMEOUT = float(os.getenv("BREED_CATALOG_FETCH_TIMEOUT", "5"))
+
+# Mounts the asyncio/aiosqlite variants of the cats and missions routers
+# under /async so both stacks can be benchmarked side by side.
+ASYNC_API_ENABLED = os.getenv("ASYNC_API_ENABLED", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+DEFAULT_PAGE_SIZE = int(os.getenv("DEFAULT_PAGE_SIZE", "100"))
+MAX_PAGE_SIZE = int(os.getenv("MAX_PAGE_SIZE", "1000"))
+
+# Rows fetched per round trip by the streaming export endpoints.
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "1000"))
+
+MAX_BULK_MISSIONS = int(os.getenv("MAX_BULK_MISSIONS", "1000"))
+MAX_BULK_CATS = int(os.getenv("MAX_BULK_CATS", "100000"))
+
+# Idempotency-Key on POST /cats/ and POST /missions/: responses are replayed
+# for IDEMPOTENCY_KEY_TTL_SECONDS. A request still running after
+# IDEMPOTENCY_LOCK_SECONDS is presumed dead and its key can be taken over.
+# Expired keys are purged every IDEMPOTENCY_PURGE_INTERVAL_SECONDS (0 disables
+# the background job).
+IDEMPOTENCY_KEY_TTL_SECONDS = float(os.getenv("IDEMPOTENCY_KEY_TTL_SECONDS", "86400"))
+IDEMPOTENCY_LOCK_SECONDS = float(os.getenv("IDEMPOTENCY_LOCK_SECONDS", "60"))
+IDEMPOTENCY_PURGE_INTERVAL_SECONDS = float(
+    os.getenv("IDEMPOTENCY_PURGE_INTERVAL_SECONDS", "3600")
+)
+
+# Completed missions older than ARCHIVE_AFTER_DAYS are moved to the archive
+# tables every ARCHIVE_INTERVAL_SECONDS (0 disables the background job), in
+# transactions of ARCHIVE_BATCH_SIZE missions.
+ARCHIVE_AFTER_DAYS = float(os.getenv("ARCHIVE_AFTER_DAYS", "30"))
+ARCHIVE_INTERVAL_SECONDS = float(os.getenv("ARCHIVE_INTERVAL_SECONDS", "3600"))
+ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", "500"))
+
+# Complete a mission (and free its cat) once its last target is completed.
+MISSION_AUTO_COMPLETE = os.getenv("MISSION_AUTO_COMPLETE", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+)
+
+# DATABASE_PATH picks the SQLite file; DATABASE_URL overrides it entirely.
+# Resolved once, so every worker process opens the same file whatever its
+# working directory.
+DATABASE_PATH = os.path.abspath(os.getenv("DATABASE_PATH", "spy_cats.db"))
+DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{DATABASE_PATH}")
+# Derived from DATABASE_URL (sqlite -> aiosqlite, postgresql -> asyncpg)
+# unless set explicitly.
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL")
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+
+# Applied to every new SQLite connection. WAL lets readers run alongside the
+# single writer, and NORMAL synchronous is durable in WAL mode except for the
+# last commits on power loss.
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+# Negative values are KiB, as in PRAGMA cache_size.
+SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", "-65536"))
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+
+# Read-through cache for GET /cats/{id} and GET /missions/{id}: "memory"
+# (per-process LRU), "redis" (needs the redis package) or "none".
+RESPONSE_CACHE_BACKEND = os.getenv("RESPONSE_CACHE_BACKEND", "memory")
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "30"))
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "10000"))
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+# With several worker processes each keeps its own memory cache; a shared
+# stamp file (set by serve.py) carries invalidations between them.
+RESPONSE_CACHE_STAMP_PATH = os.getenv("RESPONSE_CACHE_STAMP_PATH")
+RESPONSE_CACHE_STAMP_SLOTS = int(os.getenv("RESPONSE_CACHE_STAMP_SLOTS", "65536"))
+
+# Request latency, per-request SQL and external call metrics, served in the
+# Prometheus text format at /metrics.
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() in ("1", "true", "yes")
+
+# Change feed at /events. Long polls and SSE streams are woken in-process when
+# a transaction that wrote events commits, and re-query the database at least
+# every EVENTS_POLL_INTERVAL seconds to see events written by other processes.
+EVENTS_POLL_INTERVAL = float(os.getenv("EVENTS_POLL_INTERVAL", "1"))
+EVENTS_MAX_WAIT = float(os.getenv("EVENTS_MAX_WAIT", "60"))
+EVENT_STREAM_TIMEOUT = float(os.getenv("EVENT_STREAM_TIMEOUT", "300"))
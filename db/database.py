@@ -1,17 +1,98 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
+import config
+from services.metrics import instrument_engine
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./spy_cats.db"
+SQLALCHEMY_DATABASE_URL = config.DATABASE_URL
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+
+def to_async_url(url: str) -> str:
+    parsed = make_url(url)
+    return parsed.set(
+        drivername=ASYNC_DRIVERS.get(parsed.get_backend_name(), parsed.drivername)
+    ).render_as_string(hide_password=False)
+
+
+SQLALCHEMY_ASYNC_DATABASE_URL = config.ASYNC_DATABASE_URL or to_async_url(
+    SQLALCHEMY_DATABASE_URL
 )
+
+
+def is_sqlite_memory(url) -> bool:
+    return url.database in (None, "", ":memory:") or "mode=memory" in str(url)
+
+
+def set_sqlite_pragmas(dbapi_connection, connection_record):
+    cursor = dbapi_connection.cursor()
+    cursor.execute(f"PRAGMA journal_mode={config.SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={config.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA busy_timeout={config.SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.execute(f"PRAGMA cache_size={config.SQLITE_CACHE_SIZE}")
+    cursor.execute(f"PRAGMA mmap_size={config.SQLITE_MMAP_SIZE}")
+    cursor.close()
+
+
+POOL_SIZING_OPTIONS = ("pool_size", "max_overflow", "pool_timeout")
+
+
+def engine_options(url, **overrides) -> dict:
+    """Pool and driver options for a sync or async engine on ``url``.
+
+    Sizing options are dropped when the caller picks its own ``poolclass``,
+    since pools such as NullPool do not accept them.
+    """
+    options = _default_engine_options(make_url(url))
+    if "poolclass" in overrides:
+        for key in POOL_SIZING_OPTIONS:
+            options.pop(key, None)
+    options.update(overrides)
+    return options
+
+
+def _default_engine_options(url) -> dict:
+    if url.get_backend_name() == "sqlite":
+        options = {"connect_args": {"check_same_thread": False}}
+        if is_sqlite_memory(url):
+            # In-memory databases live inside one connection. SQLAlchemy's
+            # default for them keeps one connection per thread, so share a
+            # single connection instead and every session sees the same data.
+            options["poolclass"] = StaticPool
+            return options
+    else:
+        options = {"pool_pre_ping": True}
+    options.update(
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_timeout=config.DB_POOL_TIMEOUT,
+    )
+    return options
+
+
+def create_db_engine(url: str = SQLALCHEMY_DATABASE_URL, **kwargs):
+    """Build an engine for ``url`` with pooling and, on SQLite, tuning pragmas."""
+    engine = create_engine(url, **engine_options(url, **kwargs))
+    if engine.dialect.name == "sqlite" and not is_sqlite_memory(engine.url):
+        event.listen(engine, "connect", set_sqlite_pragmas)
+    instrument_engine(engine)
+    return engine
+
+
+engine = create_db_engine()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+# The async engine is only built when the async API is used, so aiosqlite
+# stays an optional dependency of the sync stack.
+async_engine = None
+AsyncSessionLocal = None
+
 
 def get_db():
     db = SessionLocal()
@@ -19,3 +100,34 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def create_async_db_engine(url: str = SQLALCHEMY_ASYNC_DATABASE_URL, **kwargs):
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    options = engine_options(url, **kwargs)
+    if make_url(url).get_backend_name() == "sqlite":
+        # aiosqlite connections already run on their own thread.
+        options.pop("connect_args", None)
+    async_engine = create_async_engine(url, **options)
+    if async_engine.dialect.name == "sqlite" and not is_sqlite_memory(async_engine.url):
+        event.listen(async_engine.sync_engine, "connect", set_sqlite_pragmas)
+    instrument_engine(async_engine.sync_engine)
+    return async_engine
+
+
+def get_async_sessionmaker():
+    global async_engine, AsyncSessionLocal
+    if AsyncSessionLocal is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+
+        async_engine = create_async_db_engine()
+        AsyncSessionLocal = async_sessionmaker(
+            async_engine, autoflush=False, expire_on_commit=False
+        )
+    return AsyncSessionLocal
+
+
+async def get_async_db():
+    async with get_async_sessionmaker()() as db:
+        yield db
@@ -0,0 +1,291 @@
+"""Bring an existing database up to date with ``db.models``.
+
+``Base.metadata.create_all`` only creates missing tables, so databases created
+by older versions never receive columns or indexes added to existing tables
+later. The upgrade here is idempotent and runs at startup; it can also be run
+by hand:
+
+    python -m db.migrations [DATABASE_URL]
+
+A finished upgrade records ``SCHEMA_VERSION`` in the ``schema_version``
+table, and later startups that find it there skip the DDL and inspection
+entirely. Bump ``SCHEMA_VERSION`` with every change to ``db.models`` or to
+the DDL below.
+"""
+
+import sys
+
+from sqlalchemy import (
+    Column,
+    Integer,
+    MetaData,
+    Table,
+    delete,
+    func,
+    insert,
+    inspect,
+    select,
+    text,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.schema import CreateColumn, CreateTable
+
+import db.models  # noqa: F401  (registers the models on Base.metadata)
+from db.database import Base, create_db_engine
+from db.models import Event, Mission, Target
+
+SCHEMA_VERSION = 5
+
+# Kept out of Base.metadata: it describes the schema, it is not part of it.
+schema_version = Table(
+    "schema_version", MetaData(), Column("version", Integer, nullable=False)
+)
+
+
+class MigrationError(Exception):
+    pass
+
+
+def stored_schema_version(conn) -> int:
+    """The version recorded by the last upgrade, 0 if there is none."""
+    if not inspect(conn).has_table(schema_version.name):
+        return 0
+    return conn.execute(select(func.max(schema_version.c.version))).scalar() or 0
+
+
+def record_schema_version(conn):
+    schema_version.create(conn, checkfirst=True)
+    conn.execute(delete(schema_version))
+    conn.execute(insert(schema_version).values(version=SCHEMA_VERSION))
+
+
+def duplicate_active_cats(conn) -> list:
+    query = (
+        select(Mission.cat_id)
+        .where(Mission.complete == False, Mission.cat_id.isnot(None))
+        .group_by(Mission.cat_id)
+        .having(func.count() > 1)
+    )
+    return conn.execute(query).scalars().all()
+
+
+def add_missing_columns(conn):
+    """ADD COLUMN for model columns the table lacks.
+
+    New columns must be nullable or carry a ``server_default`` so existing
+    rows get a value. Returns the added columns as ``"table.column"``.
+    """
+    inspector = inspect(conn)
+    added = set()
+    for table in Base.metadata.sorted_tables:
+        existing = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing:
+                continue
+            ddl = CreateColumn(column).compile(dialect=conn.dialect)
+            conn.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {ddl}"))
+            added.add(f"{table.name}.{column.name}")
+    return added
+
+
+def backfill_target_counters(conn):
+    """Recount missions.targets_total/targets_completed from the targets."""
+    targets = select(func.count()).where(Target.mission_id == Mission.id)
+    conn.execute(
+        update(Mission)
+        .values(
+            targets_total=targets.scalar_subquery(),
+            targets_completed=targets.where(Target.complete == True).scalar_subquery(),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def backfill_completed_by(conn):
+    """Recover who completed each mission from its last completion event."""
+    last_completion = (
+        select(Event.data["cat_id"].as_integer())
+        .where(Event.type == "mission.completed", Event.entity_id == Mission.id)
+        .order_by(Event.seq.desc())
+        .limit(1)
+    )
+    conn.execute(
+        update(Mission)
+        .where(Mission.complete == True)
+        .values(completed_by=last_completion.scalar_subquery())
+        .execution_options(synchronize_session=False)
+    )
+
+
+def backfill_completed_at(conn):
+    """Date completed missions by their last completion event.
+
+    Missions completed before the event log existed count from the upgrade.
+    """
+    last_completion = (
+        select(Event.created_at)
+        .where(Event.type == "mission.completed", Event.entity_id == Mission.id)
+        .order_by(Event.seq.desc())
+        .limit(1)
+    )
+    conn.execute(
+        update(Mission)
+        .where(Mission.complete == True)
+        .values(
+            completed_at=func.coalesce(
+                last_completion.scalar_subquery(), func.current_timestamp()
+            )
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+def enable_autoincrement(conn):
+    """Rebuild SQLite tables whose model asks for AUTOINCREMENT but lack it.
+
+    Without it SQLite hands out max(id) + 1, reusing the ids of rows removed
+    from the top of the table, which archived missions must keep. The copy
+    keeps every id; indexes and triggers go with the old table and are
+    recreated by the rest of the upgrade.
+    """
+    if conn.dialect.name != "sqlite":
+        return
+    for table in Base.metadata.sorted_tables:
+        if not table.dialect_options["sqlite"]["autoincrement"]:
+            continue
+        sql = conn.execute(
+            text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": table.name},
+        ).scalar()
+        if "AUTOINCREMENT" in sql.upper():
+            continue
+        columns = ", ".join(column.name for column in table.columns)
+        # Keep references to the table from other tables pointing at its name.
+        conn.execute(text("PRAGMA legacy_alter_table = ON"))
+        conn.execute(text(f"ALTER TABLE {table.name} RENAME TO _{table.name}_old"))
+        conn.execute(CreateTable(table))
+        conn.execute(
+            text(
+                f"INSERT INTO {table.name} ({columns})"
+                f" SELECT {columns} FROM _{table.name}_old"
+            )
+        )
+        conn.execute(text(f"DROP TABLE _{table.name}_old"))
+        conn.execute(text("PRAGMA legacy_alter_table = OFF"))
+
+
+def create_missing_indexes(conn):
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            try:
+                index.create(conn, checkfirst=True)
+            except IntegrityError as e:
+                raise MigrationError(
+                    f"Cannot create unique index {index.name}: cats "
+                    f"{duplicate_active_cats(conn)} have more than one active "
+                    "mission. Complete or unassign the extra missions and retry."
+                ) from e
+
+
+TARGETS_FTS = "targets_fts"
+
+# External-content FTS5 index over targets: the text lives only in
+# ``targets`` and the triggers keep the index in step with every INSERT,
+# DELETE and text UPDATE, whether it comes from the ORM or a Core statement.
+# ``prefix`` adds 2- and 3-character prefix indexes so ``term*`` queries
+# don't scan the whole vocabulary.
+TARGETS_FTS_DDL = (
+    f"""CREATE VIRTUAL TABLE {TARGETS_FTS} USING fts5(
+        name, country, notes,
+        content='targets', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS targets_fts_insert AFTER INSERT ON targets
+    BEGIN
+        INSERT INTO {TARGETS_FTS}(rowid, name, country, notes)
+        VALUES (new.id, new.name, new.country, new.notes);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS targets_fts_delete AFTER DELETE ON targets
+    BEGIN
+        INSERT INTO {TARGETS_FTS}({TARGETS_FTS}, rowid, name, country, notes)
+        VALUES ('delete', old.id, old.name, old.country, old.notes);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS targets_fts_update
+    AFTER UPDATE OF name, country, notes ON targets
+    BEGIN
+        INSERT INTO {TARGETS_FTS}({TARGETS_FTS}, rowid, name, country, notes)
+        VALUES ('delete', old.id, old.name, old.country, old.notes);
+        INSERT INTO {TARGETS_FTS}(rowid, name, country, notes)
+        VALUES (new.id, new.name, new.country, new.notes);
+    END""",
+)
+
+
+def fts5_available(conn) -> bool:
+    if conn.dialect.name != "sqlite":
+        return False
+    return bool(
+        conn.execute(text("SELECT sqlite_compileoption_used('ENABLE_FTS5')")).scalar()
+    )
+
+
+def has_search_index(conn) -> bool:
+    if conn.dialect.name != "sqlite":
+        return False
+    return bool(
+        conn.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": TARGETS_FTS},
+        ).first()
+    )
+
+
+def create_search_index(conn):
+    """Create the targets FTS5 index and its triggers (SQLite only).
+
+    A newly created index is filled from the existing targets. Other
+    backends, and SQLite builds without FTS5, are left alone;
+    ``GET /targets/search`` reports itself unavailable there.
+    """
+    if not fts5_available(conn):
+        return
+    statements = TARGETS_FTS_DDL
+    if has_search_index(conn):
+        statements = statements[1:]
+    for statement in statements:
+        conn.execute(text(statement))
+    if statements is TARGETS_FTS_DDL:
+        conn.execute(
+            text(f"INSERT INTO {TARGETS_FTS}({TARGETS_FTS}) VALUES ('rebuild')")
+        )
+
+
+def upgrade(engine) -> bool:
+    """Bring the schema to ``SCHEMA_VERSION``; returns False if it already was.
+
+    Databases written by a newer release are left alone as well.
+    """
+    with engine.connect() as conn:
+        if stored_schema_version(conn) >= SCHEMA_VERSION:
+            return False
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        added = add_missing_columns(conn)
+        if "missions.targets_total" in added:
+            backfill_target_counters(conn)
+        if "missions.completed_by" in added:
+            backfill_completed_by(conn)
+        if "missions.completed_at" in added:
+            backfill_completed_at(conn)
+        enable_autoincrement(conn)
+        create_missing_indexes(conn)
+        create_search_index(conn)
+        record_schema_version(conn)
+    return True
+
+
+if __name__ == "__main__":
+    target = create_db_engine(*sys.argv[1:2])
+    upgrade(target)
+    print(f"Upgraded {target.url.render_as_string()}")
@@ -1,4 +1,18 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, ForeignKey, Text
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Float,
+    Boolean,
+    DateTime,
+    ForeignKey,
+    Index,
+    JSON,
+    LargeBinary,
+    Text,
+    and_,
+    func,
+)
 from sqlalchemy.orm import relationship
 from db.database import Base
 
@@ -11,9 +25,21 @@ class SpyCat(Base):
     years_of_experience = Column(Integer, nullable=False)
     breed = Column(String, nullable=False)
     salary = Column(Float, nullable=False)
+    # Bumped by the ORM on every UPDATE (and checked in its WHERE clause);
+    # the source of the resource's ETag.
+    version = Column(Integer, nullable=False, server_default="1")
 
     missions = relationship("Mission", back_populates="cat")
 
+    __table_args__ = (
+        # Covers the per-breed salary aggregates in services/analytics_service.
+        Index("ix_spy_cats_breed_salary", "breed", "salary"),
+        # Missions and events keep the ids of deleted cats (completed_by,
+        # entity_id), so a new cat must never get one of them.
+        {"sqlite_autoincrement": True},
+    )
+    __mapper_args__ = {"version_id_col": version}
+
 
 class Mission(Base):
     __tablename__ = "missions"
@@ -21,21 +47,131 @@ class Mission(Base):
     id = Column(Integer, primary_key=True, index=True)
     cat_id = Column(Integer, ForeignKey("spy_cats.id"), nullable=True)
     complete = Column(Boolean, default=False, nullable=False)
+    version = Column(Integer, nullable=False, server_default="1")
+    # Maintained by mission_service so progress never needs the targets table.
+    targets_total = Column(Integer, nullable=False, server_default="0")
+    targets_completed = Column(Integer, nullable=False, server_default="0")
+    # Completing a mission frees its cat (cat_id becomes NULL); the cat that
+    # completed it is kept here for the analytics. No foreign key: the
+    # record outlives the cat.
+    completed_by = Column(Integer, nullable=True)
+    # When the mission was (last) completed; drives archival.
+    completed_at = Column(DateTime, nullable=True)
 
     cat = relationship("SpyCat", back_populates="missions")
     targets = relationship(
         "Target", back_populates="mission", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        # Serves the "does this cat already have an active mission" lookups.
+        Index("ix_missions_cat_id_complete", "cat_id", "complete"),
+        Index("ix_missions_completed_by", "completed_by"),
+        Index("ix_missions_completed_at", "completed_at"),
+        # At most one active mission per cat, enforced by the database.
+        Index(
+            "uq_missions_active_cat",
+            "cat_id",
+            unique=True,
+            sqlite_where=and_(complete == False, cat_id.isnot(None)),
+            postgresql_where=and_(complete == False, cat_id.isnot(None)),
+        ),
+        # Ids are never reused, so an archived mission's id stays its own.
+        {"sqlite_autoincrement": True},
+    )
+    __mapper_args__ = {"version_id_col": version}
+
 
 class Target(Base):
     __tablename__ = "targets"
 
     id = Column(Integer, primary_key=True, index=True)
-    mission_id = Column(Integer, ForeignKey("missions.id"), nullable=False)
+    mission_id = Column(Integer, ForeignKey("missions.id"), nullable=False, index=True)
     name = Column(String, nullable=False)
     country = Column(String, nullable=False)
     notes = Column(Text, default="")
     complete = Column(Boolean, default=False, nullable=False)
+    version = Column(Integer, nullable=False, server_default="1")
 
     mission = relationship("Mission", back_populates="targets")
+
+    __table_args__ = {"sqlite_autoincrement": True}
+    __mapper_args__ = {"version_id_col": version}
+
+
+class Event(Base):
+    """Append-only change log, written in the transaction of each mutation.
+
+    ``seq`` only ever grows (AUTOINCREMENT never reuses values), so consumers
+    resume from the last sequence number they processed.
+    """
+
+    __tablename__ = "events"
+
+    seq = Column(Integer, primary_key=True)
+    type = Column(String, nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    data = Column(JSON, nullable=False, default=dict)
+    created_at = Column(DateTime, nullable=False, server_default=func.now())
+
+    __table_args__ = (
+        # An entity's history, e.g. a cat's salary changes.
+        Index("ix_events_entity_id_type", "entity_id", "type"),
+        {"sqlite_autoincrement": True},
+    )
+
+
+class ArchivedMission(Base):
+    """A completed mission moved out of ``missions`` by services/archive_service.
+
+    Same columns and ids as ``missions``; archived missions are read-only.
+    """
+
+    __tablename__ = "archived_missions"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    cat_id = Column(Integer, nullable=True)
+    complete = Column(Boolean, nullable=False)
+    version = Column(Integer, nullable=False)
+    targets_total = Column(Integer, nullable=False)
+    targets_completed = Column(Integer, nullable=False)
+    completed_by = Column(Integer, nullable=True, index=True)
+    completed_at = Column(DateTime, nullable=True)
+    archived_at = Column(DateTime, nullable=False, server_default=func.now())
+
+    targets = relationship(
+        "ArchivedTarget", back_populates="mission", order_by="ArchivedTarget.id"
+    )
+
+
+class ArchivedTarget(Base):
+    __tablename__ = "archived_targets"
+
+    id = Column(Integer, primary_key=True, autoincrement=False)
+    mission_id = Column(
+        Integer, ForeignKey("archived_missions.id"), nullable=False, index=True
+    )
+    name = Column(String, nullable=False)
+    country = Column(String, nullable=False)
+    notes = Column(Text, default="")
+    complete = Column(Boolean, nullable=False)
+    version = Column(Integer, nullable=False)
+
+    mission = relationship("ArchivedMission", back_populates="targets")
+
+
+class IdempotencyKey(Base):
+    """A client's Idempotency-Key and the response it got, until ``expires_at``.
+
+    ``status_code`` stays NULL while the first request is still running.
+    """
+
+    __tablename__ = "idempotency_keys"
+
+    scope = Column(String, primary_key=True)
+    key = Column(String, primary_key=True)
+    request_hash = Column(String(64), nullable=False)
+    status_code = Column(Integer, nullable=True)
+    body = Column(LargeBinary, nullable=True)
+    created_at = Column(DateTime, nullable=False)
+    expires_at = Column(DateTime, nullable=False, index=True)
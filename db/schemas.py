@@ -1,5 +1,7 @@
+from datetime import datetime
+
 from pydantic import BaseModel, Field, field_validator, ConfigDict
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 
 class TargetBase(BaseModel):
@@ -18,6 +20,10 @@ class TargetUpdate(BaseModel):
     complete: Optional[bool] = None
 
 
+class TargetBatchUpdate(TargetUpdate):
+    id: int
+
+
 class Target(TargetBase):
     id: int
     mission_id: int
@@ -25,6 +31,11 @@ class Target(TargetBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class TargetSearchHit(Target):
+    score: float
+    snippet: Optional[str] = None
+
+
 class SpyCatBase(BaseModel):
     name: str
     years_of_experience: int
@@ -67,6 +78,8 @@ class MissionUpdate(BaseModel):
 class Mission(MissionBase):
     id: int
     cat_id: Optional[int] = None
+    targets_total: int = 0
+    targets_completed: int = 0
     targets: List[Target] = []
 
     model_config = ConfigDict(from_attributes=True)
@@ -74,3 +87,116 @@ class Mission(MissionBase):
 
 class MissionAssign(BaseModel):
     cat_id: int
+
+
+class ScheduleRequest(BaseModel):
+    policy: str = "fifo"
+    dry_run: bool = False
+    # Assign at most this many missions; all that can be matched by default.
+    limit: Optional[int] = Field(None, ge=1)
+
+
+class ScheduledAssignment(BaseModel):
+    mission_id: int
+    cat_id: int
+
+
+class ScheduleResult(BaseModel):
+    policy: str
+    dry_run: bool
+    idle_cats: int
+    missions_considered: int
+    assignments: List[ScheduledAssignment]
+    timings: Dict[str, float]
+
+
+class CatMissionSummary(BaseModel):
+    cat_id: int
+    active_missions: int
+    targets_total: int
+    targets_completed: int
+
+
+class MissionSummary(BaseModel):
+    total: int
+    active: int
+    complete: int
+    unassigned_active: int
+    targets_total: int
+    targets_completed: int
+    per_cat: List[CatMissionSummary]
+
+
+class PayrollSummary(BaseModel):
+    cats: int
+    total_salary: float
+    average_salary: Optional[float] = None
+    min_salary: Optional[float] = None
+    max_salary: Optional[float] = None
+    deployed_cats: int
+    deployed_salary: float
+    idle_cats: int
+    idle_salary: float
+    completed_missions: int
+    cost_per_completed_mission: Optional[float] = None
+
+
+class BreedSummary(BaseModel):
+    breed: str
+    cats: int
+    total_salary: float
+    average_salary: float
+    min_salary: float
+    max_salary: float
+    completed_missions: int
+    active_missions: int
+    cost_per_completed_mission: Optional[float] = None
+
+
+class CatMissionRecord(BaseModel):
+    id: int
+    complete: bool
+    targets_total: int
+    targets_completed: int
+    archived: bool = False
+
+
+class SalaryChange(BaseModel):
+    seq: int
+    at: datetime
+    salary: Optional[float] = None
+
+
+class CatHistory(BaseModel):
+    id: int
+    name: str
+    breed: str
+    years_of_experience: int
+    salary: float
+    missions_total: int
+    missions_completed: int
+    targets_total: int
+    targets_completed: int
+    cost_per_completed_mission: Optional[float] = None
+    missions: List[CatMissionRecord]
+    salary_history: List[SalaryChange]
+
+
+class BulkItemResult(BaseModel):
+    index: int
+    id: Optional[int] = None
+    errors: List[Dict[str, Any]] = []
+
+
+class BulkResult(BaseModel):
+    created: int
+    failed: int
+    results: List[BulkItemResult]
+
+
+class Event(BaseModel):
+    seq: int
+    type: str
+    entity_id: int
+    data: Dict[str, Any]
+    created_at: datetime
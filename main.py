@@ -1,18 +1,63 @@
-from fastapi import FastAPI, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from typing import List
-import requests
+import asyncio
+from contextlib import asynccontextmanager
 
-from db.models import Base
-from db.database import engine, get_db
-from routers import cats, missions
+from fastapi import FastAPI
 
+import config
+from db.database import engine
+from db.migrations import upgrade
+from routers import analytics, cats, events, missions, targets
+import services.idempotency as idempotency
+from services.archive_service import archive_periodically
+from services.breed_catalog import catalog
+from services.maintenance import run_periodically
+from services.response_cache import response_cache
 
-Base.metadata.create_all(bind=engine)
 
-app = FastAPI(title="Spy Cat Agency API", version="1.0.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Schema work happens here rather than at import, so importing the app
+    # (tests, tooling) never touches the database; once the schema version
+    # is current, upgrade() is a quick lookup.
+    upgrade(engine)
+    catalog.load()
+    tasks = []
+    if config.ARCHIVE_INTERVAL_SECONDS > 0:
+        tasks.append(
+            asyncio.create_task(archive_periodically(config.ARCHIVE_INTERVAL_SECONDS))
+        )
+    if config.IDEMPOTENCY_PURGE_INTERVAL_SECONDS > 0:
+        tasks.append(
+            asyncio.create_task(
+                run_periodically(
+                    config.IDEMPOTENCY_PURGE_INTERVAL_SECONDS, idempotency.run_purge
+                )
+            )
+        )
+    yield
+    for task in tasks:
+        task.cancel()
+
+
+app = FastAPI(title="Spy Cat Agency API", version="1.0.0", lifespan=lifespan)
 app.include_router(cats.router)
 app.include_router(missions.router)
+app.include_router(targets.router)
+app.include_router(events.router)
+app.include_router(analytics.router)
+
+if config.METRICS_ENABLED:
+    from routers.metrics import MetricsMiddleware
+    from routers.metrics import router as metrics_router
+
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics_router)
+
+if config.ASYNC_API_ENABLED:
+    from routers import async_cats, async_missions
+
+    app.include_router(async_cats.router)
+    app.include_router(async_missions.router)
 
 
 @app.get("/")
@@ -22,3 +67,11 @@ def root():
         "docs": "/docs",
         "version": "1.0.0",
     }
+
+
+@app.get("/stats")
+def stats():
+    return {
+        "breed_catalog": catalog.stats(),
+        "response_cache": response_cache.stats(),
+    }
@@ -0,0 +1,31 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from db.database import get_db
+from db.schemas import BreedSummary, CatHistory, PayrollSummary
+import services.analytics_service as analytics
+
+router = APIRouter(prefix="/analytics", tags=["analytics"])
+
+
+@router.get("/payroll", response_model=PayrollSummary)
+def payroll(db: Session = Depends(get_db)):
+    return analytics.payroll(db)
+
+
+@router.get("/breeds", response_model=List[BreedSummary])
+def breed_summaries(db: Session = Depends(get_db)):
+    return analytics.breed_summaries(db)
+
+
+@router.get("/cats/{cat_id}/history", response_model=CatHistory)
+def cat_history(cat_id: int, db: Session = Depends(get_db)):
+    history = analytics.cat_history(db, cat_id)
+    if history is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Spy cat with id {cat_id} not found",
+        )
+    return history
@@ -0,0 +1,131 @@
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+
+from db.schemas import SpyCat, SpyCatCreate, SpyCatUpdate
+from db.database import get_async_db
+import services.async_cats_service as crud
+import services.cats_service as cats_service
+from routers.caching import acached_json_response
+from routers.idempotency import aidempotent_create
+from routers.pagination import page_limit, set_next_cursor
+from routers.serialization import json_response
+from services.breed_catalog import BreedCatalogUnavailable, catalog
+from services.etags import spy_cat_etag
+from services.metrics import BREED_VALIDATION_DURATION, timed
+
+router = APIRouter(prefix="/async/cats", tags=["cats (async)"])
+
+
+async def validate_breed(breed: str) -> bool:
+    try:
+        with timed(BREED_VALIDATION_DURATION):
+            return await catalog.acontains(breed)
+    except BreedCatalogUnavailable as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Unable to validate breed with TheCatAPI: {str(e)}",
+        )
+
+
+@router.post("/", response_model=SpyCat, status_code=status.HTTP_201_CREATED)
+async def create_spy_cat(
+    cat: SpyCatCreate,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
+    db: AsyncSession = Depends(get_async_db),
+):
+    async def check_breed():
+        if not await validate_breed(cat.breed):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid breed: {cat.breed}. Please use a valid breed from TheCatAPI.",
+            )
+
+    return await aidempotent_create(
+        db,
+        "POST /cats/",
+        idempotency_key,
+        cat,
+        lambda session: cats_service.add_spy_cat(session, cat),
+        serialize_spy_cat,
+        check_breed,
+    )
+
+
+@router.get("/", response_model=List[SpyCat])
+async def list_spy_cats(
+    request: Request,
+    limit: int = Depends(page_limit),
+    cursor: Optional[int] = None,
+    breed: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    cats, next_cursor = await crud.list_spy_cats(db, limit, cursor, breed)
+    response = json_response(cats)
+    set_next_cursor(request, response, next_cursor)
+    return response
+
+
+def serialize_spy_cat(cat) -> bytes:
+    return SpyCat.model_validate(cat).model_dump_json().encode()
+
+
+@router.get("/{cat_id}", response_model=SpyCat)
+async def get_spy_cat(
+    cat_id: int,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    response = await acached_json_response(
+        "cat",
+        cat_id,
+        lambda: crud.get_spy_cat(db, cat_id),
+        serialize_spy_cat,
+        spy_cat_etag,
+        if_none_match,
+    )
+    if response is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Spy cat with id {cat_id} not found",
+        )
+    return response
+
+
+@router.patch("/{cat_id}", response_model=SpyCat)
+async def update_spy_cat(
+    cat_id: int,
+    cat_update: SpyCatUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    cat = await crud.update_spy_cat(db, cat_id, cat_update, if_match)
+    if not cat:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Spy cat with id {cat_id} not found",
+        )
+    if cat == "version_conflict":
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=f"Spy cat with id {cat_id} has been modified",
+        )
+    if cat == "conflict":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Spy cat with id {cat_id} was modified concurrently; retry",
+        )
+    response.headers["ETag"] = spy_cat_etag(cat)
+    return cat
+
+
+@router.delete("/{cat_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_spy_cat(cat_id: int, db: AsyncSession = Depends(get_async_db)):
+    ok = await crud.delete_spy_cat(db, cat_id)
+    if not ok:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Spy cat with id {cat_id} not found",
+        )
+    return None
@@ -0,0 +1,285 @@
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+
+from db.schemas import (
+    Mission,
+    MissionAssign,
+    MissionCreate,
+    MissionSummary,
+    MissionUpdate,
+    ScheduleRequest,
+    ScheduleResult,
+    Target,
+    TargetBatchUpdate,
+    TargetUpdate,
+)
+from db.database import get_async_db
+import services.async_mission_service as crud
+import services.mission_service as mission_service
+from services.scheduler import POLICIES
+from routers.caching import acached_json_response
+from routers.idempotency import aidempotent_create
+from routers.pagination import page_limit, set_next_cursor
+from routers.serialization import json_response
+from services.etags import mission_etag, target_etag
+
+router = APIRouter(prefix="/async/missions", tags=["missions (async)"])
+
+
+@router.post("/", response_model=Mission, status_code=status.HTTP_201_CREATED)
+async def create_mission(
+    mission: MissionCreate,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
+    db: AsyncSession = Depends(get_async_db),
+):
+    return await aidempotent_create(
+        db,
+        "POST /missions/",
+        idempotency_key,
+        mission,
+        lambda session: mission_service.add_mission(session, mission),
+        serialize_mission,
+    )
+
+
+@router.post("/schedule", response_model=ScheduleResult)
+async def schedule_missions(
+    request: ScheduleRequest, db: AsyncSession = Depends(get_async_db)
+):
+    result = await crud.schedule_missions(
+        db, request.policy, request.dry_run, request.limit
+    )
+    if result == "unknown_policy":
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown policy {request.policy!r}; "
+            f"expected one of {sorted(POLICIES)}",
+        )
+    if result == "conflict":
+        raise HTTPException(
+            status_code=409,
+            detail="Missions or cats were assigned concurrently; retry",
+        )
+    return json_response(result)
+
+
+@router.get("/", response_model=List[Mission])
+async def list_missions(
+    request: Request,
+    limit: int = Depends(page_limit),
+    cursor: Optional[int] = None,
+    complete: Optional[bool] = None,
+    cat_id: Optional[int] = None,
+    breed: Optional[str] = None,
+    country: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    missions, next_cursor = await crud.list_missions(
+        db,
+        limit,
+        cursor,
+        complete=complete,
+        cat_id=cat_id,
+        breed=breed,
+        country=country,
+    )
+    response = json_response(missions)
+    set_next_cursor(request, response, next_cursor)
+    return response
+
+
+@router.get("/summary", response_model=MissionSummary)
+async def mission_summary(db: AsyncSession = Depends(get_async_db)):
+    return await crud.mission_summary(db)
+
+
+def serialize_mission(mission) -> bytes:
+    return Mission.model_validate(mission).model_dump_json().encode()
+
+
+@router.get("/{mission_id}", response_model=Mission)
+async def get_mission(
+    mission_id: int,
+    if_none_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    response = await acached_json_response(
+        "mission",
+        mission_id,
+        lambda: crud.find_mission(db, mission_id),
+        serialize_mission,
+        mission_etag,
+        if_none_match,
+    )
+    if response is None:
+        raise HTTPException(
+            status_code=404, detail=f"Mission with id {mission_id} not found"
+        )
+    return response
+
+
+@router.patch("/{mission_id}", response_model=Mission)
+async def update_mission(
+    mission_id: int,
+    mission_update: MissionUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    result = await crud.update_mission(db, mission_id, mission_update, if_match)
+    if result is None:
+        raise HTTPException(
+            status_code=404, detail=f"Mission with id {mission_id} not found"
+        )
+    if result == "cat_conflict":
+        raise HTTPException(
+            status_code=400,
+            detail="Cannot reactivate mission: cat already has an active mission",
+        )
+    if result == "version_conflict":
+        raise HTTPException(
+            status_code=412, detail=f"Mission with id {mission_id} has been modified"
+        )
+    if result == "conflict":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Mission with id {mission_id} was modified concurrently; retry",
+        )
+    response.headers["ETag"] = mission_etag(result)
+    return result
+
+
+@router.delete("/{mission_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_mission(mission_id: int, db: AsyncSession = Depends(get_async_db)):
+    result = await crud.delete_mission(db, mission_id)
+    if result is None:
+        raise HTTPException(
+            status_code=404, detail=f"Mission with id {mission_id} not found"
+        )
+    if result == "assigned":
+        raise HTTPException(
+            status_code=400, detail="Cannot delete mission that is assigned to a cat"
+        )
+    return None
+
+
+@router.patch("/{mission_id}/assign", response_model=Mission)
+async def assign_cat_to_mission(
+    mission_id: int,
+    assignment: MissionAssign,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    mission, error = await crud.assign_cat_to_mission(
+        db, mission_id, assignment, if_match
+    )
+    if error == "mission_not_found":
+        raise HTTPException(
+            status_code=404, detail=f"Mission with id {mission_id} not found"
+        )
+    if error == "cat_not_found":
+        raise HTTPException(
+            status_code=404, detail=f"Spy cat with id {assignment.cat_id} not found"
+        )
+    if error == "cat_conflict":
+        raise HTTPException(
+            status_code=400,
+            detail=f"Cat {assignment.cat_id} already has an active mission",
+        )
+    if error == "version_conflict":
+        raise HTTPException(
+            status_code=412, detail=f"Mission with id {mission_id} has been modified"
+        )
+    response.headers["ETag"] = mission_etag(mission)
+    return mission
+
+
+@router.patch("/{mission_id}/targets/{target_id}", response_model=Target)
+async def update_target(
+    mission_id: int,
+    target_id: int,
+    target_update: TargetUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    target, error = await crud.update_target(
+        db, mission_id, target_id, target_update, if_match
+    )
+    if error == "mission_not_found":
+        raise HTTPException(
+            status_code=404, detail=f"Mission with id {mission_id} not found"
+        )
+    if error == "target_not_found":
+        raise HTTPException(
+            status_code=404,
+            detail=f"Target with id {target_id} not found in mission {mission_id}",
+        )
+    if error == "cannot_update_notes":
+        raise HTTPException(
+            status_code=400,
+            detail="Cannot update notes: target or mission is already completed",
+        )
+    if error == "version_conflict":
+        raise HTTPException(
+            status_code=412,
+            detail=f"Target with id {target_id} has been modified",
+        )
+    if error == "conflict":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Target with id {target_id} was modified concurrently; retry",
+        )
+    response.headers["ETag"] = target_etag(target)
+    return target
+
+
+@router.patch("/{mission_id}/targets", response_model=Mission)
+async def update_targets(
+    mission_id: int,
+    response: Response,
+    updates: List[TargetBatchUpdate] = Body(..., min_length=1),
+    if_match: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+):
+    mission, error = await crud.update_targets(db, mission_id, updates, if_match)
+    if error == "mission_not_found":
+        raise HTTPException(
+            status_code=404, detail=f"Mission with id {mission_id} not found"
+        )
+    if error == "target_not_found":
+        raise HTTPException(
+            status_code=404,
+            detail=f"Not every target belongs to mission {mission_id}",
+        )
+    if error == "duplicate_target":
+        raise HTTPException(
+            status_code=400, detail="Each target may only be updated once per request"
+        )
+    if error == "cannot_update_notes":
+        raise HTTPException(
+            status_code=400,
+            detail="Cannot update notes: target or mission is already completed",
+        )
+    if error == "version_conflict":
+        raise HTTPException(
+            status_code=412, detail=f"Mission with id {mission_id} has been modified"
+        )
+    if error == "conflict":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Mission with id {mission_id} was modified concurrently; retry",
+        )
+    response.headers["ETag"] = mission_etag(mission)
+    return mission
@@ -0,0 +1,36 @@
+from typing import Any, List, Sequence, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+# Reports are built as plain dicts: FastAPI validates them against
+# ``BulkResult`` on the way out anyway, and building 100k intermediate models
+# first would double that cost for large imports.
+
+
+def validate_items(
+    items: Sequence[Any], schema: Type[BaseModel]
+) -> Tuple[List[Tuple[int, BaseModel]], List[dict]]:
+    """Validate each item on its own so one bad item does not reject the batch.
+
+    Returns the valid ``(index, model)`` pairs and a failed result per invalid
+    item.
+    """
+    valid, failed = [], []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, schema.model_validate(item)))
+        except ValidationError as e:
+            failed.append(
+                {
+                    "index": index,
+                    "errors": e.errors(include_url=False, include_context=False),
+                }
+            )
+    return valid, failed
+
+
+def bulk_result(created: List[Tuple[int, int]], failed: List[dict]) -> dict:
+    """Merge ``(index, id)`` pairs and failures into a report in input order."""
+    results = [{"index": index, "id": id} for index, id in created] + failed
+    results.sort(key=lambda result: result["index"])
+    return {"created": len(created), "failed": len(failed), "results": results}
@@ -0,0 +1,82 @@
+from typing import Any, Awaitable, Callable, Optional
+
+from fastapi import Response, status
+
+from services.etags import etag_matches
+from services.response_cache import response_cache
+
+JSON_MEDIA_TYPE = "application/json"
+
+# Cache entries hold the ETag and the body separated by a newline, which
+# never appears in either.
+_SEPARATOR = b"\n"
+
+
+def _pack(etag: str, body: bytes) -> bytes:
+    return etag.encode() + _SEPARATOR + body
+
+
+def _unpack(entry: bytes):
+    etag, body = entry.split(_SEPARATOR, 1)
+    return etag.decode(), body
+
+
+def _respond(etag: str, body: Optional[bytes], if_none_match: Optional[str]):
+    if etag_matches(if_none_match, etag, weak=True):
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+        )
+    return Response(content=body, media_type=JSON_MEDIA_TYPE, headers={"ETag": etag})
+
+
+def cached_json_response(
+    kind: str,
+    id: int,
+    load: Callable[[], Any],
+    serialize: Callable[[Any], bytes],
+    etag: Callable[[Any], str],
+    if_none_match: Optional[str] = None,
+) -> Optional[Response]:
+    """Serve ``kind:id`` from the response cache, loading it on a miss.
+
+    ``load`` returns the ORM object, or None when it does not exist (which is
+    never cached); None is returned in that case. A matching
+    ``If-None-Match`` gets a 304 without the body being serialized.
+    """
+    entry = response_cache.get(kind, id)
+    if entry is not None:
+        tag, body = _unpack(entry)
+        return _respond(tag, body, if_none_match)
+    token = response_cache.token()
+    obj = load()
+    if obj is None:
+        return None
+    return _render(kind, id, obj, serialize, etag, if_none_match, token)
+
+
+async def acached_json_response(
+    kind: str,
+    id: int,
+    load: Callable[[], Awaitable[Any]],
+    serialize: Callable[[Any], bytes],
+    etag: Callable[[Any], str],
+    if_none_match: Optional[str] = None,
+) -> Optional[Response]:
+    entry = response_cache.get(kind, id)
+    if entry is not None:
+        tag, body = _unpack(entry)
+        return _respond(tag, body, if_none_match)
+    token = response_cache.token()
+    obj = await load()
+    if obj is None:
+        return None
+    return _render(kind, id, obj, serialize, etag, if_none_match, token)
+
+
+def _render(kind, id, obj, serialize, etag, if_none_match, token) -> Response:
+    tag = etag(obj)
+    if etag_matches(if_none_match, tag, weak=True):
+        return _respond(tag, None, if_none_match)
+    body = serialize(obj)
+    response_cache.set(kind, id, _pack(tag, body), token)
+    return _respond(tag, body, if_none_match)
@@ -1,25 +1,42 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+import csv
+import io
+
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
-from typing import List
-import requests
+from typing import Any, List, Optional
 
-from db.schemas import SpyCat, SpyCatCreate, SpyCatUpdate
+import config
+from db.schemas import BulkResult, SpyCat, SpyCatCreate, SpyCatUpdate
 from db.database import get_db
 import services.cats_service as crud
+from routers.bulk import bulk_result, validate_items
+from routers.caching import cached_json_response
+from routers.idempotency import idempotent_create
+from routers.pagination import page_limit, set_next_cursor
+from routers.serialization import json_lines, json_response
+from routers.streaming import ndjson_response
+from services.breed_catalog import BreedCatalogUnavailable, catalog
+from services.etags import spy_cat_etag
+from services.metrics import BREED_VALIDATION_DURATION, timed
 
 router = APIRouter(prefix="/cats", tags=["cats"])
 
-CAT_API_URL = "https://api.thecatapi.com/v1/breeds"
-
 
 def validate_breed(breed: str) -> bool:
     try:
-        response = requests.get(CAT_API_URL)
-        response.raise_for_status()
-        breeds = response.json()
-        valid_breeds = [b.get("name", "").lower() for b in breeds]
-        return breed.lower() in valid_breeds
-    except Exception as e:
+        with timed(BREED_VALIDATION_DURATION):
+            return catalog.contains(breed)
+    except BreedCatalogUnavailable as e:
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Unable to validate breed with TheCatAPI: {str(e)}",
@@ -27,41 +44,160 @@ def validate_breed(breed: str) -> bool:
 
 
 @router.post("/", response_model=SpyCat, status_code=status.HTTP_201_CREATED)
-def create_spy_cat(cat: SpyCatCreate, db: Session = Depends(get_db)):
-    if not validate_breed(cat.breed):
+def create_spy_cat(
+    cat: SpyCatCreate,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
+    db: Session = Depends(get_db),
+):
+    def check_breed():
+        if not validate_breed(cat.breed):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid breed: {cat.breed}. Please use a valid breed from TheCatAPI.",
+            )
+
+    return idempotent_create(
+        db,
+        "POST /cats/",
+        idempotency_key,
+        cat,
+        lambda session: crud.add_spy_cat(session, cat),
+        serialize_spy_cat,
+        check_breed,
+    )
+
+
+def _bulk_create_spy_cats(items: List[Any], db: Session) -> dict:
+    valid, failed = validate_items(items, SpyCatCreate)
+    accepted = []
+    for index, cat in valid:
+        if validate_breed(cat.breed):
+            accepted.append((index, cat))
+        else:
+            failed.append(
+                {
+                    "index": index,
+                    "errors": [
+                        {
+                            "type": "invalid_breed",
+                            "loc": ["breed"],
+                            "msg": f"Invalid breed: {cat.breed}",
+                            "input": cat.breed,
+                        }
+                    ],
+                }
+            )
+    ids = crud.bulk_create_spy_cats(db, [cat for _, cat in accepted])
+    return bulk_result([(index, id) for (index, _), id in zip(accepted, ids)], failed)
+
+
+@router.post("/bulk", response_model=BulkResult)
+def bulk_create_spy_cats(
+    cats: List[Any] = Body(..., max_length=config.MAX_BULK_CATS),
+    db: Session = Depends(get_db),
+):
+    return _bulk_create_spy_cats(cats, db)
+
+
+@router.post(
+    "/bulk/csv",
+    response_model=BulkResult,
+    openapi_extra={
+        "requestBody": {
+            "content": {"text/csv": {"schema": {"type": "string"}}},
+            "required": True,
+        }
+    },
+)
+async def bulk_create_spy_cats_csv(request: Request, db: Session = Depends(get_db)):
+    """Import cats from a CSV body with a header row naming the cat fields."""
+    body = await request.body()
+    try:
+        rows = list(csv.DictReader(io.StringIO(body.decode("utf-8-sig"))))
+    except (UnicodeDecodeError, csv.Error) as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=f"Invalid CSV: {str(e)}"
+        )
+    if len(rows) > config.MAX_BULK_CATS:
         raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail=f"Invalid breed: {cat.breed}. Please use a valid breed from TheCatAPI.",
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"At most {config.MAX_BULK_CATS} rows can be imported at once",
         )
-    return crud.create_spy_cat(db, cat)
+    return await run_in_threadpool(_bulk_create_spy_cats, rows, db)
 
 
 @router.get("/", response_model=List[SpyCat])
-def list_spy_cats(db: Session = Depends(get_db)):
-    return crud.list_spy_cats(db)
+def list_spy_cats(
+    request: Request,
+    limit: int = Depends(page_limit),
+    cursor: Optional[int] = None,
+    breed: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    cats, next_cursor = crud.list_spy_cats(db, limit, cursor, breed)
+    response = json_response(cats)
+    set_next_cursor(request, response, next_cursor)
+    return response
+
+
+@router.get("/export")
+def export_spy_cats(
+    since_id: Optional[int] = None, gzip: bool = False, db: Session = Depends(get_db)
+):
+    return ndjson_response(json_lines(crud.iter_spy_cats(db, since_id)), gzip)
+
+
+def serialize_spy_cat(cat) -> bytes:
+    return SpyCat.model_validate(cat).model_dump_json().encode()
 
 
 @router.get("/{cat_id}", response_model=SpyCat)
-def get_spy_cat(cat_id: int, db: Session = Depends(get_db)):
-    cat = crud.get_spy_cat(db, cat_id)
-    if not cat:
+def get_spy_cat(
+    cat_id: int,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    response = cached_json_response(
+        "cat",
+        cat_id,
+        lambda: crud.get_spy_cat(db, cat_id),
+        serialize_spy_cat,
+        spy_cat_etag,
+        if_none_match,
+    )
+    if response is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Spy cat with id {cat_id} not found",
         )
-    return cat
+    return response
 
 
 @router.patch("/{cat_id}", response_model=SpyCat)
 def update_spy_cat(
-    cat_id: int, cat_update: SpyCatUpdate, db: Session = Depends(get_db)
+    cat_id: int,
+    cat_update: SpyCatUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
 ):
-    cat = crud.update_spy_cat(db, cat_id, cat_update)
+    cat = crud.update_spy_cat(db, cat_id, cat_update, if_match)
     if not cat:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Spy cat with id {cat_id} not found",
         )
+    if cat == "version_conflict":
+        raise HTTPException(
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            detail=f"Spy cat with id {cat_id} has been modified",
+        )
+    if cat == "conflict":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Spy cat with id {cat_id} was modified concurrently; retry",
+        )
+    response.headers["ETag"] = spy_cat_etag(cat)
     return cat
 
 
@@ -0,0 +1,118 @@
+import asyncio
+from typing import List, Optional
+
+import orjson
+from fastapi import APIRouter, Depends, Header, Query, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+import config
+from db.database import get_db
+from db.schemas import Event
+import services.event_log as event_log
+from routers.pagination import page_limit, set_next_cursor
+from routers.serialization import json_response
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+SSE_MEDIA_TYPE = "text/event-stream"
+SSE_KEEPALIVE_SECONDS = 15
+
+
+def _read_events(db: Session, after: int, limit: int):
+    try:
+        return event_log.list_events(db, after, limit)
+    finally:
+        # Return the connection between polls; the next read starts a fresh
+        # transaction and so sees events committed since.
+        db.close()
+
+
+async def _poll(db: Session, after: int, limit: int, timeout: float):
+    """Read events after ``after``, waiting up to ``timeout`` for the first one.
+
+    Wakes when a local commit writes events, and re-reads at least every
+    EVENTS_POLL_INTERVAL for events committed by other processes.
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        woken = event_log.notifier.subscribe()
+        try:
+            events, next_cursor = await run_in_threadpool(
+                _read_events, db, after, limit
+            )
+            remaining = deadline - loop.time()
+            if events or remaining <= 0:
+                return events, next_cursor
+            await asyncio.wait(
+                {woken}, timeout=min(remaining, config.EVENTS_POLL_INTERVAL)
+            )
+        finally:
+            event_log.notifier.unsubscribe(woken)
+
+
+@router.get("/", response_model=List[Event])
+async def list_events(
+    request: Request,
+    after: int = Query(0, ge=0),
+    limit: int = Depends(page_limit),
+    wait: float = Query(0, ge=0, le=config.EVENTS_MAX_WAIT),
+    db: Session = Depends(get_db),
+):
+    """Events with ``seq > after``, oldest first.
+
+    With ``wait`` the request long-polls: it returns as soon as an event
+    arrives, or an empty list after ``wait`` seconds.
+    """
+    events, next_cursor = await _poll(db, after, limit, wait)
+    response = json_response(events)
+    set_next_cursor(request, response, next_cursor)
+    return response
+
+
+def _sse_frame(event: dict) -> bytes:
+    return b"id: %d\nevent: %s\ndata: %s\n\n" % (
+        event["seq"],
+        event["type"].encode(),
+        orjson.dumps(event),
+    )
+
+
+@router.get("/stream")
+async def stream_events(
+    after: int = Query(0, ge=0),
+    timeout: float = Query(config.EVENT_STREAM_TIMEOUT, ge=0),
+    last_event_id: Optional[int] = Header(None),
+    db: Session = Depends(get_db),
+):
+    """Server-sent events for every event after ``after``.
+
+    A reconnecting EventSource resumes from its ``Last-Event-ID``. The stream
+    closes after ``timeout`` seconds without new events; clients reconnect.
+    """
+    position = last_event_id if last_event_id is not None else after
+    timeout = min(timeout, config.EVENT_STREAM_TIMEOUT)
+
+    async def frames():
+        nonlocal position
+        yield b"retry: 1000\n\n"
+        idle = 0.0
+        while True:
+            wait = min(SSE_KEEPALIVE_SECONDS, timeout - idle)
+            events, _ = await _poll(db, position, config.MAX_PAGE_SIZE, wait)
+            if events:
+                for event in events:
+                    yield _sse_frame(event)
+                position = events[-1]["seq"]
+                idle = 0.0
+                continue
+            idle += wait
+            if idle >= timeout:
+                return
+            yield b": keepalive\n\n"
+
+    return StreamingResponse(
+        frames(), media_type=SSE_MEDIA_TYPE, headers={"Cache-Control": "no-cache"}
+    )
@@ -0,0 +1,120 @@
+from typing import Awaitable, Callable, Optional
+
+from fastapi import HTTPException, Response, status
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+
+import services.idempotency as idempotency
+from db.models import IdempotencyKey
+from routers.caching import JSON_MEDIA_TYPE
+
+# Create endpoints take an optional ``Idempotency-Key`` header. The request
+# body runs through ``validate`` and ``add`` only the first time a key is
+# seen; retries get the stored response, marked ``Idempotent-Replayed``.
+# ``add`` inserts without committing, so the entity and the stored response
+# are committed together.
+
+
+def _in_progress() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_409_CONFLICT,
+        detail="A request with this Idempotency-Key is still in progress",
+        headers={"Retry-After": "1"},
+    )
+
+
+def _replay(claim) -> Optional[Response]:
+    """The stored response for ``claim``, or None if the caller owns it."""
+    if claim == "mismatch":
+        raise HTTPException(
+            status_code=422,
+            detail="Idempotency-Key was already used with a different request",
+        )
+    if claim == "in_progress":
+        raise _in_progress()
+    if claim.status_code is None:
+        return None
+    return Response(
+        content=claim.body,
+        status_code=claim.status_code,
+        media_type=JSON_MEDIA_TYPE,
+        headers={"Idempotent-Replayed": "true"},
+    )
+
+
+def _created(body: bytes) -> Response:
+    return Response(
+        content=body, status_code=status.HTTP_201_CREATED, media_type=JSON_MEDIA_TYPE
+    )
+
+
+def _insert(
+    db: Session,
+    claim: Optional[IdempotencyKey],
+    add: Callable[[Session], object],
+    serialize: Callable[..., bytes],
+) -> bytes:
+    body = serialize(add(db))
+    if claim is not None and not idempotency.complete(
+        db, claim, status.HTTP_201_CREATED, body
+    ):
+        # Presumed dead and taken over by a retry, which creates it instead.
+        raise _in_progress()
+    db.commit()
+    return body
+
+
+def idempotent_create(
+    db: Session,
+    scope: str,
+    key: Optional[str],
+    payload: BaseModel,
+    add: Callable[[Session], object],
+    serialize: Callable[..., bytes],
+    validate: Optional[Callable[[], None]] = None,
+) -> Response:
+    claim = None
+    if key is not None:
+        claim = idempotency.begin(db, scope, key, idempotency.request_hash(payload))
+        replay = _replay(claim)
+        if replay is not None:
+            return replay
+    try:
+        if validate is not None:
+            validate()
+        body = _insert(db, claim, add, serialize)
+    except BaseException:
+        if claim is not None:
+            idempotency.release(db, claim)
+        raise
+    return _created(body)
+
+
+async def aidempotent_create(
+    db,
+    scope: str,
+    key: Optional[str],
+    payload: BaseModel,
+    add: Callable[[Session], object],
+    serialize: Callable[..., bytes],
+    validate: Optional[Callable[[], Awaitable[None]]] = None,
+) -> Response:
+    """``idempotent_create`` for an ``AsyncSession``; ``add`` still takes the
+    sync session and ``validate`` is awaited."""
+    claim = None
+    if key is not None:
+        claim = await db.run_sync(
+            idempotency.begin, scope, key, idempotency.request_hash(payload)
+        )
+        replay = _replay(claim)
+        if replay is not None:
+            return replay
+    try:
+        if validate is not None:
+            await validate()
+        body = await db.run_sync(_insert, claim, add, serialize)
+    except BaseException:
+        if claim is not None:
+            await db.run_sync(idempotency.release, claim)
+        raise
+    return _created(body)
@@ -0,0 +1,55 @@
+import time
+
+from fastapi import APIRouter, Response
+
+from services.metrics import finish_request, registry, start_request
+
+PROMETHEUS_MEDIA_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics():
+    # The registry lives in this process: under ``serve.py --workers N`` each
+    # scrape sees one arbitrary worker's histograms, not the server's.
+    return Response(content=registry.render(), media_type=PROMETHEUS_MEDIA_TYPE)
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware timing each HTTP request by route template.
+
+    Labels use the matched route's path (``/cats/{cat_id}``) rather than the
+    raw URL so the number of series stays bounded; unmatched paths share one
+    label.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not registry.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        token = start_request()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            finish_request(
+                token,
+                scope["method"],
+                getattr(route, "path", "unmatched"),
+                status_code,
+                time.perf_counter() - start,
+            )
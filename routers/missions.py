@@ -1,46 +1,161 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Any, List, Optional
 
+import config
 from db.schemas import (
+    BulkResult,
     Mission,
     MissionAssign,
     MissionCreate,
+    MissionSummary,
     MissionUpdate,
+    ScheduleRequest,
+    ScheduleResult,
     Target,
+    TargetBatchUpdate,
     TargetUpdate,
 )
 from db.database import get_db
+import services.archive_service as archive
 import services.mission_service as crud
+import services.scheduler as scheduler
+from routers.bulk import bulk_result, validate_items
+from routers.caching import cached_json_response
+from routers.idempotency import idempotent_create
+from routers.pagination import page_limit, set_next_cursor
+from routers.serialization import json_lines, json_response
+from routers.streaming import ndjson_response
+from services.etags import mission_etag, target_etag
 
 router = APIRouter(prefix="/missions", tags=["missions"])
 
 
 @router.post("/", response_model=Mission, status_code=status.HTTP_201_CREATED)
-def create_mission(mission: MissionCreate, db: Session = Depends(get_db)):
-    return crud.create_mission(db, mission)
+def create_mission(
+    mission: MissionCreate,
+    idempotency_key: Optional[str] = Header(None, max_length=255),
+    db: Session = Depends(get_db),
+):
+    return idempotent_create(
+        db,
+        "POST /missions/",
+        idempotency_key,
+        mission,
+        lambda session: crud.add_mission(session, mission),
+        serialize_mission,
+    )
+
+
+@router.post("/bulk", response_model=BulkResult)
+def bulk_create_missions(
+    missions: List[Any] = Body(..., max_length=config.MAX_BULK_MISSIONS),
+    db: Session = Depends(get_db),
+):
+    valid, failed = validate_items(missions, MissionCreate)
+    ids = crud.bulk_create_missions(db, [mission for _, mission in valid])
+    return bulk_result([(index, id) for (index, _), id in zip(valid, ids)], failed)
+
+
+@router.post("/schedule", response_model=ScheduleResult)
+def schedule_missions(request: ScheduleRequest, db: Session = Depends(get_db)):
+    result = scheduler.schedule_missions(
+        db, request.policy, request.dry_run, request.limit
+    )
+    if result == "unknown_policy":
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown policy {request.policy!r}; "
+            f"expected one of {sorted(scheduler.POLICIES)}",
+        )
+    if result == "conflict":
+        raise HTTPException(
+            status_code=409,
+            detail="Missions or cats were assigned concurrently; retry",
+        )
+    return json_response(result)
 
 
 @router.get("/", response_model=List[Mission])
-def list_missions(db: Session = Depends(get_db)):
-    return crud.list_missions(db)
+def list_missions(
+    request: Request,
+    limit: int = Depends(page_limit),
+    cursor: Optional[int] = None,
+    complete: Optional[bool] = None,
+    cat_id: Optional[int] = None,
+    breed: Optional[str] = None,
+    country: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    missions, next_cursor = crud.list_missions(
+        db,
+        limit,
+        cursor,
+        complete=complete,
+        cat_id=cat_id,
+        breed=breed,
+        country=country,
+    )
+    response = json_response(missions)
+    set_next_cursor(request, response, next_cursor)
+    return response
+
+
+@router.get("/export")
+def export_missions(
+    since_id: Optional[int] = None, gzip: bool = False, db: Session = Depends(get_db)
+):
+    return ndjson_response(json_lines(crud.iter_missions(db, since_id)), gzip)
+
+
+@router.get("/summary", response_model=MissionSummary)
+def mission_summary(db: Session = Depends(get_db)):
+    return crud.mission_summary(db)
+
+
+def serialize_mission(mission) -> bytes:
+    return Mission.model_validate(mission).model_dump_json().encode()
 
 
 @router.get("/{mission_id}", response_model=Mission)
-def get_mission(mission_id: int, db: Session = Depends(get_db)):
-    mission = crud.get_mission(db, mission_id)
-    if not mission:
+def get_mission(
+    mission_id: int,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    response = cached_json_response(
+        "mission",
+        mission_id,
+        lambda: archive.find_mission(db, mission_id),
+        serialize_mission,
+        mission_etag,
+        if_none_match,
+    )
+    if response is None:
         raise HTTPException(
             status_code=404, detail=f"Mission with id {mission_id} not found"
         )
-    return mission
+    return response
 
 
 @router.patch("/{mission_id}", response_model=Mission)
 def update_mission(
-    mission_id: int, mission_update: MissionUpdate, db: Session = Depends(get_db)
+    mission_id: int,
+    mission_update: MissionUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
 ):
-    result = crud.update_mission(db, mission_id, mission_update)
+    result = crud.update_mission(db, mission_id, mission_update, if_match)
     if result is None:
         raise HTTPException(
             status_code=404, detail=f"Mission with id {mission_id} not found"
@@ -50,6 +165,16 @@ def update_mission(
             status_code=400,
             detail="Cannot reactivate mission: cat already has an active mission",
         )
+    if result == "version_conflict":
+        raise HTTPException(
+            status_code=412, detail=f"Mission with id {mission_id} has been modified"
+        )
+    if result == "conflict":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Mission with id {mission_id} was modified concurrently; retry",
+        )
+    response.headers["ETag"] = mission_etag(result)
     return result
 
 
@@ -69,9 +194,13 @@ def delete_mission(mission_id: int, db: Session = Depends(get_db)):
 
 @router.patch("/{mission_id}/assign", response_model=Mission)
 def assign_cat_to_mission(
-    mission_id: int, assignment: MissionAssign, db: Session = Depends(get_db)
+    mission_id: int,
+    assignment: MissionAssign,
+    response: Response,
+    if_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
 ):
-    mission, error = crud.assign_cat_to_mission(db, mission_id, assignment)
+    mission, error = crud.assign_cat_to_mission(db, mission_id, assignment, if_match)
     if error == "mission_not_found":
         raise HTTPException(
             status_code=404, detail=f"Mission with id {mission_id} not found"
@@ -85,6 +214,11 @@ def assign_cat_to_mission(
             status_code=400,
             detail=f"Cat {assignment.cat_id} already has an active mission",
         )
+    if error == "version_conflict":
+        raise HTTPException(
+            status_code=412, detail=f"Mission with id {mission_id} has been modified"
+        )
+    response.headers["ETag"] = mission_etag(mission)
     return mission
 
 
@@ -93,9 +227,13 @@ def update_target(
     mission_id: int,
     target_id: int,
     target_update: TargetUpdate,
+    response: Response,
+    if_match: Optional[str] = Header(None),
     db: Session = Depends(get_db),
 ):
-    target, error = crud.update_target(db, mission_id, target_id, target_update)
+    target, error = crud.update_target(
+        db, mission_id, target_id, target_update, if_match
+    )
     if error == "mission_not_found":
         raise HTTPException(
             status_code=404, detail=f"Mission with id {mission_id} not found"
@@ -110,4 +248,55 @@ def update_target(
             status_code=400,
             detail="Cannot update notes: target or mission is already completed",
         )
+    if error == "version_conflict":
+        raise HTTPException(
+            status_code=412,
+            detail=f"Target with id {target_id} has been modified",
+        )
+    if error == "conflict":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Target with id {target_id} was modified concurrently; retry",
+        )
+    response.headers["ETag"] = target_etag(target)
     return target
+
+
+@router.patch("/{mission_id}/targets", response_model=Mission)
+def update_targets(
+    mission_id: int,
+    response: Response,
+    updates: List[TargetBatchUpdate] = Body(..., min_length=1),
+    if_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db),
+):
+    mission, error = crud.update_targets(db, mission_id, updates, if_match)
+    if error == "mission_not_found":
+        raise HTTPException(
+            status_code=404, detail=f"Mission with id {mission_id} not found"
+        )
+    if error == "target_not_found":
+        raise HTTPException(
+            status_code=404,
+            detail=f"Not every target belongs to mission {mission_id}",
+        )
+    if error == "duplicate_target":
+        raise HTTPException(
+            status_code=400, detail="Each target may only be updated once per request"
+        )
+    if error == "cannot_update_notes":
+        raise HTTPException(
+            status_code=400,
+            detail="Cannot update notes: target or mission is already completed",
+        )
+    if error == "version_conflict":
+        raise HTTPException(
+            status_code=412, detail=f"Mission with id {mission_id} has been modified"
+        )
+    if error == "conflict":
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Mission with id {mission_id} was modified concurrently; retry",
+        )
+    response.headers["ETag"] = mission_etag(mission)
+    return mission
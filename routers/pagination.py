@@ -0,0 +1,20 @@
+from typing import Optional
+
+from fastapi import Query, Request, Response
+
+import config
+
+
+def page_limit(
+    limit: int = Query(config.DEFAULT_PAGE_SIZE, ge=1, le=config.MAX_PAGE_SIZE)
+) -> int:
+    return limit
+
+
+def set_next_cursor(request: Request, response: Response, next_cursor: Optional[int]):
+    """Advertise the next keyset page via ``X-Next-Cursor`` and a ``Link`` header."""
+    if next_cursor is None:
+        return
+    next_url = request.url.include_query_params(cursor=next_cursor)
+    response.headers["X-Next-Cursor"] = str(next_cursor)
+    response.headers["Link"] = f'<{next_url}>; rel="next"'
@@ -0,0 +1,19 @@
+from typing import Any, Iterable, Iterator
+
+import orjson
+from fastapi import Response
+
+from routers.caching import JSON_MEDIA_TYPE
+
+# The list and export endpoints are fed plain dicts built from column rows
+# (see ``CAT_COLUMNS`` / ``MISSION_COLUMNS`` in the services) that already
+# match the response schemas, so they are dumped straight to bytes instead of
+# going through Pydantic validation and FastAPI's ``jsonable_encoder``.
+
+
+def json_response(content: Any) -> Response:
+    return Response(content=orjson.dumps(content), media_type=JSON_MEDIA_TYPE)
+
+
+def json_lines(documents: Iterable[Any]) -> Iterator[bytes]:
+    return map(orjson.dumps, documents)
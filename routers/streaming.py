@@ -0,0 +1,41 @@
+import zlib
+from typing import Iterable, Iterator
+
+from fastapi.responses import StreamingResponse
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Lines are coalesced into chunks of roughly this size before being written,
+# so a large export is not sent as one tiny write per row.
+CHUNK_SIZE = 64 * 1024
+
+
+def _chunks(lines: Iterable[bytes]) -> Iterator[bytes]:
+    buffer = bytearray()
+    for line in lines:
+        buffer += line
+        buffer += b"\n"
+        if len(buffer) >= CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+    if buffer:
+        yield bytes(buffer)
+
+
+def _gzipped(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=zlib.MAX_WBITS | 16)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def ndjson_response(lines: Iterable[bytes], gzip: bool = False) -> StreamingResponse:
+    """Stream already-serialized JSON documents as newline-delimited JSON."""
+    body = _chunks(lines)
+    headers = {}
+    if gzip:
+        body = _gzipped(body)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(body, media_type=NDJSON_MEDIA_TYPE, headers=headers)
@@ -0,0 +1,38 @@
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from sqlalchemy.orm import Session
+
+from db.database import get_db
+from db.schemas import TargetSearchHit
+import services.search_service as search
+from routers.pagination import page_limit, set_next_cursor
+from routers.serialization import json_response
+
+router = APIRouter(prefix="/targets", tags=["targets"])
+
+
+@router.get("/search", response_model=List[TargetSearchHit])
+def search_targets(
+    request: Request,
+    q: str = Query(..., min_length=1),
+    limit: int = Depends(page_limit),
+    cursor: Optional[int] = Query(None, ge=0),
+    country: Optional[str] = None,
+    db: Session = Depends(get_db),
+):
+    result = search.search_targets(db, q, limit, cursor, country)
+    if result == "search_unavailable":
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Full-text search requires SQLite with FTS5",
+        )
+    if result == "invalid_query":
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Search query has no searchable terms",
+        )
+    hits, next_cursor = result
+    response = json_response(hits)
+    set_next_cursor(request, response, next_cursor)
+    return response
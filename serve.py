@@ -0,0 +1,93 @@
+"""Run the API in several uvicorn worker processes.
+
+The parent process checks that the database can be shared by the workers,
+brings the schema up to date once (so workers start on the fast path) and
+creates the stamp file through which the workers' in-memory response caches
+invalidate each other. Usage:
+
+    python serve.py [--workers N] [--host 127.0.0.1] [--port 8000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+from typing import List
+
+import uvicorn
+from sqlalchemy.engine import make_url
+
+import config
+
+
+def deployment_problems(url: str, workers: int) -> List[str]:
+    """Reasons ``workers`` processes cannot safely share the database at ``url``."""
+    from db.database import is_sqlite_memory
+
+    parsed = make_url(url)
+    if workers < 2 or parsed.get_backend_name() != "sqlite":
+        return []
+    problems = []
+    if is_sqlite_memory(parsed):
+        problems.append("an in-memory SQLite database cannot be shared by workers")
+    elif config.SQLITE_JOURNAL_MODE.upper() != "WAL":
+        problems.append(
+            "SQLITE_JOURNAL_MODE must be WAL with several workers, otherwise"
+            " every writer blocks the readers of all the others"
+        )
+    return problems
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--log-level", default="info")
+    args = parser.parse_args()
+
+    problems = deployment_problems(config.DATABASE_URL, args.workers)
+    if problems:
+        sys.exit("serve.py: " + "; ".join(problems))
+
+    from db.database import engine
+    from db.migrations import upgrade
+
+    upgrade(engine)
+    if engine.dialect.name != "sqlite":
+        per_worker = config.DB_POOL_SIZE + config.DB_MAX_OVERFLOW
+        print(
+            f"serve.py: up to {args.workers * per_worker} database connections"
+            f" per engine ({args.workers} workers x {per_worker})"
+        )
+    engine.dispose()
+    if args.workers > 1 and config.METRICS_ENABLED:
+        print(
+            "serve.py: /metrics reports only the worker that answers it;"
+            " run one worker to scrape it"
+        )
+
+    with tempfile.TemporaryDirectory(prefix="spycats-") as tmp:
+        if (
+            args.workers > 1
+            and config.RESPONSE_CACHE_BACKEND == "memory"
+            and not config.RESPONSE_CACHE_STAMP_PATH
+        ):
+            os.environ["RESPONSE_CACHE_STAMP_PATH"] = os.path.join(tmp, "cache.stamps")
+        uvicorn.run(
+            "main:app",
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            log_level=args.log_level,
+        )
+
+
+if __name__ == "__main__":
+    main()
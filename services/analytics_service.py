@@ -0,0 +1,183 @@
+"""Payroll and workforce aggregates computed by the database.
+
+Every figure comes from a GROUP BY over ``spy_cats`` and ``missions``; mission
+progress uses the target counters kept on ``missions``, so the ``targets``
+table is never scanned. A mission belongs to its assigned cat while active
+and to ``completed_by`` once complete. Archived missions (all complete) count
+like live ones. Money values are rounded to cents.
+"""
+
+from typing import List, Optional
+
+from sqlalchemy import and_, case, false, func, or_, select, true, union_all
+from sqlalchemy.orm import Session
+
+from db.models import ArchivedMission, Event, Mission, SpyCat
+
+SALARY_EVENTS = ("cat.created", "cat.salary_changed")
+
+
+def _owned_missions():
+    """Live and archived missions with the cat they belong to."""
+    return union_all(
+        select(
+            func.coalesce(Mission.cat_id, Mission.completed_by).label("cat_id"),
+            Mission.complete,
+        ),
+        select(ArchivedMission.completed_by, ArchivedMission.complete),
+    ).subquery()
+
+
+def _money(value) -> Optional[float]:
+    return None if value is None else round(value, 2)
+
+
+def _per_mission(salary, missions: int) -> Optional[float]:
+    return _money(salary / missions) if missions else None
+
+
+def _count_where(condition):
+    return func.coalesce(func.sum(case((condition, 1), else_=0)), 0)
+
+
+def payroll(db: Session) -> dict:
+    """Salary totals, split between deployed and idle cats.
+
+    A cat is deployed while it has an active mission; the partial unique
+    index on missions guarantees at most one, so the join below counts each
+    deployed cat once.
+    """
+    cats, total, average, lowest, highest = db.execute(
+        select(
+            func.count(),
+            func.coalesce(func.sum(SpyCat.salary), 0),
+            func.avg(SpyCat.salary),
+            func.min(SpyCat.salary),
+            func.max(SpyCat.salary),
+        )
+    ).one()
+    archived = select(func.count()).select_from(ArchivedMission).scalar_subquery()
+    deployed, deployed_salary, completed = db.execute(
+        select(
+            func.count(SpyCat.id),
+            func.coalesce(func.sum(SpyCat.salary), 0),
+            _count_where(Mission.complete == True) + archived,
+        )
+        .select_from(Mission)
+        .outerjoin(SpyCat, and_(SpyCat.id == Mission.cat_id, Mission.complete == False))
+    ).one()
+    return {
+        "cats": cats,
+        "total_salary": _money(total),
+        "average_salary": _money(average),
+        "min_salary": _money(lowest),
+        "max_salary": _money(highest),
+        "deployed_cats": deployed,
+        "deployed_salary": _money(deployed_salary),
+        "idle_cats": cats - deployed,
+        "idle_salary": _money(total - deployed_salary),
+        "completed_missions": completed,
+        "cost_per_completed_mission": _per_mission(total, completed),
+    }
+
+
+def breed_summaries(db: Session) -> List[dict]:
+    """Salary distribution and mission counts per breed, by breed name."""
+    salaries = db.execute(
+        select(
+            SpyCat.breed,
+            func.count(),
+            func.sum(SpyCat.salary),
+            func.avg(SpyCat.salary),
+            func.min(SpyCat.salary),
+            func.max(SpyCat.salary),
+        )
+        .group_by(SpyCat.breed)
+        .order_by(SpyCat.breed)
+    ).all()
+    owned = _owned_missions()
+    missions = {
+        breed: (completed, active)
+        for breed, completed, active in db.execute(
+            select(
+                SpyCat.breed,
+                _count_where(owned.c.complete == True),
+                _count_where(owned.c.complete == False),
+            )
+            .join(owned, owned.c.cat_id == SpyCat.id)
+            .group_by(SpyCat.breed)
+        )
+    }
+    summaries = []
+    for breed, cats, total, average, lowest, highest in salaries:
+        completed, active = missions.get(breed, (0, 0))
+        summaries.append(
+            {
+                "breed": breed,
+                "cats": cats,
+                "total_salary": _money(total),
+                "average_salary": _money(average),
+                "min_salary": _money(lowest),
+                "max_salary": _money(highest),
+                "completed_missions": completed,
+                "active_missions": active,
+                "cost_per_completed_mission": _per_mission(total, completed),
+            }
+        )
+    return summaries
+
+
+def cat_history(db: Session, cat_id: int) -> Optional[dict]:
+    """A cat's missions and salary changes; None if the cat does not exist.
+
+    Salary changes are read from the event log, so they start when the log
+    was introduced.
+    """
+    cat = db.execute(
+        select(
+            SpyCat.id,
+            SpyCat.name,
+            SpyCat.breed,
+            SpyCat.years_of_experience,
+            SpyCat.salary,
+        ).where(SpyCat.id == cat_id)
+    ).first()
+    if cat is None:
+        return None
+    live = select(
+        Mission.id,
+        Mission.complete,
+        Mission.targets_total,
+        Mission.targets_completed,
+        false().label("archived"),
+    ).where(or_(Mission.cat_id == cat_id, Mission.completed_by == cat_id))
+    archived = select(
+        ArchivedMission.id,
+        ArchivedMission.complete,
+        ArchivedMission.targets_total,
+        ArchivedMission.targets_completed,
+        true().label("archived"),
+    ).where(ArchivedMission.completed_by == cat_id)
+    history = union_all(live, archived).subquery()
+    missions = [
+        dict(row._mapping) for row in db.execute(select(history).order_by(history.c.id))
+    ]
+    salary_changes = [
+        {"seq": seq, "at": created_at, "salary": data.get("salary")}
+        for seq, created_at, data in db.execute(
+            select(Event.seq, Event.created_at, Event.data)
+            .where(Event.entity_id == cat_id, Event.type.in_(SALARY_EVENTS))
+            .order_by(Event.seq)
+        )
+    ]
+    completed = sum(mission["complete"] for mission in missions)
+    return {
+        **cat._mapping,
+        "missions_total": len(missions),
+        "missions_completed": completed,
+        "targets_total": sum(mission["targets_total"] for mission in missions),
+        "targets_completed": sum(mission["targets_completed"] for mission in missions),
+        "cost_per_completed_mission": _per_mission(cat.salary, completed),
+        "missions": missions,
+        "salary_history": salary_changes,
+    }
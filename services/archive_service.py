@@ -0,0 +1,163 @@
+"""Move completed missions out of the hot tables.
+
+Missions completed more than ``ARCHIVE_AFTER_DAYS`` ago are copied with
+their targets into ``archived_missions``/``archived_targets`` and deleted
+from ``missions``/``targets``, ``ARCHIVE_BATCH_SIZE`` missions per
+transaction so writers are never blocked for long. Lists, exports, search
+and every conflict check then only see live missions; ``GET /missions/{id}``
+falls back to ``get_archived_mission``. The job runs every
+``ARCHIVE_INTERVAL_SECONDS`` from the app's lifespan, or by hand:
+
+    python -m services.archive_service [--older-than-days N]
+"""
+
+import argparse
+from datetime import timedelta
+from typing import List, Optional
+
+from sqlalchemy import and_, delete, insert, select
+from sqlalchemy.exc import DBAPIError, IntegrityError
+from sqlalchemy.orm import Session, selectinload
+
+import config
+from db.database import SessionLocal
+from db.models import ArchivedMission, ArchivedTarget, Mission, Target
+from services.clock import utcnow
+from services.event_log import record_many
+from services.maintenance import run_periodically
+from services.mission_service import get_mission
+from services.response_cache import response_cache
+
+MISSION_FIELDS = (
+    "id",
+    "cat_id",
+    "complete",
+    "version",
+    "targets_total",
+    "targets_completed",
+    "completed_by",
+    "completed_at",
+)
+TARGET_FIELDS = ("id", "mission_id", "name", "country", "notes", "complete", "version")
+
+
+def _archivable(cutoff):
+    return and_(Mission.complete == True, Mission.completed_at <= cutoff)
+
+
+def archivable_ids(db: Session, cutoff, limit: int) -> List[int]:
+    query = (
+        select(Mission.id)
+        .where(_archivable(cutoff))
+        .order_by(Mission.id)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    return db.execute(query).scalars().all()
+
+
+def archive_batch(db: Session, ids: List[int], cutoff) -> int:
+    """Move the missions ``ids`` that are still archivable; commits.
+
+    The condition is checked again when copying, so a mission reopened since
+    ``ids`` was read stays live with its targets.
+    """
+    moved = (
+        db.execute(
+            insert(ArchivedMission)
+            .from_select(
+                MISSION_FIELDS,
+                select(*(getattr(Mission, field) for field in MISSION_FIELDS)).where(
+                    Mission.id.in_(ids), _archivable(cutoff)
+                ),
+            )
+            .returning(ArchivedMission.id)
+        )
+        .scalars()
+        .all()
+    )
+    if moved:
+        db.execute(
+            insert(ArchivedTarget).from_select(
+                TARGET_FIELDS,
+                select(*(getattr(Target, field) for field in TARGET_FIELDS)).where(
+                    Target.mission_id.in_(moved)
+                ),
+            )
+        )
+        for table, column in ((Target, Target.mission_id), (Mission, Mission.id)):
+            db.execute(
+                delete(table)
+                .where(column.in_(moved))
+                .execution_options(synchronize_session=False)
+            )
+        record_many(db, (("mission.archived", id, {}) for id in moved))
+    db.commit()
+    response_cache.invalidate("mission", *moved)
+    return len(moved)
+
+
+def archive_completed_missions(
+    db: Session,
+    older_than: Optional[timedelta] = None,
+    batch_size: Optional[int] = None,
+) -> int:
+    """Archive every mission completed before ``older_than`` ago.
+
+    Returns how many were moved. Another process archiving at the same time
+    makes this run stop early rather than fail; its batches cover the rest.
+    """
+    if older_than is None:
+        older_than = timedelta(days=config.ARCHIVE_AFTER_DAYS)
+    batch_size = batch_size or config.ARCHIVE_BATCH_SIZE
+    cutoff = utcnow() - older_than
+    archived = 0
+    while True:
+        ids = archivable_ids(db, cutoff, batch_size)
+        if not ids:
+            return archived
+        try:
+            archived += archive_batch(db, ids, cutoff)
+        except (IntegrityError, DBAPIError):
+            db.rollback()
+            return archived
+
+
+def get_archived_mission(db: Session, mission_id: int) -> Optional[ArchivedMission]:
+    return db.execute(
+        select(ArchivedMission)
+        .options(selectinload(ArchivedMission.targets))
+        .where(ArchivedMission.id == mission_id)
+    ).scalar_one_or_none()
+
+
+def find_mission(db: Session, mission_id: int):
+    """The live mission ``mission_id``, else its archived copy."""
+    return get_mission(db, mission_id) or get_archived_mission(db, mission_id)
+
+
+def run_archival() -> int:
+    db = SessionLocal()
+    try:
+        return archive_completed_missions(db)
+    finally:
+        db.close()
+
+
+async def archive_periodically(interval: float):
+    """Lifespan task: archive every ``interval`` seconds until cancelled."""
+    await run_periodically(interval, run_archival)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Archive old completed missions.")
+    parser.add_argument(
+        "--older-than-days", type=float, default=config.ARCHIVE_AFTER_DAYS
+    )
+    parser.add_argument("--batch-size", type=int, default=config.ARCHIVE_BATCH_SIZE)
+    args = parser.parse_args()
+    with SessionLocal() as session:
+        count = archive_completed_missions(
+            session, timedelta(days=args.older_than_days), args.batch_size
+        )
+    print(f"Archived {count} missions")
@@ -0,0 +1,40 @@
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from db.models import SpyCat
+from db.schemas import SpyCatUpdate
+import services.cats_service as crud
+from services.pagination import paginate
+
+# Writes reuse the sync service logic through ``AsyncSession.run_sync``: the
+# function runs in a greenlet over the aiosqlite connection, so the event loop
+# is never blocked and both stacks share one implementation of the rules.
+
+
+async def list_spy_cats(
+    db: AsyncSession,
+    limit: int,
+    cursor: Optional[int] = None,
+    breed: Optional[str] = None,
+):
+    result = await db.execute(crud.spy_cats_query(limit, cursor, breed))
+    rows, next_cursor = paginate(result.all(), limit)
+    return crud.cat_documents(rows), next_cursor
+
+
+async def get_spy_cat(db: AsyncSession, cat_id: int):
+    return await db.get(SpyCat, cat_id)
+
+
+async def update_spy_cat(
+    db: AsyncSession,
+    cat_id: int,
+    cat_update: SpyCatUpdate,
+    if_match: Optional[str] = None,
+):
+    return await db.run_sync(crud.update_spy_cat, cat_id, cat_update, if_match)
+
+
+async def delete_spy_cat(db: AsyncSession, cat_id: int) -> bool:
+    return await db.run_sync(crud.delete_spy_cat, cat_id)
@@ -0,0 +1,108 @@
+from typing import List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from db.models import Mission
+from db.schemas import (
+    MissionUpdate,
+    MissionAssign,
+    TargetBatchUpdate,
+    TargetUpdate,
+)
+import services.archive_service as archive
+import services.mission_service as crud
+import services.scheduler as scheduler
+from services.pagination import paginate
+
+# See services/async_cats_service.py: writes delegate to the sync service via
+# ``run_sync``. The sync functions return missions with their targets eagerly
+# loaded, which matters here because lazy loads cannot run from async code.
+
+
+async def list_missions(
+    db: AsyncSession, limit: int, cursor: Optional[int] = None, **filters
+):
+    result = await db.execute(crud.missions_query(limit, cursor, **filters))
+    rows, next_cursor = paginate(result.all(), limit)
+    targets = []
+    if rows:
+        result = await db.execute(crud.targets_query([row.id for row in rows]))
+        targets = result.all()
+    return crud.mission_documents(rows, targets), next_cursor
+
+
+async def get_mission(db: AsyncSession, mission_id: int):
+    result = await db.execute(
+        select(Mission)
+        .options(joinedload(Mission.targets))
+        .where(Mission.id == mission_id)
+    )
+    return result.unique().scalars().first()
+
+
+async def find_mission(db: AsyncSession, mission_id: int):
+    """The live mission ``mission_id``, else its archived copy."""
+    mission = await get_mission(db, mission_id)
+    if mission is None:
+        mission = await db.run_sync(archive.get_archived_mission, mission_id)
+    return mission
+
+
+async def mission_summary(db: AsyncSession) -> dict:
+    return await db.run_sync(crud.mission_summary)
+
+
+async def update_mission(
+    db: AsyncSession,
+    mission_id: int,
+    mission_update: MissionUpdate,
+    if_match: Optional[str] = None,
+):
+    return await db.run_sync(crud.update_mission, mission_id, mission_update, if_match)
+
+
+async def delete_mission(db: AsyncSession, mission_id: int):
+    return await db.run_sync(crud.delete_mission, mission_id)
+
+
+async def assign_cat_to_mission(
+    db: AsyncSession,
+    mission_id: int,
+    assignment: MissionAssign,
+    if_match: Optional[str] = None,
+):
+    return await db.run_sync(
+        crud.assign_cat_to_mission, mission_id, assignment, if_match
+    )
+
+
+async def update_target(
+    db: AsyncSession,
+    mission_id: int,
+    target_id: int,
+    target_update: TargetUpdate,
+    if_match: Optional[str] = None,
+):
+    return await db.run_sync(
+        crud.update_target, mission_id, target_id, target_update, if_match
+    )
+
+
+async def update_targets(
+    db: AsyncSession,
+    mission_id: int,
+    updates: List[TargetBatchUpdate],
+    if_match: Optional[str] = None,
+):
+    return await db.run_sync(crud.update_targets, mission_id, updates, if_match)
+
+
+async def schedule_missions(
+    db: AsyncSession,
+    policy: str = "fifo",
+    dry_run: bool = False,
+    limit: Optional[int] = None,
+):
+    return await db.run_sync(scheduler.schedule_missions, policy, dry_run, limit)
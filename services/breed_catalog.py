@@ -0,0 +1,317 @@
+import asyncio
+import contextlib
+import fcntl
+import json
+import os
+import threading
+import time
+from typing import Awaitable, Callable, FrozenSet, Iterable, Optional
+
+import anyio
+
+import config
+from services.metrics import external_call
+
+CAT_API_URL = "https://api.thecatapi.com/v1/breeds"
+
+# How long to wait before retrying after a failed background refresh, so a
+# stale catalog does not hammer an upstream that is down.
+REFRESH_RETRY_SECONDS = 60.0
+
+BreedFetcher = Callable[[], Iterable[str]]
+AsyncBreedFetcher = Callable[[], Awaitable[Iterable[str]]]
+
+
+class BreedCatalogUnavailable(Exception):
+    """Raised when there is no cached catalog and the fetcher fails."""
+
+
+def fetch_breeds_from_api() -> list:
+    # Imported on first use: requests is slow to import and most workers
+    # start from the catalog snapshot without fetching.
+    import requests
+
+    response = requests.get(CAT_API_URL, timeout=config.BREED_CATALOG_FETCH_TIMEOUT)
+    response.raise_for_status()
+    return [b.get("name", "") for b in response.json()]
+
+
+async def fetch_breeds_from_api_async() -> list:
+    import httpx
+
+    async with httpx.AsyncClient(timeout=config.BREED_CATALOG_FETCH_TIMEOUT) as client:
+        response = await client.get(CAT_API_URL)
+        response.raise_for_status()
+        return [b.get("name", "") for b in response.json()]
+
+
+def file_fetcher(path: str) -> BreedFetcher:
+    """Fetcher reading a TheCatAPI-shaped JSON file (or a plain list of names)."""
+
+    def fetch():
+        with open(path) as f:
+            data = json.load(f)
+        return [b.get("name", "") if isinstance(b, dict) else b for b in data]
+
+    return fetch
+
+
+class BreedCatalog:
+    """In-memory set of valid breed names with stale-while-revalidate refresh.
+
+    The catalog is seeded from an on-disk snapshot when one exists, otherwise
+    from the fetcher. Once loaded, lookups never block on the network: a stale
+    catalog keeps answering while a single background thread refreshes it.
+
+    ``_lock`` only guards swapping a new breed set in and the ``_refreshing``
+    flag; it is never held across a fetch or file I/O. ``_load_lock``
+    serializes cold sync loads so concurrent first lookups fetch once, and
+    an ``asyncio.Lock`` does the same for cold async loads.
+
+    Worker processes sharing a snapshot refresh one at a time under a file
+    lock next to it, and each re-reads the snapshot first: a worker that
+    finds a fresher copy written by another adopts it instead of fetching.
+    """
+
+    def __init__(
+        self,
+        fetcher: BreedFetcher = fetch_breeds_from_api,
+        snapshot_path: Optional[str] = None,
+        ttl: float = 86400.0,
+        async_fetcher: Optional[AsyncBreedFetcher] = None,
+    ):
+        self._lock = threading.Lock()
+        self._load_lock = threading.Lock()
+        self._aload_lock: Optional[asyncio.Lock] = None
+        self._aload_loop = None
+        self._stats_lock = threading.Lock()
+        self.configure(
+            fetcher=fetcher,
+            snapshot_path=snapshot_path,
+            ttl=ttl,
+            async_fetcher=async_fetcher,
+        )
+
+    def configure(
+        self,
+        fetcher: Optional[BreedFetcher] = None,
+        snapshot_path: Optional[str] = None,
+        ttl: Optional[float] = None,
+        async_fetcher: Optional[AsyncBreedFetcher] = None,
+    ):
+        """Swap the fetcher/snapshot settings and drop any loaded data.
+
+        Without an ``async_fetcher``, cold async lookups run the sync fetcher
+        in a worker thread.
+        """
+        if fetcher is not None:
+            self.fetcher = fetcher
+        self.async_fetcher = async_fetcher
+        self.snapshot_path = snapshot_path
+        if ttl is not None:
+            self.ttl = ttl
+        self._breeds: Optional[FrozenSet[str]] = None
+        self._fetched_at = 0.0
+        self._refreshing = False
+        self._next_refresh_attempt = 0.0
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.refresh_failures = 0
+
+    @property
+    def loaded(self) -> bool:
+        return self._breeds is not None
+
+    def is_stale(self) -> bool:
+        return time.time() - self._fetched_at > self.ttl
+
+    def load(self):
+        """Warm the catalog at startup without failing if upstream is down."""
+        with self._load_lock:
+            if self._breeds is None and not self._load_snapshot():
+                try:
+                    self.refresh()
+                except BreedCatalogUnavailable:
+                    return
+        if self.is_stale():
+            self.refresh_in_background()
+
+    def contains(self, breed: str) -> bool:
+        breeds = self._breeds
+        if breeds is None:
+            self._count("misses")
+            breeds = self._load_blocking()
+        else:
+            self._count("hits")
+        if self.is_stale():
+            self.refresh_in_background()
+        return breed.lower() in breeds
+
+    async def acontains(self, breed: str) -> bool:
+        """Async variant of ``contains`` that never blocks the event loop."""
+        breeds = self._breeds
+        if breeds is None:
+            self._count("misses")
+            breeds = await self._aload()
+        else:
+            self._count("hits")
+        if self.is_stale():
+            self.refresh_in_background()
+        return breed.lower() in breeds
+
+    def refresh(self):
+        """Fetch the catalog now, replacing the cached copy."""
+        self._store(self._fetch())
+
+    def refresh_in_background(self):
+        # Called from the event loop by acontains, so it never waits: if
+        # another thread holds the lock, the next lookup retries.
+        if time.time() < self._next_refresh_attempt:
+            return
+        if not self._lock.acquire(blocking=False):
+            return
+        try:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        finally:
+            self._lock.release()
+        threading.Thread(target=self._background_refresh, daemon=True).start()
+
+    def stats(self) -> dict:
+        return {
+            "loaded": self.loaded,
+            "size": len(self._breeds) if self._breeds is not None else 0,
+            "age_seconds": (
+                round(time.time() - self._fetched_at, 3) if self.loaded else None
+            ),
+            "stale": self.is_stale() if self.loaded else None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures,
+        }
+
+    def _count(self, name: str):
+        with self._stats_lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def _load_blocking(self) -> FrozenSet[str]:
+        with self._load_lock:
+            if self._breeds is None and not self._load_snapshot():
+                self.refresh()
+            return self._breeds
+
+    def _async_load_lock(self) -> asyncio.Lock:
+        # An asyncio.Lock belongs to one event loop; tests and tooling may
+        # run several loops one after another.
+        loop = asyncio.get_running_loop()
+        if self._aload_loop is not loop:
+            self._aload_lock, self._aload_loop = asyncio.Lock(), loop
+        return self._aload_lock
+
+    async def _aload(self) -> FrozenSet[str]:
+        async with self._async_load_lock():
+            return await self._aload_locked()
+
+    async def _aload_locked(self) -> FrozenSet[str]:
+        # Snapshot reads and writes run in a worker thread, like the fetch.
+        if self._breeds is not None or await anyio.to_thread.run_sync(
+            self._load_snapshot
+        ):
+            return self._breeds
+        try:
+            with external_call("breed_catalog"):
+                if self.async_fetcher is not None:
+                    names = await self.async_fetcher()
+                else:
+                    names = await anyio.to_thread.run_sync(self.fetcher)
+        except Exception as e:
+            self._count("refresh_failures")
+            raise BreedCatalogUnavailable(str(e)) from e
+        await anyio.to_thread.run_sync(self._store, names)
+        return self._breeds
+
+    def _background_refresh(self):
+        try:
+            with self._refresh_lock():
+                if not (self._load_snapshot(newer_only=True) and not self.is_stale()):
+                    self.refresh()
+        except BreedCatalogUnavailable:
+            self._next_refresh_attempt = time.time() + REFRESH_RETRY_SECONDS
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    @contextlib.contextmanager
+    def _refresh_lock(self):
+        # Held across the fetch, so only by the background refresh thread.
+        try:
+            f = open(f"{self.snapshot_path}.lock", "a") if self.snapshot_path else None
+        except OSError:
+            f = None
+        if f is None:
+            yield
+            return
+        with f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _fetch(self) -> Iterable[str]:
+        try:
+            with external_call("breed_catalog"):
+                return self.fetcher()
+        except Exception as e:
+            self._count("refresh_failures")
+            raise BreedCatalogUnavailable(str(e)) from e
+
+    def _store(self, names: Iterable[str]):
+        breeds = frozenset(name.lower() for name in names if name)
+        with self._lock:
+            self._breeds, self._fetched_at = breeds, time.time()
+        self._count("refreshes")
+        self._write_snapshot()
+
+    def _load_snapshot(self, newer_only: bool = False) -> bool:
+        """Swap in the on-disk snapshot; with ``newer_only``, only one fetched
+        after the copy in memory."""
+        if not self.snapshot_path or not os.path.exists(self.snapshot_path):
+            return False
+        try:
+            with open(self.snapshot_path) as f:
+                data = json.load(f)
+            breeds = frozenset(data["breeds"])
+            fetched_at = float(data["fetched_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        with self._lock:
+            if newer_only and fetched_at <= self._fetched_at:
+                return False
+            self._breeds, self._fetched_at = breeds, fetched_at
+        return True
+
+    def _write_snapshot(self):
+        if not self.snapshot_path:
+            return
+        # Per process: several workers may refresh the catalog at once.
+        tmp_path = f"{self.snapshot_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(
+                    {"fetched_at": self._fetched_at, "breeds": sorted(self._breeds)},
+                    f,
+                )
+            os.replace(tmp_path, self.snapshot_path)
+        except OSError:
+            pass
+
+
+catalog = BreedCatalog(
+    snapshot_path=config.BREED_CATALOG_SNAPSHOT_PATH,
+    ttl=config.BREED_CATALOG_TTL_SECONDS,
+    async_fetcher=fetch_breeds_from_api_async,
+)
@@ -0,0 +1,59 @@
+"""Cross-process invalidation stamps for per-worker caches.
+
+Each worker keeps its own in-memory response cache. To let a write in one
+worker invalidate entries in the others, the workers share a small file,
+memory-mapped by each of them, holding 64-bit counters: slot 0 is a global
+epoch and every cache key hashes to one of the remaining slots. Invalidating
+bumps the epoch and the key's slot under an exclusive ``flock``; a cached
+entry remembers its slot's value when stored and is only served while that
+value is unchanged. Reading a stamp is a plain memory read, so cache hits
+stay cheap.
+"""
+
+import fcntl
+import mmap
+import os
+import struct
+import zlib
+from typing import Iterable
+
+_COUNTER = struct.Struct("<Q")
+
+
+class SharedStamps:
+    def __init__(self, path: str, slots: int):
+        self.path = path
+        self.slots = slots
+        size = (slots + 1) * _COUNTER.size
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(self._fd).st_size < size:
+            os.ftruncate(self._fd, size)
+        self._map = mmap.mmap(self._fd, size)
+
+    def slot(self, key: str) -> int:
+        return 1 + zlib.crc32(key.encode()) % self.slots
+
+    def read(self, slot: int) -> int:
+        return _COUNTER.unpack_from(self._map, slot * _COUNTER.size)[0]
+
+    def epoch(self) -> int:
+        return self.read(0)
+
+    def bump(self, slots: Iterable[int]):
+        """Advance the epoch, then ``slots``.
+
+        Readers check a slot before the epoch, so one that sees the new slot
+        value is guaranteed to see the new epoch as well.
+        """
+        fcntl.flock(self._fd, fcntl.LOCK_EX)
+        try:
+            for slot in (0, *sorted(set(slots))):
+                offset = slot * _COUNTER.size
+                value = _COUNTER.unpack_from(self._map, offset)[0]
+                _COUNTER.pack_into(self._map, offset, value + 1)
+        finally:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def close(self):
+        self._map.close()
+        os.close(self._fd)
@@ -0,0 +1,6 @@
+from datetime import datetime, timezone
+
+
+def utcnow() -> datetime:
+    """Naive UTC, as ``func.now()`` stores it in SQLite."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
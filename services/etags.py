@@ -0,0 +1,69 @@
+"""Strong ETags derived from the per-row ``version`` counters.
+
+A mission's representation embeds its targets, so its tag covers the
+mission's own version and the sum of its targets' versions. Targets are
+fixed at creation and versions only grow, so the sum changes whenever any
+target does.
+"""
+
+from typing import Callable, Optional
+
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+
+# Attempts for a write without If-Match whose version-checked UPDATE keeps
+# losing races with other writers.
+STALE_WRITE_ATTEMPTS = 3
+
+
+def spy_cat_etag(cat) -> str:
+    return f'"cat-{cat.id}-{cat.version}"'
+
+
+def mission_etag(mission) -> str:
+    target_versions = sum(target.version for target in mission.targets)
+    return f'"mission-{mission.id}-{mission.version}-{target_versions}"'
+
+
+def target_etag(target) -> str:
+    return f'"target-{target.id}-{target.version}"'
+
+
+def etag_matches(header: Optional[str], etag: str, weak: bool = False) -> bool:
+    """Whether an If-Match / If-None-Match header value matches ``etag``.
+
+    If-Match uses strong comparison, so ``W/`` tags never match it;
+    If-None-Match (``weak=True``) ignores the prefix.
+    """
+    if header is None:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            if not weak:
+                continue
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def retry_stale_writes(db: Session, attempt: Callable, if_match: Optional[str]):
+    """Run ``attempt()``, which reads the rows it changes and commits.
+
+    A ``StaleDataError`` means another request changed a row between the
+    read and the commit. With ``if_match`` the client's precondition no
+    longer holds: ``"version_conflict"`` (412). Without one the change is
+    re-applied to a fresh read, and ``"conflict"`` (409) is only returned if
+    every attempt loses the race.
+    """
+    for _ in range(STALE_WRITE_ATTEMPTS):
+        try:
+            return attempt()
+        except StaleDataError:
+            db.rollback()
+            if if_match is not None:
+                return "version_conflict"
+    return "conflict"
@@ -0,0 +1,107 @@
+"""Append-only event log behind the ``/events`` change feed.
+
+Mutations call ``record`` (or ``record_many``) before committing, so an
+event exists exactly when its change does. Sessions that wrote events wake
+the waiters of ``notifier`` once they commit.
+
+On SQLite writers are serialized, so events become visible in ``seq``
+order and "everything after my last seq" never skips one. A database with
+concurrent writers can commit a lower ``seq`` after a higher one is read.
+"""
+
+import asyncio
+import threading
+from typing import Iterable, List, Optional, Tuple
+
+from sqlalchemy import event, insert, select
+from sqlalchemy.orm import Session
+
+from db.models import Event
+
+_PENDING = "event_log_pending"
+
+
+def record(db: Session, type: str, entity_id: int, **data):
+    """Append one event to the session's transaction."""
+    db.add(Event(type=type, entity_id=entity_id, data=data))
+    db.info[_PENDING] = True
+
+
+def record_many(db: Session, events: Iterable[Tuple[str, int, dict]]):
+    """Append ``(type, entity_id, data)`` events with one executemany INSERT."""
+    rows = [
+        {"type": type, "entity_id": entity_id, "data": data}
+        for type, entity_id, data in events
+    ]
+    if rows:
+        db.execute(insert(Event), rows)
+        db.info[_PENDING] = True
+
+
+# Field order of schemas.Event.
+EVENT_COLUMNS = (Event.seq, Event.type, Event.entity_id, Event.data, Event.created_at)
+
+
+def list_events(
+    db: Session, after: int, limit: int
+) -> Tuple[List[dict], Optional[int]]:
+    """Events with ``seq > after`` in order, plus the next cursor if any remain."""
+    rows = db.execute(
+        select(*EVENT_COLUMNS)
+        .where(Event.seq > after)
+        .order_by(Event.seq)
+        .limit(limit + 1)
+    ).all()
+    events = [dict(row._mapping) for row in rows[:limit]]
+    next_cursor = events[-1]["seq"] if len(rows) > limit else None
+    return events, next_cursor
+
+
+class EventNotifier:
+    """Wakes asyncio waiters, on any event loop, from whichever thread commits."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._waiters = set()
+
+    def subscribe(self) -> asyncio.Future:
+        """A future resolved by the next ``notify``.
+
+        Subscribe *before* reading the log, so a commit landing between the
+        read and the wait is not missed; ``unsubscribe`` when done.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        with self._lock:
+            self._waiters.add((loop, future))
+        return future
+
+    def unsubscribe(self, future: asyncio.Future):
+        with self._lock:
+            self._waiters.discard((future.get_loop(), future))
+
+    def notify(self):
+        with self._lock:
+            waiters, self._waiters = self._waiters, set()
+        for loop, future in waiters:
+            if not loop.is_closed():
+                loop.call_soon_threadsafe(_wake, future)
+
+
+def _wake(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
+notifier = EventNotifier()
+
+
+@event.listens_for(Session, "after_commit")
+def _notify_after_commit(session):
+    if session.info.pop(_PENDING, False):
+        notifier.notify()
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending(session, previous_transaction):
+    session.info.pop(_PENDING, None)
@@ -0,0 +1,145 @@
+"""Idempotency keys for the create endpoints.
+
+The first request with a key claims it by inserting its row (the primary
+key makes the claim atomic across threads and workers), runs, and stores
+its response on the row in the transaction that inserts the entity, so
+either both are committed or neither is. A retry with the same key and body
+gets the stored response back without validation or inserts; one that
+arrives while the first is still running is told to retry later. Only
+successful responses are stored: a failed request releases its key so a
+retry runs again.
+"""
+
+import hashlib
+from datetime import timedelta
+
+from pydantic import BaseModel
+from sqlalchemy import and_, delete, insert, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+import config
+from db.database import SessionLocal
+from db.models import IdempotencyKey
+from services.clock import utcnow
+
+# Claiming can race with another request releasing, purging or taking over
+# the same key; a lost race starts over.
+CLAIM_ATTEMPTS = 3
+
+
+def request_hash(payload: BaseModel) -> str:
+    return hashlib.sha256(payload.model_dump_json().encode()).hexdigest()
+
+
+def _row(scope: str, key: str):
+    return and_(IdempotencyKey.scope == scope, IdempotencyKey.key == key)
+
+
+def _claim_values(request_hash: str) -> dict:
+    now = utcnow()
+    return {
+        "request_hash": request_hash,
+        "status_code": None,
+        "body": None,
+        "created_at": now,
+        "expires_at": now + timedelta(seconds=config.IDEMPOTENCY_KEY_TTL_SECONDS),
+    }
+
+
+def begin(db: Session, scope: str, key: str, request_hash: str):
+    """Claim ``key`` for a request with body hash ``request_hash``.
+
+    Returns the key's ``IdempotencyKey``: a claim the caller now owns and
+    must run the request for while ``status_code`` is None, otherwise the
+    stored response to replay. Or an error code: ``"mismatch"`` (the key
+    was used with another body) or ``"in_progress"`` (the first request with
+    the key is still running).
+    """
+    for _ in range(CLAIM_ATTEMPTS):
+        values = _claim_values(request_hash)
+        try:
+            db.execute(insert(IdempotencyKey).values(scope=scope, key=key, **values))
+            db.commit()
+            return IdempotencyKey(scope=scope, key=key, **values)
+        except IntegrityError:
+            db.rollback()
+        record = db.get(IdempotencyKey, (scope, key), populate_existing=True)
+        if record is None:
+            continue
+        now = utcnow()
+        stale = record.status_code is None and record.created_at <= now - timedelta(
+            seconds=config.IDEMPOTENCY_LOCK_SECONDS
+        )
+        if record.expires_at <= now or stale:
+            # Compare-and-set on created_at: of several requests taking over
+            # the same dead or expired key, one wins.
+            taken = db.execute(
+                update(IdempotencyKey)
+                .where(_row(scope, key), IdempotencyKey.created_at == record.created_at)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            ).rowcount
+            db.commit()
+            if taken:
+                return IdempotencyKey(scope=scope, key=key, **values)
+            continue
+        if record.request_hash != request_hash:
+            return "mismatch"
+        if record.status_code is None:
+            return "in_progress"
+        return record
+    return "in_progress"
+
+
+def _claimed(claim: IdempotencyKey):
+    # A claim taken over by another request has a newer created_at.
+    return and_(
+        _row(claim.scope, claim.key),
+        IdempotencyKey.created_at == claim.created_at,
+        IdempotencyKey.status_code.is_(None),
+    )
+
+
+def complete(db: Session, claim: IdempotencyKey, status_code: int, body: bytes):
+    """Store the response on ``claim`` in the caller's transaction.
+
+    Returns False, without writing, when the claim was taken over in the
+    meantime; the caller must then roll back what it inserted.
+    """
+    stored = db.execute(
+        update(IdempotencyKey)
+        .where(_claimed(claim))
+        .values(status_code=status_code, body=body)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    return stored == 1
+
+
+def release(db: Session, claim: IdempotencyKey):
+    """Roll back and forget ``claim``, so a retry runs the request again."""
+    db.rollback()
+    db.execute(
+        delete(IdempotencyKey)
+        .where(_claimed(claim))
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+
+
+def purge_expired(db: Session) -> int:
+    deleted = db.execute(
+        delete(IdempotencyKey)
+        .where(IdempotencyKey.expires_at <= utcnow())
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.commit()
+    return deleted
+
+
+def run_purge() -> int:
+    db = SessionLocal()
+    try:
+        return purge_expired(db)
+    finally:
+        db.close()
@@ -0,0 +1,16 @@
+import asyncio
+from typing import Callable
+
+from starlette.concurrency import run_in_threadpool
+
+
+async def run_periodically(interval: float, job: Callable):
+    """Lifespan task: run the sync ``job`` every ``interval`` seconds until
+    cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await run_in_threadpool(job)
+        except Exception:
+            # Like a failed catalog refresh: retried on the next tick.
+            pass
@@ -0,0 +1,277 @@
+"""In-process metrics rendered in the Prometheus text format.
+
+Metrics are fixed-bucket histograms guarded by a lock, so recording one costs
+a bisect and a few additions. SQL statements are timed
+through engine events (see ``instrument_engine``) and attributed to the HTTP
+request running in the current context, which the metrics middleware opens
+with ``start_request`` and closes with ``finish_request``.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+
+import config
+
+LATENCY_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+SQL_LATENCY_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.05, 0.25)
+STATEMENT_COUNT_BUCKETS = (0, 1, 2, 3, 5, 10, 25, 50, 100)
+
+SQL_OPERATIONS = frozenset({"SELECT", "INSERT", "UPDATE", "DELETE"})
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", r"\\").replace('"', r"\"").replace("\n", r"\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """Fixed-bucket histogram; buckets are cumulated only when rendered."""
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series: Dict[Tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = self._series[labelvalues] = [[0] * (len(self.buckets) + 1), 0]
+            series[0][index] += 1
+            series[1] += value
+
+    def count(self, *labelvalues) -> int:
+        series = self._series.get(labelvalues)
+        return sum(series[0]) if series else 0
+
+    def sum(self, *labelvalues) -> float:
+        series = self._series.get(labelvalues)
+        return series[1] if series else 0
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+    def collect(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            series = [
+                (key, list(counts), total)
+                for key, (counts, total) in self._series.items()
+            ]
+        bucket_names = self.labelnames + ("le",)
+        for labelvalues, counts, total in sorted(series):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                labels = _format_labels(
+                    bucket_names, labelvalues + (_format_value(bound),)
+                )
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, labelvalues)
+            lines.append(f"{self.name}_sum{labels} {_format_value(float(total))}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def clear(self):
+        for metric in self._metrics:
+            metric.clear()
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.collect())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry(enabled=config.METRICS_ENABLED)
+
+REQUEST_DURATION = registry.register(
+    Histogram(
+        "spycats_http_request_duration_seconds",
+        "Time spent handling HTTP requests, by route template.",
+        ("method", "route", "status"),
+    )
+)
+REQUEST_SQL_STATEMENTS = registry.register(
+    Histogram(
+        "spycats_http_request_sql_statements",
+        "SQL statements executed per HTTP request.",
+        ("method", "route"),
+        STATEMENT_COUNT_BUCKETS,
+    )
+)
+REQUEST_SQL_DURATION = registry.register(
+    Histogram(
+        "spycats_http_request_sql_duration_seconds",
+        "Time spent executing SQL per HTTP request.",
+        ("method", "route"),
+    )
+)
+SQL_STATEMENT_DURATION = registry.register(
+    Histogram(
+        "spycats_sql_statement_duration_seconds",
+        "Duration of individual SQL statements, by operation.",
+        ("operation",),
+        SQL_LATENCY_BUCKETS,
+    )
+)
+BREED_VALIDATION_DURATION = registry.register(
+    Histogram(
+        "spycats_breed_validation_duration_seconds",
+        "Time spent in validate_breed, including any catalog fetch it waits on.",
+    )
+)
+EXTERNAL_CALL_DURATION = registry.register(
+    Histogram(
+        "spycats_external_call_duration_seconds",
+        "Duration of calls to external services.",
+        ("service", "outcome"),
+    )
+)
+
+SCHEDULER_PHASE_DURATION = registry.register(
+    Histogram(
+        "spycats_scheduler_phase_duration_seconds",
+        "Time spent in each phase of POST /missions/schedule, by policy.",
+        ("phase", "policy"),
+    )
+)
+
+
+class RequestStats:
+    __slots__ = ("statements", "sql_seconds")
+
+    def __init__(self):
+        self.statements = 0
+        self.sql_seconds = 0.0
+
+
+# Shared by reference with the worker threads and greenlets serving the
+# request, since they run in copies of the request's context.
+_current_request: ContextVar[Optional[RequestStats]] = ContextVar(
+    "current_request", default=None
+)
+
+
+def start_request():
+    return _current_request.set(RequestStats())
+
+
+def finish_request(token, method: str, route: str, status: int, seconds: float):
+    stats = _current_request.get()
+    _current_request.reset(token)
+    REQUEST_DURATION.observe(seconds, method, route, status)
+    REQUEST_SQL_STATEMENTS.observe(stats.statements, method, route)
+    REQUEST_SQL_DURATION.observe(stats.sql_seconds, method, route)
+
+
+@contextmanager
+def timed(histogram: Histogram, *labelvalues):
+    if not registry.enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        histogram.observe(time.perf_counter() - start, *labelvalues)
+
+
+@contextmanager
+def external_call(service: str):
+    """Time a call to ``service``, labelled by whether it raised."""
+    if not registry.enabled:
+        yield
+        return
+    start = time.perf_counter()
+    outcome = "error"
+    try:
+        yield
+        outcome = "ok"
+    finally:
+        EXTERNAL_CALL_DURATION.observe(time.perf_counter() - start, service, outcome)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    if registry.enabled and context is not None:
+        context._metrics_start = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    start = getattr(context, "_metrics_start", None)
+    if start is None:
+        return
+    elapsed = time.perf_counter() - start
+    operation = statement.lstrip()[:6].upper()
+    if operation not in SQL_OPERATIONS:
+        operation = "OTHER"
+    SQL_STATEMENT_DURATION.observe(elapsed, operation)
+    stats = _current_request.get()
+    if stats is not None:
+        stats.statements += 1
+        stats.sql_seconds += elapsed
+
+
+def instrument_engine(engine):
+    """Time every statement run on ``engine`` (a sync Engine).
+
+    Listeners are only attached when metrics are enabled at startup; turning
+    ``registry.enabled`` off later makes them no-ops.
+    """
+    if not registry.enabled:
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
@@ -1,38 +1,286 @@
-from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import and_, case, func, insert, null, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased, joinedload
 from db.models import Mission, Target, SpyCat
-from db.schemas import MissionCreate, MissionUpdate, MissionAssign, TargetUpdate
+from db.schemas import (
+    MissionCreate,
+    MissionUpdate,
+    MissionAssign,
+    TargetBatchUpdate,
+    TargetUpdate,
+)
+from services.clock import utcnow
+from services.etags import (
+    etag_matches,
+    mission_etag,
+    retry_stale_writes,
+    target_etag,
+)
+from services.event_log import record, record_many
+from services.pagination import paginate
+from services.response_cache import response_cache
+import config
+
+# Mission payloads always nest their targets, so every read path below loads
+# them eagerly: lists and exports fetch target rows with one extra IN query
+# per page or batch, single missions use joinedload (one query in total).
+
 
+def completion_time(complete: bool) -> Optional[datetime]:
+    return utcnow() if complete else None
 
-def create_mission(db: Session, mission: MissionCreate) -> Mission:
-    db_mission = Mission(complete=mission.complete)
+
+def add_mission(db: Session, mission: MissionCreate) -> Mission:
+    """Insert ``mission``, its targets and its event in the session's
+    transaction, uncommitted; returns it loaded through ``get_mission``."""
+    db_mission = Mission(
+        complete=mission.complete,
+        completed_at=completion_time(mission.complete),
+        targets_total=len(mission.targets),
+        targets_completed=sum(target.complete for target in mission.targets),
+        targets=[Target(**target_data.model_dump()) for target_data in mission.targets],
+    )
     db.add(db_mission)
-    db.commit()
-    db.refresh(db_mission)
+    db.flush()
+    mission_id = db_mission.id
+    record(
+        db,
+        "mission.created",
+        mission_id,
+        complete=db_mission.complete,
+        targets_total=db_mission.targets_total,
+    )
+    return get_mission(db, mission_id)
+
 
-    for target_data in mission.targets:
-        db_target = Target(mission_id=db_mission.id, **target_data.model_dump())
-        db.add(db_target)
+def bulk_create_missions(db: Session, missions: List[MissionCreate]) -> List[int]:
+    """Insert missions and their targets in one transaction.
 
+    Uses two executemany INSERTs (missions with RETURNING, then targets)
+    instead of flushing ORM objects one by one. Returns ids in input order.
+    """
+    if not missions:
+        return []
+    rows = [
+        {
+            "complete": mission.complete,
+            "completed_at": completion_time(mission.complete),
+            "targets_total": len(mission.targets),
+            "targets_completed": sum(t.complete for t in mission.targets),
+        }
+        for mission in missions
+    ]
+    mission_ids = (
+        db.execute(
+            insert(Mission).returning(Mission.id, sort_by_parameter_order=True), rows
+        )
+        .scalars()
+        .all()
+    )
+    db.execute(
+        insert(Target),
+        [
+            {"mission_id": mission_id, **target.model_dump()}
+            for mission_id, mission in zip(mission_ids, missions)
+            for target in mission.targets
+        ],
+    )
+    record_many(
+        db,
+        (
+            (
+                "mission.created",
+                mission_id,
+                {"complete": row["complete"], "targets_total": row["targets_total"]},
+            )
+            for mission_id, row in zip(mission_ids, rows)
+        ),
+    )
     db.commit()
-    db.refresh(db_mission)
-    return db_mission
+    return mission_ids
+
+
+# List and export responses are built from these columns as plain dicts, in
+# the field order of schemas.Mission / schemas.Target, skipping ORM objects
+# and Pydantic validation.
+MISSION_COLUMNS = (
+    Mission.complete,
+    Mission.id,
+    Mission.cat_id,
+    Mission.targets_total,
+    Mission.targets_completed,
+)
+TARGET_COLUMNS = (
+    Target.name,
+    Target.country,
+    Target.notes,
+    Target.complete,
+    Target.id,
+    Target.mission_id,
+)
+
+
+def targets_query(mission_ids: List[int]):
+    return (
+        select(*TARGET_COLUMNS)
+        .where(Target.mission_id.in_(mission_ids))
+        .order_by(Target.id)
+    )
+
+
+def mission_documents(mission_rows, target_rows) -> list:
+    """Nest target rows under their mission rows as plain dicts."""
+    missions = [dict(row._mapping, targets=[]) for row in mission_rows]
+    by_id = {mission["id"]: mission for mission in missions}
+    for row in target_rows:
+        by_id[row.mission_id]["targets"].append(dict(row._mapping))
+    return missions
+
 
+def missions_query(
+    limit: int,
+    cursor: Optional[int] = None,
+    complete: Optional[bool] = None,
+    cat_id: Optional[int] = None,
+    breed: Optional[str] = None,
+    country: Optional[str] = None,
+):
+    query = select(*MISSION_COLUMNS).order_by(Mission.id)
+    if cursor is not None:
+        query = query.where(Mission.id > cursor)
+    if complete is not None:
+        query = query.where(Mission.complete == complete)
+    if cat_id is not None:
+        query = query.where(Mission.cat_id == cat_id)
+    if breed is not None:
+        query = query.where(Mission.cat.has(func.lower(SpyCat.breed) == breed.lower()))
+    if country is not None:
+        query = query.where(Mission.targets.any(Target.country == country))
+    return query.limit(limit + 1)
+
+
+def list_missions(db: Session, limit: int, cursor: Optional[int] = None, **filters):
+    """One page of missions with targets as plain dicts, plus the next cursor.
+
+    Two queries per page: the missions, then their targets by IN.
+    """
+    rows, next_cursor = paginate(
+        db.execute(missions_query(limit, cursor, **filters)).all(), limit
+    )
+    targets = db.execute(targets_query([row.id for row in rows])).all() if rows else []
+    return mission_documents(rows, targets), next_cursor
 
-def list_missions(db: Session):
-    return db.query(Mission).all()
 
+def iter_missions(db: Session, since_id: Optional[int] = None):
+    """Stream every mission after ``since_id`` with targets, batch by batch."""
+    query = (
+        select(*MISSION_COLUMNS)
+        .order_by(Mission.id)
+        .execution_options(yield_per=config.EXPORT_BATCH_SIZE)
+    )
+    if since_id is not None:
+        query = query.where(Mission.id > since_id)
+    for rows in db.execute(query).partitions():
+        targets = db.execute(targets_query([row.id for row in rows])).all()
+        yield from mission_documents(rows, targets)
+
+
+def get_mission(db: Session, mission_id: int, refresh: bool = False):
+    """Load a mission with its targets.
+
+    ``refresh`` overwrites a copy already in the session, which is needed
+    after a Core UPDATE on sessions that do not expire on commit (the async
+    ones).
+    """
+    query = (
+        select(Mission)
+        .options(joinedload(Mission.targets))
+        .where(Mission.id == mission_id)
+    )
+    if refresh:
+        query = query.execution_options(populate_existing=True)
+    return db.execute(query).unique().scalar_one_or_none()
 
-def get_mission(db: Session, mission_id: int):
-    return db.query(Mission).filter(Mission.id == mission_id).first()
 
+def mission_summary(db: Session) -> dict:
+    """Aggregate mission progress from the counters on ``missions`` alone."""
+    active = Mission.complete == False
+    totals = db.execute(
+        select(
+            func.count(),
+            func.coalesce(func.sum(case((active, 1), else_=0)), 0),
+            func.coalesce(
+                func.sum(case((and_(active, Mission.cat_id.is_(None)), 1), else_=0)), 0
+            ),
+            func.coalesce(func.sum(Mission.targets_total), 0),
+            func.coalesce(func.sum(Mission.targets_completed), 0),
+        )
+    ).one()
+    per_cat = db.execute(
+        select(
+            Mission.cat_id,
+            func.count(),
+            func.sum(Mission.targets_total),
+            func.sum(Mission.targets_completed),
+        )
+        .where(Mission.cat_id.isnot(None), active)
+        .group_by(Mission.cat_id)
+        .order_by(Mission.cat_id)
+    ).all()
+    total, active_count, unassigned, targets_total, targets_completed = totals
+    return {
+        "total": total,
+        "active": active_count,
+        "complete": total - active_count,
+        "unassigned_active": unassigned,
+        "targets_total": targets_total,
+        "targets_completed": targets_completed,
+        "per_cat": [
+            {
+                "cat_id": cat_id,
+                "active_missions": missions,
+                "targets_total": cat_targets,
+                "targets_completed": cat_completed,
+            }
+            for cat_id, missions, cat_targets, cat_completed in per_cat
+        ],
+    }
 
-def update_mission(db: Session, mission_id: int, mission_update: MissionUpdate):
+
+def update_mission(
+    db: Session,
+    mission_id: int,
+    mission_update: MissionUpdate,
+    if_match: Optional[str] = None,
+):
+    return retry_stale_writes(
+        db,
+        lambda: _update_mission(db, mission_id, mission_update, if_match),
+        if_match,
+    )
+
+
+def _update_mission(
+    db: Session,
+    mission_id: int,
+    mission_update: MissionUpdate,
+    if_match: Optional[str],
+):
     mission = get_mission(db, mission_id)
     if not mission:
         return None
+    if if_match is not None and not etag_matches(if_match, mission_etag(mission)):
+        return "version_conflict"
 
     if mission_update.complete is not None:
         if mission_update.complete:
+            if not mission.complete:
+                record(db, "mission.completed", mission_id, cat_id=mission.cat_id)
+                mission.completed_by = mission.cat_id
+                mission.completed_at = utcnow()
             mission.complete = True
             mission.cat_id = None
         else:
@@ -50,11 +298,21 @@ def update_mission(db: Session, mission_id: int, mission_update: MissionUpdate):
                 if existing_mission:
                     return "cat_conflict"
 
+            if mission.complete:
+                record(db, "mission.reopened", mission_id, cat_id=mission.cat_id)
             mission.complete = False
+            mission.completed_by = None
+            mission.completed_at = None
 
-    db.commit()
-    db.refresh(mission)
-    return mission
+    try:
+        db.commit()
+    except IntegrityError:
+        # uq_missions_active_cat: another request activated a mission for
+        # this cat between our check and the commit.
+        db.rollback()
+        return "cat_conflict"
+    response_cache.invalidate("mission", mission_id)
+    return get_mission(db, mission_id)
 
 
 def delete_mission(db: Session, mission_id: int):
@@ -63,59 +321,235 @@ def delete_mission(db: Session, mission_id: int):
         return None
     if mission.cat_id is not None:
         return "assigned"
+    record(db, "mission.deleted", mission_id)
     db.delete(mission)
     db.commit()
+    response_cache.invalidate("mission", mission_id)
     return True
 
 
-def assign_cat_to_mission(db: Session, mission_id: int, assignment: MissionAssign):
-    mission = get_mission(db, mission_id)
-    if not mission:
-        return None, "mission_not_found"
-
-    cat = db.query(SpyCat).filter(SpyCat.id == assignment.cat_id).first()
-    if not cat:
-        return None, "cat_not_found"
+def assign_cat_to_mission(
+    db: Session,
+    mission_id: int,
+    assignment: MissionAssign,
+    if_match: Optional[str] = None,
+):
+    """Assign a cat with one conditional UPDATE.
 
-    existing_mission = (
-        db.query(Mission)
-        .filter(Mission.cat_id == assignment.cat_id, Mission.complete == False)
-        .first()
+    The existence and "no other active mission" checks are part of the
+    UPDATE's WHERE clause, so check and write happen atomically; the partial
+    unique index uq_missions_active_cat backs this up on databases where the
+    subquery could race. The extra lookups only run to explain a refusal.
+    With ``if_match`` the mission is read first and the UPDATE is also
+    conditional on the version that was checked.
+    """
+    expected_version = None
+    if if_match is not None:
+        mission = get_mission(db, mission_id)
+        if mission is None:
+            return None, "mission_not_found"
+        if not etag_matches(if_match, mission_etag(mission)):
+            return None, "version_conflict"
+        expected_version = mission.version
+    active = aliased(Mission)
+    cat_exists = select(SpyCat.id).where(SpyCat.id == assignment.cat_id).exists()
+    cat_is_busy = (
+        select(active.id)
+        .where(active.cat_id == assignment.cat_id, active.complete == False)
+        .exists()
     )
+    statement = (
+        update(Mission)
+        .where(Mission.id == mission_id, cat_exists, ~cat_is_busy)
+        .values(cat_id=assignment.cat_id, version=Mission.version + 1)
+        .execution_options(synchronize_session=False)
+    )
+    if expected_version is not None:
+        statement = statement.where(Mission.version == expected_version)
+    try:
+        assigned = db.execute(statement).rowcount == 1
+        if assigned:
+            record(db, "mission.assigned", mission_id, cat_id=assignment.cat_id)
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        assigned = False
 
-    if existing_mission:
+    if not assigned:
+        mission = db.get(Mission, mission_id)
+        if mission is None:
+            return None, "mission_not_found"
+        if expected_version is not None and mission.version != expected_version:
+            return None, "version_conflict"
+        if db.get(SpyCat, assignment.cat_id) is None:
+            return None, "cat_not_found"
         return None, "cat_conflict"
+    response_cache.invalidate("mission", mission_id)
+    return get_mission(db, mission_id, refresh=True), None
 
-    mission.cat_id = assignment.cat_id
-    db.commit()
-    db.refresh(mission)
-    return mission, None
+
+def record_target_progress(mission_id: int, delta: int):
+    """UPDATE moving a mission's completed-target counter by ``delta``.
+
+    The counter is incremented in SQL so concurrent target updates cannot
+    lose each other's changes. With MISSION_AUTO_COMPLETE, the statement that
+    completes the last target also completes the mission and frees its cat,
+    moving it to ``completed_by``.
+    Returns the mission's ``complete`` flag after the update.
+    """
+    completed = Mission.targets_completed + delta
+    values = {"targets_completed": completed, "version": Mission.version + 1}
+    if config.MISSION_AUTO_COMPLETE and delta > 0:
+        done = and_(completed >= Mission.targets_total, Mission.complete == False)
+        values["complete"] = case((done, True), else_=Mission.complete)
+        values["cat_id"] = case((done, null()), else_=Mission.cat_id)
+        values["completed_by"] = case(
+            (done, Mission.cat_id), else_=Mission.completed_by
+        )
+        values["completed_at"] = case((done, utcnow()), else_=Mission.completed_at)
+    return (
+        update(Mission)
+        .where(Mission.id == mission_id)
+        .values(**values)
+        .returning(Mission.complete)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def apply_target_progress(db: Session, mission: Mission, delta: int):
+    """Run ``record_target_progress`` and log an automatic completion."""
+    completed = db.execute(record_target_progress(mission.id, delta)).scalar_one()
+    if completed and not mission.complete:
+        record(
+            db, "mission.completed", mission.id, cat_id=mission.cat_id, automatic=True
+        )
+
+
+def target_event(db: Session, target: Target, target_update: TargetUpdate):
+    """Log the fields of ``target_update`` that change ``target``."""
+    changes = {
+        field: value
+        for field, value in target_update.model_dump(
+            include={"notes", "complete"}, exclude_none=True
+        ).items()
+        if getattr(target, field) != value
+    }
+    if changes:
+        record(db, "target.updated", target.id, mission_id=target.mission_id, **changes)
 
 
 def update_target(
-    db: Session, mission_id: int, target_id: int, target_update: TargetUpdate
+    db: Session,
+    mission_id: int,
+    target_id: int,
+    target_update: TargetUpdate,
+    if_match: Optional[str] = None,
 ):
-    mission = get_mission(db, mission_id)
-    if not mission:
-        return None, "mission_not_found"
-
-    target = (
-        db.query(Target)
-        .filter(Target.id == target_id, Target.mission_id == mission_id)
-        .first()
+    """Update one target. ``if_match`` may be the parent mission's ETag (from
+    ``GET /missions/{id}``) or the target's own (from a previous PATCH)."""
+    result = retry_stale_writes(
+        db,
+        lambda: _update_target(db, mission_id, target_id, target_update, if_match),
+        if_match,
     )
+    return (None, result) if isinstance(result, str) else result
+
 
-    if not target:
+def _update_target(
+    db: Session,
+    mission_id: int,
+    target_id: int,
+    target_update: TargetUpdate,
+    if_match: Optional[str],
+):
+    query = (
+        select(Target)
+        .options(joinedload(Target.mission))
+        .where(Target.id == target_id, Target.mission_id == mission_id)
+    )
+    target = db.execute(query).scalar_one_or_none()
+    if target is None:
+        if db.get(Mission, mission_id) is None:
+            return None, "mission_not_found"
         return None, "target_not_found"
+    mission = target.mission
+    if if_match is not None and not (
+        etag_matches(if_match, mission_etag(mission))
+        or etag_matches(if_match, target_etag(target))
+    ):
+        return None, "version_conflict"
 
     if target_update.notes is not None:
         if target.complete or mission.complete:
             return None, "cannot_update_notes"
+
+    target_event(db, target, target_update)
+    if target_update.notes is not None:
         target.notes = target_update.notes
 
     if target_update.complete is not None:
+        if target_update.complete != target.complete:
+            apply_target_progress(db, mission, 1 if target_update.complete else -1)
         target.complete = target_update.complete
 
     db.commit()
+    # Missions embed their targets, so the cached parent is stale too.
+    response_cache.invalidate("mission", mission_id)
     db.refresh(target)
     return target, None
+
+
+def update_targets(
+    db: Session,
+    mission_id: int,
+    updates: List[TargetBatchUpdate],
+    if_match: Optional[str] = None,
+):
+    """Apply several target updates against one loaded mission, atomically.
+
+    Every update is validated before anything changes, with the notes lock
+    judged on the state before the batch, as ``update_target`` does for one.
+    """
+    result = retry_stale_writes(
+        db, lambda: _update_targets(db, mission_id, updates, if_match), if_match
+    )
+    return (None, result) if isinstance(result, str) else result
+
+
+def _update_targets(
+    db: Session,
+    mission_id: int,
+    updates: List[TargetBatchUpdate],
+    if_match: Optional[str],
+):
+    mission = get_mission(db, mission_id)
+    if not mission:
+        return None, "mission_not_found"
+    if if_match is not None and not etag_matches(if_match, mission_etag(mission)):
+        return None, "version_conflict"
+
+    targets = {target.id: target for target in mission.targets}
+    if len({update.id for update in updates}) != len(updates):
+        return None, "duplicate_target"
+    for target_update in updates:
+        target = targets.get(target_update.id)
+        if target is None:
+            return None, "target_not_found"
+        if target_update.notes is not None and (target.complete or mission.complete):
+            return None, "cannot_update_notes"
+
+    delta = 0
+    for target_update in updates:
+        target = targets[target_update.id]
+        target_event(db, target, target_update)
+        if target_update.notes is not None:
+            target.notes = target_update.notes
+        if target_update.complete is not None:
+            delta += target_update.complete - target.complete
+            target.complete = target_update.complete
+    if delta:
+        apply_target_progress(db, mission, delta)
+
+    db.commit()
+    response_cache.invalidate("mission", mission_id)
+    return get_mission(db, mission_id, refresh=True), None
@@ -0,0 +1,10 @@
+def paginate(rows: list, limit: int):
+    """Trim a ``limit + 1`` keyset page and return ``(rows, next_cursor)``.
+
+    Queries fetch one extra row ordered by id; if it comes back there is a
+    next page, which starts after the last id returned.
+    """
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, rows[-1].id
+    return rows, None
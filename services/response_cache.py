@@ -0,0 +1,198 @@
+import struct
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import config
+from services.cache_stamps import SharedStamps
+
+
+class MemoryBackend:
+    """Thread-safe LRU of serialized bodies with a per-entry TTL."""
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: bytes):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, *keys: str):
+        with self._lock:
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class RedisBackend:
+    """Shared cache in a Redis-compatible server; entries expire server-side."""
+
+    PREFIX = "spycats:response:"
+
+    def __init__(self, url: str, ttl: float):
+        import redis
+
+        self.ttl = ttl
+        self._client = redis.Redis.from_url(url)
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(self.PREFIX + key)
+
+    def set(self, key: str, value: bytes):
+        self._client.set(self.PREFIX + key, value, px=int(self.ttl * 1000))
+
+    def delete(self, *keys: str):
+        if keys:
+            self._client.delete(*(self.PREFIX + key for key in keys))
+
+    def clear(self):
+        for key in self._client.scan_iter(match=self.PREFIX + "*"):
+            self._client.delete(key)
+
+
+class ResponseCache:
+    """Serialized JSON responses keyed by entity kind and id.
+
+    Writers invalidate after committing. A reader that missed takes a
+    ``token()`` before querying and passes it to ``set``; if any invalidation
+    happened in between, the possibly stale body is not stored.
+
+    With ``stamps`` (several workers, each with its own memory backend) the
+    token and the validity of stored entries also cover invalidations made
+    by the other workers; see ``services.cache_stamps``.
+    """
+
+    STAMP = struct.Struct("<Q")
+
+    def __init__(self, backend=None, stamps: Optional[SharedStamps] = None):
+        self.backend = backend
+        self.stamps = stamps
+        self._lock = threading.Lock()
+        self._epoch = 0
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.backend is not None
+
+    @staticmethod
+    def key(kind: str, id: int) -> str:
+        return f"{kind}:{id}"
+
+    def token(self):
+        if self.stamps is None:
+            return self._epoch
+        return self._epoch, self.stamps.epoch()
+
+    def get(self, kind: str, id: int) -> Optional[bytes]:
+        if self.backend is None:
+            return None
+        key = self.key(kind, id)
+        value = self.backend.get(key)
+        if value is not None and self.stamps is not None:
+            stamp = self.STAMP.unpack_from(value)[0]
+            if stamp == self.stamps.read(self.stamps.slot(key)):
+                value = value[self.STAMP.size :]
+            else:
+                # Invalidated by another worker.
+                self.backend.delete(key)
+                value = None
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, kind: str, id: int, value: bytes, token):
+        if self.backend is None:
+            return
+        key = self.key(kind, id)
+        if self.stamps is not None:
+            # Read before the token check (see SharedStamps.bump).
+            value = self.STAMP.pack(self.stamps.read(self.stamps.slot(key))) + value
+        with self._lock:
+            if token != self.token():
+                return
+            self.backend.set(key, value)
+
+    def invalidate(self, kind: str, *ids: int):
+        if self.backend is None or not ids:
+            return
+        keys = [self.key(kind, id) for id in ids]
+        with self._lock:
+            self._epoch += 1
+            self.invalidations += len(ids)
+            self.backend.delete(*keys)
+            if self.stamps is not None:
+                self.stamps.bump(self.stamps.slot(key) for key in keys)
+
+    def clear(self):
+        if self.backend is not None:
+            self.backend.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        stats = {
+            "backend": type(self.backend).__name__ if self.backend else None,
+            "shared_stamps": self.stamps.path if self.stamps else None,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+            "invalidations": self.invalidations,
+        }
+        if isinstance(self.backend, MemoryBackend):
+            stats["entries"] = len(self.backend)
+        return stats
+
+
+def build_backend(name: str):
+    if name == "memory":
+        return MemoryBackend(
+            config.RESPONSE_CACHE_MAX_ENTRIES, config.RESPONSE_CACHE_TTL_SECONDS
+        )
+    if name == "redis":
+        return RedisBackend(config.REDIS_URL, config.RESPONSE_CACHE_TTL_SECONDS)
+    if name == "none":
+        return None
+    raise ValueError(f"Unknown RESPONSE_CACHE_BACKEND: {name}")
+
+
+def build_stamps(backend) -> Optional[SharedStamps]:
+    """Stamps for per-worker memory caches; shared backends need none."""
+    if not isinstance(backend, MemoryBackend) or not config.RESPONSE_CACHE_STAMP_PATH:
+        return None
+    return SharedStamps(
+        config.RESPONSE_CACHE_STAMP_PATH, config.RESPONSE_CACHE_STAMP_SLOTS
+    )
+
+
+_backend = build_backend(config.RESPONSE_CACHE_BACKEND)
+response_cache = ResponseCache(_backend, build_stamps(_backend))
@@ -0,0 +1,142 @@
+"""Batch assignment of idle cats to unassigned missions.
+
+The scheduler reads candidates with two set-based queries (idle cats in
+policy order, then the oldest unassigned missions, no more of them than
+there are cats), pairs them in order, and writes every assignment with one
+executemany UPDATE in a single transaction. A policy is just the ORDER BY
+of the idle-cats query; add one to ``POLICIES`` to make it available.
+"""
+
+import time
+from typing import Optional
+
+from sqlalchemy import and_, bindparam, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, aliased
+
+from db.models import Mission, SpyCat
+from services.event_log import record_many
+from services.metrics import SCHEDULER_PHASE_DURATION, registry
+from services.response_cache import response_cache
+
+POLICIES = {
+    # Cats that joined first take the oldest missions.
+    "fifo": (SpyCat.id,),
+    "experience": (SpyCat.years_of_experience.desc(), SpyCat.id),
+    # The cheapest cats go out first, minimizing the payroll of the batch.
+    "cost": (SpyCat.salary, SpyCat.id),
+}
+
+missions_table = Mission.__table__
+
+
+def idle_cats_query(policy: str, limit: Optional[int] = None):
+    active = aliased(Mission)
+    busy = (
+        select(active.id)
+        .where(active.cat_id == SpyCat.id, active.complete == False)
+        .exists()
+    )
+    query = select(SpyCat.id).where(~busy).order_by(*POLICIES[policy])
+    return query.limit(limit) if limit is not None else query
+
+
+def unassigned_missions_query(limit: int):
+    return (
+        select(Mission.id)
+        .where(Mission.cat_id.is_(None), Mission.complete == False)
+        .order_by(Mission.id)
+        .limit(limit)
+    )
+
+
+def assign_statement():
+    # Re-checks that each mission is still open and unassigned; a cat taken
+    # by a concurrent assignment trips uq_missions_active_cat instead.
+    table = missions_table
+    return (
+        update(table)
+        .where(
+            and_(
+                table.c.id == bindparam("mission_id"),
+                table.c.cat_id.is_(None),
+                table.c.complete == False,
+            )
+        )
+        .values(cat_id=bindparam("new_cat_id"), version=table.c.version + 1)
+    )
+
+
+class _Timer:
+    def __init__(self, policy: str):
+        self.policy = policy
+        self.timings = {}
+        self._last = time.perf_counter()
+
+    def lap(self, phase: str):
+        now = time.perf_counter()
+        elapsed, self._last = now - self._last, now
+        self.timings[f"{phase}_ms"] = round(elapsed * 1000, 3)
+        if registry.enabled:
+            SCHEDULER_PHASE_DURATION.observe(elapsed, phase, self.policy)
+
+
+def schedule_missions(
+    db: Session,
+    policy: str = "fifo",
+    dry_run: bool = False,
+    limit: Optional[int] = None,
+):
+    """Match idle cats to unassigned missions; returns a result dict or a code.
+
+    Error codes: ``"unknown_policy"``, and ``"conflict"`` when a concurrent
+    request assigned one of the chosen cats or missions first, in which
+    case nothing was written and the call can simply be retried.
+    """
+    if policy not in POLICIES:
+        return "unknown_policy"
+    timer = _Timer(policy)
+    cat_ids = db.execute(idle_cats_query(policy, limit)).scalars().all()
+    timer.lap("select_cats")
+    mission_ids = []
+    if cat_ids:
+        mission_ids = (
+            db.execute(unassigned_missions_query(len(cat_ids))).scalars().all()
+        )
+    timer.lap("select_missions")
+    pairs = list(zip(mission_ids, cat_ids))
+    timer.lap("match")
+
+    if pairs and not dry_run:
+        try:
+            assigned = db.execute(
+                assign_statement(),
+                [{"mission_id": m, "new_cat_id": c} for m, c in pairs],
+            ).rowcount
+            if assigned != len(pairs):
+                db.rollback()
+                return "conflict"
+            record_many(
+                db,
+                (
+                    ("mission.assigned", m, {"cat_id": c, "policy": policy})
+                    for m, c in pairs
+                ),
+            )
+            db.commit()
+        except IntegrityError:
+            db.rollback()
+            return "conflict"
+        response_cache.invalidate("mission", *mission_ids)
+        timer.lap("commit")
+
+    return {
+        "policy": policy,
+        "dry_run": dry_run,
+        "idle_cats": len(cat_ids),
+        "missions_considered": len(mission_ids),
+        "assignments": [
+            {"mission_id": mission_id, "cat_id": cat_id} for mission_id, cat_id in pairs
+        ],
+        "timings": timer.timings,
+    }
@@ -0,0 +1,70 @@
+import re
+from typing import Optional
+
+from sqlalchemy import column, func, literal_column, select, table
+from sqlalchemy.orm import Session
+
+from db.migrations import TARGETS_FTS, has_search_index
+from db.models import Target
+from services.mission_service import TARGET_COLUMNS
+
+# bm25 weights for the name, country and notes columns: a hit in the target
+# name outranks the same hit buried in the notes.
+COLUMN_WEIGHTS = (10.0, 2.0, 1.0)
+SNIPPET_TOKENS = 12
+
+_TERM = re.compile(r"(\w+)(\*?)")
+
+targets_fts = table(TARGETS_FTS, column("rowid"))
+_fts = literal_column(TARGETS_FTS)
+
+
+def fts_query(q: str) -> Optional[str]:
+    """Turn user input into an FTS5 query matching every term.
+
+    Terms are quoted so FTS5 operators and punctuation in the input are taken
+    literally; a trailing ``*`` makes a term a prefix query (``infil*``).
+    Returns None when the input has no searchable terms.
+    """
+    terms = [f'"{word}"{star}' for word, star in _TERM.findall(q) if word.strip("_")]
+    return " ".join(terms) or None
+
+
+def search_targets(
+    db: Session,
+    q: str,
+    limit: int,
+    cursor: Optional[int] = None,
+    country: Optional[str] = None,
+):
+    """Rank targets matching ``q`` by bm25 over name, country and notes.
+
+    ``cursor`` is the number of results already seen, since ranked results
+    have no stable key to page on. Returns ``(hits, next_cursor)`` or an
+    error code: ``"search_unavailable"`` without an FTS5 index,
+    ``"invalid_query"`` when ``q`` has no searchable terms.
+    """
+    if not has_search_index(db.connection()):
+        return "search_unavailable"
+    match = fts_query(q)
+    if match is None:
+        return "invalid_query"
+    rank = func.bm25(_fts, *COLUMN_WEIGHTS)
+    offset = cursor or 0
+    query = (
+        select(
+            *TARGET_COLUMNS,
+            (-rank).label("score"),
+            func.snippet(_fts, -1, "[", "]", "…", SNIPPET_TOKENS).label("snippet"),
+        )
+        .join(targets_fts, targets_fts.c.rowid == Target.id)
+        .where(_fts.op("MATCH")(match))
+        .order_by(rank, Target.id)
+        .offset(offset)
+        .limit(limit + 1)
+    )
+    if country is not None:
+        query = query.where(Target.country == country)
+    rows = db.execute(query).all()
+    next_cursor = offset + limit if len(rows) > limit else None
+    return [dict(row._mapping) for row in rows[:limit]], next_cursor
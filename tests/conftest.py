@@ -1,18 +1,33 @@
+import os
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
+
+os.environ.setdefault("ASYNC_API_ENABLED", "1")
+# Keep the app's own engine off the production database file.
+os.environ.setdefault("DATABASE_PATH", "db.sqlite3")
 
-from db.database import Base, get_db
+from db.database import (
+    create_async_db_engine,
+    create_db_engine,
+    get_async_db,
+    get_db,
+)
+from db.migrations import upgrade
 from main import app
+from services.breed_catalog import catalog, file_fetcher
 
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///db.sqlite3"
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False})
+engine = create_db_engine(SQLALCHEMY_DATABASE_URL)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-Base.metadata.create_all(bind=engine)
+upgrade(engine)
 
 def override_get_db():
     db = TestingSessionLocal()
@@ -21,12 +36,61 @@ def override_get_db():
     finally:
         db.close()
 
+# TestClient runs every request on a fresh event loop, so pooled aiosqlite
+# connections cannot be reused between requests.
+async_engine = create_async_db_engine("sqlite+aiosqlite:///db.sqlite3", poolclass=NullPool)
+TestingAsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+async def override_get_async_db():
+    async with TestingAsyncSessionLocal() as db:
+        yield db
+
+
 app.dependency_overrides[get_db] = override_get_db
+app.dependency_overrides[get_async_db] = override_get_async_db
+
+BREEDS_FIXTURE = os.path.join(os.path.dirname(__file__), "data", "breeds.json")
+catalog.configure(fetcher=file_fetcher(BREEDS_FIXTURE), snapshot_path=None)
 
 @pytest.fixture(scope="module")
 def client():
     yield TestClient(app)
 
+class QueryCounter:
+    """Counts SQL statements the test engine emits while active."""
+
+    def __init__(self):
+        self.count = 0
+        self.statements = []
+
+    def __call__(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+        self.statements.append(statement)
+
+    def __enter__(self):
+        self.count = 0
+        self.statements = []
+        event.listen(engine, "before_cursor_execute", self)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(engine, "before_cursor_execute", self)
+
+@pytest.fixture
+def db_session():
+    db = TestingSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+@pytest.fixture
+def count_queries():
+    return QueryCounter()
+
 @pytest.fixture
 def created_spy_cat(client):
     cat_data = {
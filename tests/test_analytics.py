@@ -0,0 +1,111 @@
+def new_cat(client, breed="Persian", salary=1000):
+    cat = {"name": "Ledger", "years_of_experience": 2, "breed": breed, "salary": salary}
+    response = client.post("/cats/", json=cat)
+    assert response.status_code == 201
+    return response.json()
+
+
+def assigned_mission(client, mission_data, cat_id):
+    mission = client.post("/missions/", json=mission_data).json()
+    response = client.patch(
+        f"/missions/{mission['id']}/assign", json={"cat_id": cat_id}
+    )
+    assert response.status_code == 200
+    return mission
+
+
+def breed_summary(client, breed):
+    summaries = client.get("/analytics/breeds").json()
+    return next((s for s in summaries if s["breed"] == breed), None)
+
+
+def test_payroll_splits_deployed_and_idle_cats(client, mission_data):
+    before = client.get("/analytics/payroll").json()
+    cat = new_cat(client, salary=1200)
+    mission = assigned_mission(client, mission_data, cat["id"])
+
+    during = client.get("/analytics/payroll").json()
+    assert during["cats"] == before["cats"] + 1
+    assert during["deployed_cats"] == before["deployed_cats"] + 1
+    assert during["deployed_salary"] == round(before["deployed_salary"] + 1200, 2)
+    assert during["idle_cats"] == during["cats"] - during["deployed_cats"]
+
+    client.patch(f"/missions/{mission['id']}", json={"complete": True})
+    after = client.get("/analytics/payroll").json()
+    assert after["deployed_cats"] == before["deployed_cats"]
+    assert after["completed_missions"] == before["completed_missions"] + 1
+    assert after["cost_per_completed_mission"] == round(
+        after["total_salary"] / after["completed_missions"], 2
+    )
+
+
+def test_breed_summary_aggregates_salaries_and_missions(
+    client, mission_data, count_queries
+):
+    before = breed_summary(client, "Maine Coon") or {
+        "cats": 0,
+        "total_salary": 0,
+        "completed_missions": 0,
+    }
+    cheap = new_cat(client, "Maine Coon", 1)
+    new_cat(client, "Maine Coon", 99999)
+    mission = assigned_mission(client, mission_data, cheap["id"])
+    client.patch(f"/missions/{mission['id']}", json={"complete": True})
+
+    with count_queries:
+        summary = breed_summary(client, "Maine Coon")
+    assert count_queries.count == 2
+    assert not any(" targets" in s for s in count_queries.statements)
+
+    assert summary["cats"] == before["cats"] + 2
+    assert summary["total_salary"] == round(before["total_salary"] + 100000, 2)
+    assert summary["min_salary"] == 1
+    assert summary["max_salary"] == 99999
+    assert summary["completed_missions"] == before["completed_missions"] + 1
+
+
+def test_cat_history_lists_missions_and_salary_changes(client, mission_data):
+    cat = new_cat(client, salary=2000)
+    client.patch(f"/cats/{cat['id']}", json={"salary": 2500})
+    mission = assigned_mission(client, mission_data, cat["id"])
+    target_id = mission["targets"][0]["id"]
+    client.patch(
+        f"/missions/{mission['id']}/targets/{target_id}", json={"complete": True}
+    )
+    client.patch(f"/missions/{mission['id']}", json={"complete": True})
+
+    history = client.get(f"/analytics/cats/{cat['id']}/history").json()
+    assert history["salary"] == 2500
+    assert history["missions_total"] == history["missions_completed"] == 1
+    assert history["targets_total"] == len(mission_data["targets"])
+    assert history["targets_completed"] == 1
+    assert history["cost_per_completed_mission"] == 2500
+    assert history["missions"] == [
+        {
+            "id": mission["id"],
+            "complete": True,
+            "targets_total": len(mission_data["targets"]),
+            "targets_completed": 1,
+            "archived": False,
+        }
+    ]
+    assert [change["salary"] for change in history["salary_history"]] == [2000, 2500]
+
+
+def test_new_cat_does_not_inherit_a_deleted_cats_history(client, mission_data):
+    cat = new_cat(client, salary=2000)
+    client.patch(f"/cats/{cat['id']}", json={"salary": 2500})
+    mission = assigned_mission(client, mission_data, cat["id"])
+    client.patch(f"/missions/{mission['id']}", json={"complete": True})
+    assert client.delete(f"/cats/{cat['id']}").status_code == 204
+
+    successor = new_cat(client, salary=3000)
+
+    assert successor["id"] > cat["id"]
+    history = client.get(f"/analytics/cats/{successor['id']}/history").json()
+    assert history["missions"] == []
+    assert [change["salary"] for change in history["salary_history"]] == [3000]
+
+
+def test_cat_history_of_unknown_cat_is_404(client):
+    assert client.get("/analytics/cats/999999/history").status_code == 404
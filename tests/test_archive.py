@@ -0,0 +1,88 @@
+from datetime import timedelta
+
+from sqlalchemy import select, update
+
+from db.models import ArchivedMission, Event, Mission
+from services.archive_service import archive_batch, archive_completed_missions
+from services.clock import utcnow
+
+OLD = timedelta(days=1)
+
+
+def completed_mission(client, mission_data, db_session, age=timedelta(days=2)):
+    mission = client.post("/missions/", json=mission_data).json()
+    client.patch(f"/missions/{mission['id']}", json={"complete": True})
+    db_session.execute(
+        update(Mission)
+        .where(Mission.id == mission["id"])
+        .values(completed_at=utcnow() - age)
+    )
+    db_session.commit()
+    return client.get(f"/missions/{mission['id']}").json()
+
+
+def test_old_completed_missions_move_to_the_archive(client, mission_data, db_session):
+    mission = completed_mission(client, mission_data, db_session)
+    recent = completed_mission(client, mission_data, db_session, timedelta(0))
+
+    assert archive_completed_missions(db_session, OLD, batch_size=1) >= 1
+
+    assert db_session.get(Mission, mission["id"]) is None
+    assert db_session.get(ArchivedMission, mission["id"]) is not None
+    assert db_session.get(Mission, recent["id"]) is not None
+    listed = client.get("/missions/", params={"cursor": mission["id"] - 1}).json()
+    assert mission["id"] not in [m["id"] for m in listed]
+    events = db_session.execute(
+        select(Event.type).where(Event.entity_id == mission["id"])
+    ).scalars()
+    assert "mission.archived" in list(events)
+
+
+def test_archived_mission_is_still_served_by_id(client, mission_data, db_session):
+    mission = completed_mission(client, mission_data, db_session)
+    etag = client.get(f"/missions/{mission['id']}").headers["ETag"]
+    archive_completed_missions(db_session, OLD)
+
+    for prefix in ("", "/async"):
+        response = client.get(f"{prefix}/missions/{mission['id']}")
+        assert response.status_code == 200
+        assert response.json() == mission
+        assert response.headers["ETag"] == etag
+    # Archived missions are read-only.
+    response = client.patch(f"/missions/{mission['id']}", json={"complete": False})
+    assert response.status_code == 404
+
+
+def test_reopened_mission_is_not_archived(client, mission_data, db_session):
+    mission = completed_mission(client, mission_data, db_session)
+    client.patch(f"/missions/{mission['id']}", json={"complete": False})
+
+    assert archive_batch(db_session, [mission["id"]], utcnow() - OLD) == 0
+    live = client.get(f"/missions/{mission['id']}").json()
+    assert len(live["targets"]) == len(mission_data["targets"])
+
+
+def test_archived_ids_are_not_reused(client, mission_data, db_session):
+    mission = completed_mission(client, mission_data, db_session)
+    archive_completed_missions(db_session, OLD)
+    assert client.post("/missions/", json=mission_data).json()["id"] > mission["id"]
+
+
+def test_cat_history_includes_archived_missions(
+    client, mission_data, db_session, created_spy_cat
+):
+    cat_id = created_spy_cat["id"]
+    mission = client.post("/missions/", json=mission_data).json()
+    client.patch(f"/missions/{mission['id']}/assign", json={"cat_id": cat_id})
+    client.patch(f"/missions/{mission['id']}", json={"complete": True})
+    db_session.execute(
+        update(Mission)
+        .where(Mission.id == mission["id"])
+        .values(completed_at=utcnow() - 2 * OLD)
+    )
+    db_session.commit()
+    archive_completed_missions(db_session, OLD)
+
+    history = client.get(f"/analytics/cats/{cat_id}/history").json()
+    assert history["missions_completed"] == 1
+    assert history["missions"][0]["archived"] is True
@@ -0,0 +1,47 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import func, select
+
+from db.models import Mission
+
+THREADS = 16
+
+
+def test_concurrent_assigns_give_a_cat_one_active_mission(
+    client, db_session, mission_data, created_spy_cat
+):
+    cat_id = created_spy_cat["id"]
+    mission_ids = [
+        client.post("/missions/", json=mission_data).json()["id"]
+        for _ in range(THREADS * 2)
+    ]
+
+    def assign(mission_id):
+        return client.patch(
+            f"/missions/{mission_id}/assign", json={"cat_id": cat_id}
+        ).status_code
+
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        statuses = list(pool.map(assign, mission_ids))
+
+    assert statuses.count(200) == 1
+    assert statuses.count(400) == len(mission_ids) - 1
+
+    active = db_session.scalar(
+        select(func.count())
+        .select_from(Mission)
+        .where(Mission.cat_id == cat_id, Mission.complete == False)
+    )
+    assert active == 1
+
+
+def test_assign_reports_missing_mission_and_cat(client, created_mission):
+    response = client.patch("/missions/999999/assign", json={"cat_id": 1})
+    assert response.status_code == 404
+    assert "Mission" in response.json()["detail"]
+
+    response = client.patch(
+        f"/missions/{created_mission['id']}/assign", json={"cat_id": 999999}
+    )
+    assert response.status_code == 404
+    assert "Spy cat" in response.json()["detail"]
@@ -0,0 +1,76 @@
+def test_async_cat_lifecycle(client):
+    response = client.post(
+        "/async/cats/",
+        json={
+            "name": "Async Whiskers",
+            "breed": "Siamese",
+            "years_of_experience": 2,
+            "salary": 4000,
+        },
+    )
+    assert response.status_code == 201
+    cat_id = response.json()["id"]
+
+    response = client.get(f"/async/cats/{cat_id}")
+    assert response.status_code == 200
+    assert response.json()["name"] == "Async Whiskers"
+
+    listed = client.get("/async/cats/", params={"cursor": cat_id - 1}).json()
+    assert any(cat["id"] == cat_id for cat in listed)
+
+    response = client.patch(f"/async/cats/{cat_id}", json={"salary": 4500})
+    assert response.status_code == 200
+    assert response.json()["salary"] == 4500
+
+    assert client.delete(f"/async/cats/{cat_id}").status_code == 204
+    assert client.get(f"/async/cats/{cat_id}").status_code == 404
+
+
+def test_async_create_cat_invalid_breed(client):
+    response = client.post(
+        "/async/cats/",
+        json={
+            "name": "Nope",
+            "breed": "Dragon",
+            "years_of_experience": 2,
+            "salary": 4000,
+        },
+    )
+    assert response.status_code == 400
+
+
+def test_async_mission_flow(client, mission_data, created_spy_cat):
+    response = client.post("/async/missions/", json=mission_data)
+    assert response.status_code == 201
+    mission = response.json()
+    assert len(mission["targets"]) == 1
+
+    response = client.patch(
+        f"/async/missions/{mission['id']}/assign",
+        json={"cat_id": created_spy_cat["id"]},
+    )
+    assert response.status_code == 200
+    assert response.json()["cat_id"] == created_spy_cat["id"]
+    assert response.json()["targets"][0]["name"] == "Enemy Base Alpha"
+
+    target_id = mission["targets"][0]["id"]
+    response = client.patch(
+        f"/async/missions/{mission['id']}/targets/{target_id}",
+        json={"notes": "Spotted at dawn"},
+    )
+    assert response.status_code == 200
+    assert response.json()["notes"] == "Spotted at dawn"
+
+    response = client.patch(f"/async/missions/{mission['id']}", json={"complete": True})
+    assert response.status_code == 200
+    assert response.json()["complete"] is True
+
+    response = client.get(f"/async/missions/{mission['id']}")
+    assert response.status_code == 200
+    assert response.json()["targets"][0]["notes"] == "Spotted at dawn"
+    listed = client.get("/async/missions/", params={"cursor": mission["id"] - 1})
+    assert any(m["id"] == mission["id"] for m in listed.json())
+
+
+def test_async_get_nonexistent_mission(client):
+    assert client.get("/async/missions/9999").status_code == 404
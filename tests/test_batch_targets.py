@@ -0,0 +1,76 @@
+import pytest
+
+
+@pytest.fixture
+def three_target_mission(client, mission_data):
+    targets = [{**mission_data["targets"][0], "name": f"Target {i}"} for i in range(3)]
+    response = client.post("/missions/", json={**mission_data, "targets": targets})
+    assert response.status_code == 201
+    return response.json()
+
+
+def target_ids(mission):
+    return [target["id"] for target in mission["targets"]]
+
+
+def test_batch_update_applies_all_targets_in_one_commit(
+    client, three_target_mission, count_queries
+):
+    ids = target_ids(three_target_mission)
+    updates = [
+        {"id": ids[0], "notes": "Spotted at the docks"},
+        {"id": ids[1], "notes": "Left the country", "complete": True},
+        {"id": ids[2], "complete": True},
+    ]
+    with count_queries:
+        response = client.patch(
+            f"/missions/{three_target_mission['id']}/targets", json=updates
+        )
+    assert response.status_code == 200
+    assert sum(s == "COMMIT" for s in count_queries.statements) <= 1
+
+    mission = response.json()
+    by_id = {target["id"]: target for target in mission["targets"]}
+    assert by_id[ids[0]]["notes"] == "Spotted at the docks"
+    assert by_id[ids[1]]["complete"] is True
+    assert mission["targets_completed"] == 2
+    assert "ETag" in response.headers
+
+
+def test_batch_update_is_all_or_nothing(client, three_target_mission):
+    ids = target_ids(three_target_mission)
+    url = f"/missions/{three_target_mission['id']}/targets"
+    client.patch(url, json=[{"id": ids[2], "complete": True}])
+
+    response = client.patch(
+        url, json=[{"id": ids[0], "notes": "New"}, {"id": ids[2], "notes": "Late"}]
+    )
+    assert response.status_code == 400
+    mission = client.get(f"/missions/{three_target_mission['id']}").json()
+    assert mission["targets"][0]["notes"] == ""
+
+
+def test_batch_update_rejects_foreign_and_duplicate_targets(
+    client, three_target_mission, created_mission
+):
+    url = f"/missions/{three_target_mission['id']}/targets"
+    foreign = created_mission["targets"][0]["id"]
+    assert client.patch(url, json=[{"id": foreign, "notes": "x"}]).status_code == 404
+
+    own = target_ids(three_target_mission)[0]
+    duplicate = [{"id": own, "notes": "a"}, {"id": own, "notes": "b"}]
+    assert client.patch(url, json=duplicate).status_code == 400
+    assert client.patch(url, json=[]).status_code == 422
+    assert client.patch("/missions/999999/targets", json=[{"id": own}]).status_code == (
+        404
+    )
+
+
+def test_async_batch_update(client, three_target_mission):
+    ids = target_ids(three_target_mission)
+    response = client.patch(
+        f"/async/missions/{three_target_mission['id']}/targets",
+        json=[{"id": target_id, "complete": True} for target_id in ids],
+    )
+    assert response.status_code == 200
+    assert response.json()["targets_completed"] == 3
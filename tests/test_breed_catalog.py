@@ -0,0 +1,195 @@
+import asyncio
+import json
+import os
+import time
+
+import pytest
+
+from services.breed_catalog import (
+    BreedCatalog,
+    BreedCatalogUnavailable,
+    catalog,
+    file_fetcher,
+)
+
+BREEDS_FIXTURE = os.path.join(os.path.dirname(__file__), "data", "breeds.json")
+
+
+def failing_fetcher():
+    raise ConnectionError("upstream down")
+
+
+def wait_for_refresh(breed_catalog):
+    deadline = time.time() + 2
+    while breed_catalog._refreshing and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def test_lookup_is_case_insensitive_and_counted():
+    breed_catalog = BreedCatalog(fetcher=file_fetcher(BREEDS_FIXTURE))
+    assert breed_catalog.contains("bengal")
+    assert breed_catalog.contains("MAINE COON")
+    assert not breed_catalog.contains("Dragon")
+
+    stats = breed_catalog.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] == 2
+    assert stats["refreshes"] == 1
+    assert stats["size"] == 6
+
+
+def test_snapshot_is_written_and_reused(tmp_path):
+    snapshot = tmp_path / "breeds.json"
+    BreedCatalog(
+        fetcher=file_fetcher(BREEDS_FIXTURE), snapshot_path=str(snapshot)
+    ).load()
+    assert "bombay" in json.loads(snapshot.read_text())["breeds"]
+
+    breed_catalog = BreedCatalog(fetcher=failing_fetcher, snapshot_path=str(snapshot))
+    breed_catalog.load()
+    assert breed_catalog.contains("Bombay")
+    assert breed_catalog.stats()["refreshes"] == 0
+
+
+def test_stale_catalog_is_served_while_revalidating(tmp_path):
+    snapshot = tmp_path / "breeds.json"
+    snapshot.write_text(json.dumps({"fetched_at": 0, "breeds": ["bengal"]}))
+    breed_catalog = BreedCatalog(
+        fetcher=file_fetcher(BREEDS_FIXTURE), snapshot_path=str(snapshot), ttl=60
+    )
+
+    assert breed_catalog.contains("Bengal")
+    wait_for_refresh(breed_catalog)
+    assert breed_catalog.contains("Persian")
+    assert breed_catalog.stats()["refreshes"] == 1
+
+
+def slow_fetcher(seconds):
+    fetch = file_fetcher(BREEDS_FIXTURE)
+
+    def slow():
+        time.sleep(seconds)
+        return fetch()
+
+    return slow
+
+
+def test_stale_lookups_do_not_wait_for_a_slow_refresh(tmp_path):
+    snapshot = tmp_path / "breeds.json"
+    snapshot.write_text(json.dumps({"fetched_at": 0, "breeds": ["bengal"]}))
+    breed_catalog = BreedCatalog(
+        fetcher=slow_fetcher(0.5), snapshot_path=str(snapshot), ttl=60
+    )
+
+    assert breed_catalog.contains("Bengal")
+    start = time.perf_counter()
+    assert breed_catalog.contains("Bengal")
+    assert not breed_catalog.contains("Persian")
+    assert time.perf_counter() - start < 0.25
+    wait_for_refresh(breed_catalog)
+    assert breed_catalog.contains("Persian")
+
+
+def test_async_stale_lookups_do_not_block_the_event_loop(tmp_path):
+    snapshot = tmp_path / "breeds.json"
+    snapshot.write_text(json.dumps({"fetched_at": 0, "breeds": ["bengal"]}))
+    breed_catalog = BreedCatalog(
+        fetcher=slow_fetcher(0.5), snapshot_path=str(snapshot), ttl=60
+    )
+
+    async def lookups():
+        assert await breed_catalog.acontains("Bengal")
+        start = time.perf_counter()
+        for _ in range(10):
+            assert await breed_catalog.acontains("Bengal")
+            await asyncio.sleep(0)
+        return time.perf_counter() - start
+
+    assert asyncio.run(lookups()) < 0.25
+    wait_for_refresh(breed_catalog)
+    assert breed_catalog.contains("Persian")
+
+
+def test_concurrent_cold_async_lookups_fetch_once():
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return ["Bengal"]
+
+    breed_catalog = BreedCatalog(fetcher=failing_fetcher, async_fetcher=fetch)
+
+    async def lookups():
+        return await asyncio.gather(
+            *(breed_catalog.acontains("Bengal") for _ in range(10))
+        )
+
+    assert all(asyncio.run(lookups()))
+    assert len(calls) == 1
+
+
+def test_workers_sharing_a_snapshot_refresh_it_once(tmp_path):
+    snapshot = tmp_path / "breeds.json"
+    snapshot.write_text(json.dumps({"fetched_at": 0, "breeds": ["bengal"]}))
+    calls = []
+    fetch = slow_fetcher(0.2)
+
+    def counting_fetch():
+        calls.append(1)
+        return fetch()
+
+    # One catalog per worker process, all stale at the same time.
+    workers = [
+        BreedCatalog(fetcher=counting_fetch, snapshot_path=str(snapshot), ttl=60)
+        for _ in range(3)
+    ]
+    for breed_catalog in workers:
+        assert breed_catalog.contains("Bengal")
+    for breed_catalog in workers:
+        wait_for_refresh(breed_catalog)
+
+    assert len(calls) == 1
+    assert all(breed_catalog.contains("Persian") for breed_catalog in workers)
+
+
+def test_failed_refresh_keeps_stale_catalog(tmp_path):
+    snapshot = tmp_path / "breeds.json"
+    snapshot.write_text(json.dumps({"fetched_at": 0, "breeds": ["bengal"]}))
+    breed_catalog = BreedCatalog(
+        fetcher=failing_fetcher, snapshot_path=str(snapshot), ttl=60
+    )
+
+    assert breed_catalog.contains("Bengal")
+    wait_for_refresh(breed_catalog)
+    assert breed_catalog.contains("Bengal")
+    assert breed_catalog.stats()["refresh_failures"] == 1
+
+
+def test_cold_catalog_failure_raises():
+    breed_catalog = BreedCatalog(fetcher=failing_fetcher)
+    with pytest.raises(BreedCatalogUnavailable):
+        breed_catalog.contains("Bengal")
+
+
+def test_create_cat_returns_503_when_catalog_unavailable(client):
+    catalog.configure(fetcher=failing_fetcher, snapshot_path=None)
+    try:
+        response = client.post(
+            "/cats/",
+            json={
+                "name": "Tom",
+                "breed": "Bengal",
+                "years_of_experience": 1,
+                "salary": 1000,
+            },
+        )
+        assert response.status_code == 503
+    finally:
+        catalog.configure(fetcher=file_fetcher(BREEDS_FIXTURE), snapshot_path=None)
+
+
+def test_stats_endpoint_exposes_catalog_counters(client):
+    response = client.get("/stats")
+    assert response.status_code == 200
+    assert "hits" in response.json()["breed_catalog"]
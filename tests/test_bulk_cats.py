@@ -0,0 +1,62 @@
+def test_bulk_create_spy_cats(client):
+    response = client.post(
+        "/cats/bulk",
+        json=[
+            {
+                "name": "Bulk A",
+                "breed": "Bengal",
+                "years_of_experience": 1,
+                "salary": 100,
+            },
+            {
+                "name": "Bulk B",
+                "breed": "Dragon",
+                "years_of_experience": 2,
+                "salary": 200,
+            },
+            {"name": "Bulk C", "breed": "siamese", "years_of_experience": 3},
+            {
+                "name": "Bulk D",
+                "breed": "Persian",
+                "years_of_experience": 4,
+                "salary": 400,
+            },
+        ],
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 2
+    assert data["failed"] == 2
+    results = data["results"]
+    assert results[1]["errors"][0]["type"] == "invalid_breed"
+    assert results[2]["errors"][0]["loc"] == ["salary"]
+
+    cat = client.get(f"/cats/{results[3]['id']}").json()
+    assert cat["name"] == "Bulk D"
+    assert cat["salary"] == 400
+
+
+def test_bulk_create_spy_cats_csv(client):
+    body = (
+        "name,breed,years_of_experience,salary\n"
+        "Csv A,Bombay,2,2500\n"
+        "Csv B,Bombay,two,2500\n"
+    )
+    response = client.post(
+        "/cats/bulk/csv", content=body, headers={"Content-Type": "text/csv"}
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 1
+    assert data["results"][1]["errors"][0]["loc"] == ["years_of_experience"]
+
+    cat = client.get(f"/cats/{data['results'][0]['id']}").json()
+    assert cat["years_of_experience"] == 2
+    assert cat["salary"] == 2500
+
+
+def test_bulk_create_spy_cats_csv_rejects_binary(client):
+    response = client.post(
+        "/cats/bulk/csv", content=b"\xff\xfe\x00", headers={"Content-Type": "text/csv"}
+    )
+    assert response.status_code == 400
@@ -0,0 +1,42 @@
+def test_bulk_create_missions(client, mission_data):
+    second = {
+        "complete": True,
+        "targets": [
+            {"name": "Harbor", "country": "Atlantis"},
+            {"name": "Lighthouse", "country": "Atlantis"},
+        ],
+    }
+    response = client.post("/missions/bulk", json=[mission_data, second])
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 2
+    assert data["failed"] == 0
+    first_id, second_id = [result["id"] for result in data["results"]]
+
+    mission = client.get(f"/missions/{second_id}").json()
+    assert mission["complete"] is True
+    assert [t["name"] for t in mission["targets"]] == ["Harbor", "Lighthouse"]
+    assert client.get(f"/missions/{first_id}").json()["targets"][0]["name"] == (
+        "Enemy Base Alpha"
+    )
+
+
+def test_bulk_create_missions_reports_invalid_items(
+    client, mission_data, invalid_mission_data
+):
+    response = client.post(
+        "/missions/bulk", json=[invalid_mission_data, mission_data, {"targets": "x"}]
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["created"] == 1
+    assert data["failed"] == 2
+    results = data["results"]
+    assert [result["index"] for result in results] == [0, 1, 2]
+    assert results[0]["id"] is None and results[0]["errors"]
+    assert results[1]["id"] is not None and results[1]["errors"] == []
+    assert results[2]["errors"][0]["loc"] == ["targets"]
+
+
+def test_bulk_create_missions_rejects_non_list(client, mission_data):
+    assert client.post("/missions/bulk", json=mission_data).status_code == 422
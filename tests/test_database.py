@@ -0,0 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from db.database import create_db_engine, engine_options, to_async_url
+
+
+def test_sqlite_engine_applies_pragmas(tmp_path):
+    engine = create_db_engine(f"sqlite:///{tmp_path}/tuned.db")
+    with engine.connect() as conn:
+        pragmas = {
+            name: conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+            for name in ("journal_mode", "synchronous", "busy_timeout")
+        }
+    assert pragmas == {"journal_mode": "wal", "synchronous": 1, "busy_timeout": 5000}
+    assert engine.pool.size() == 10
+    engine.dispose()
+
+
+def test_memory_sqlite_shares_one_connection_across_threads():
+    options = engine_options("sqlite://")
+    assert "pool_size" not in options
+    engine = create_db_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.exec_driver_sql("CREATE TABLE shared (id INTEGER)")
+
+    def count():
+        with engine.connect() as conn:
+            return conn.exec_driver_sql("SELECT count(*) FROM shared").scalar()
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        assert pool.submit(count).result() == 0
+    engine.dispose()
+
+
+def test_custom_poolclass_drops_pool_sizing():
+    from sqlalchemy.pool import NullPool
+
+    options = engine_options("sqlite:///x.db", poolclass=NullPool)
+    assert "pool_size" not in options
+
+
+def test_async_url_is_derived_from_sync_url():
+    assert (
+        to_async_url("sqlite:///./spy_cats.db") == "sqlite+aiosqlite:///./spy_cats.db"
+    )
+    assert (
+        to_async_url("postgresql://agent:secret@db/spycats")
+        == "postgresql+asyncpg://agent:secret@db/spycats"
+    )
@@ -0,0 +1,149 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.exc import StaleDataError
+
+import services.cats_service as cats_service
+from db.schemas import SpyCatUpdate
+from services.etags import spy_cat_etag
+from services.response_cache import response_cache
+
+
+def test_get_spy_cat_answers_if_none_match_with_304(client, created_spy_cat):
+    url = f"/cats/{created_spy_cat['id']}"
+    etag = client.get(url).headers["ETag"]
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+    response_cache.clear()
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_spy_cat_etag_changes_on_update(client, created_spy_cat):
+    url = f"/cats/{created_spy_cat['id']}"
+    etag = client.get(url).headers["ETag"]
+
+    patched = client.patch(url, json={"salary": 4321})
+    assert patched.headers["ETag"] != etag
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] == patched.headers["ETag"]
+    assert response.json()["salary"] == 4321
+
+
+def test_patch_spy_cat_with_stale_if_match_is_rejected(client, created_spy_cat):
+    url = f"/cats/{created_spy_cat['id']}"
+    etag = client.get(url).headers["ETag"]
+    client.patch(url, json={"salary": 1111})
+
+    response = client.patch(url, json={"salary": 2222}, headers={"If-Match": etag})
+    assert response.status_code == 412
+    assert client.get(url).json()["salary"] == 1111
+
+    current = client.get(url).headers["ETag"]
+    response = client.patch(url, json={"salary": 2222}, headers={"If-Match": current})
+    assert response.status_code == 200
+
+
+def concurrent_update(db_session, cat_id, if_match=None):
+    """Update the cat from a session that read it before another write."""
+    other = Session(bind=db_session.get_bind())
+    try:
+        stale = cats_service.get_spy_cat(other, cat_id)
+        etag = spy_cat_etag(stale) if if_match else None
+        cats_service.update_spy_cat(db_session, cat_id, SpyCatUpdate(salary=10))
+
+        return cats_service.update_spy_cat(
+            other, cat_id, SpyCatUpdate(salary=20), if_match=etag
+        )
+    finally:
+        other.close()
+
+
+def test_concurrent_update_with_if_match_is_detected_at_commit(
+    db_session, created_spy_cat
+):
+    result = concurrent_update(db_session, created_spy_cat["id"], if_match=True)
+    assert result == "version_conflict"
+
+
+def test_concurrent_update_without_if_match_is_reapplied(db_session, created_spy_cat):
+    # No precondition to fail: the write is retried on a fresh read.
+    result = concurrent_update(db_session, created_spy_cat["id"])
+    assert result.salary == 20
+
+
+def test_update_that_keeps_losing_races_is_a_conflict(
+    client, created_spy_cat, monkeypatch
+):
+    def stale(*args):
+        raise StaleDataError("row changed")
+
+    monkeypatch.setattr(cats_service, "_update_spy_cat", stale)
+    response = client.patch(f"/cats/{created_spy_cat['id']}", json={"salary": 1})
+    assert response.status_code == 409
+
+
+def test_mission_etag_covers_targets(client, created_mission):
+    url = f"/missions/{created_mission['id']}"
+    target_id = created_mission["targets"][0]["id"]
+    etag = client.get(url).headers["ETag"]
+    assert client.get(url, headers={"If-None-Match": etag}).status_code == 304
+
+    target = client.patch(f"{url}/targets/{target_id}", json={"notes": "Moved"})
+    assert "ETag" in target.headers
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_mission_writes_honor_if_match(client, created_mission, created_spy_cat):
+    url = f"/missions/{created_mission['id']}"
+    target_url = f"{url}/targets/{created_mission['targets'][0]['id']}"
+    stale = client.get(url).headers["ETag"]
+    stale_target = client.patch(target_url, json={"notes": "v1"}).headers["ETag"]
+    client.patch(target_url, json={"notes": "v2"})
+
+    assign = {"cat_id": created_spy_cat["id"]}
+    headers = {"If-Match": stale}
+    assert client.patch(f"{url}/assign", json=assign, headers=headers).status_code == (
+        412
+    )
+    assert client.patch(url, json={"complete": True}, headers=headers).status_code == (
+        412
+    )
+    response = client.patch(
+        target_url, json={"notes": "v3"}, headers={"If-Match": stale_target}
+    )
+    assert response.status_code == 412
+
+    current = client.get(url).headers["ETag"]
+    assigned = client.patch(f"{url}/assign", json=assign, headers={"If-Match": current})
+    assert assigned.status_code == 200
+    assert assigned.json()["cat_id"] == created_spy_cat["id"]
+    assert assigned.headers["ETag"] != current
+
+
+def test_target_patch_accepts_the_mission_etag(client, created_mission):
+    url = f"/missions/{created_mission['id']}"
+    target_url = f"{url}/targets/{created_mission['targets'][0]['id']}"
+    etag = client.get(url).headers["ETag"]
+
+    response = client.patch(
+        target_url, json={"notes": "v1"}, headers={"If-Match": etag}
+    )
+    assert response.status_code == 200
+
+    # The target changed, so the mission's old tag no longer matches.
+    response = client.patch(
+        target_url, json={"notes": "v2"}, headers={"If-Match": etag}
+    )
+    assert response.status_code == 412
+    current = client.get(url).headers["ETag"]
+    response = client.patch(
+        f"/async{target_url}", json={"notes": "v2"}, headers={"If-Match": current}
+    )
+    assert response.status_code == 200
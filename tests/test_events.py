@@ -0,0 +1,132 @@
+import asyncio
+import threading
+import time
+
+import config
+from services.event_log import EventNotifier
+
+CAT = {"name": "Logger", "breed": "Bengal", "years_of_experience": 2, "salary": 900}
+MISSION = {"targets": [{"name": "Depot", "country": "Chile"}]}
+
+
+def last_seq(client):
+    seq, cursor = 0, 0
+    while cursor is not None:
+        response = client.get("/events/", params={"after": cursor, "limit": 1000})
+        events = response.json()
+        if events:
+            seq = events[-1]["seq"]
+        cursor = response.headers.get("X-Next-Cursor")
+    return seq
+
+
+def events_after(client, after):
+    response = client.get("/events/", params={"after": after})
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_mutations_append_events_in_order(client):
+    start = last_seq(client)
+    cat = client.post("/cats/", json=CAT).json()
+    mission = client.post("/missions/", json=MISSION).json()
+    target_id = mission["targets"][0]["id"]
+    url = f"/missions/{mission['id']}"
+    client.patch(f"{url}/assign", json={"cat_id": cat["id"]})
+    client.patch(f"{url}/targets/{target_id}", json={"notes": "two guards"})
+    client.patch(f"/cats/{cat['id']}", json={"salary": 1200})
+    client.patch(url, json={"complete": True})
+    client.delete(url)
+    client.delete(f"/cats/{cat['id']}")
+
+    events = events_after(client, start)
+    assert [(e["type"], e["entity_id"]) for e in events] == [
+        ("cat.created", cat["id"]),
+        ("mission.created", mission["id"]),
+        ("mission.assigned", mission["id"]),
+        ("target.updated", target_id),
+        ("cat.salary_changed", cat["id"]),
+        ("mission.completed", mission["id"]),
+        ("mission.deleted", mission["id"]),
+        ("cat.deleted", cat["id"]),
+    ]
+    assert events[2]["data"] == {"cat_id": cat["id"]}
+    assert events[3]["data"] == {"mission_id": mission["id"], "notes": "two guards"}
+    assert events[4]["data"] == {"salary": 1200, "previous": 900}
+    assert [e["seq"] for e in events] == sorted(e["seq"] for e in events)
+
+
+def test_auto_completion_is_logged(client, monkeypatch):
+    monkeypatch.setattr(config, "MISSION_AUTO_COMPLETE", True)
+    mission = client.post("/missions/", json=MISSION).json()
+    target_id = mission["targets"][0]["id"]
+    start = last_seq(client)
+    client.patch(
+        f"/missions/{mission['id']}/targets/{target_id}", json={"complete": True}
+    )
+    events = events_after(client, start)
+    assert [e["type"] for e in events] == ["target.updated", "mission.completed"]
+    assert events[1]["data"] == {"cat_id": None, "automatic": True}
+
+
+def test_bulk_creates_log_one_event_per_item(client):
+    start = last_seq(client)
+    response = client.post("/missions/bulk", json=[MISSION, MISSION])
+    ids = [r["id"] for r in response.json()["results"]]
+    events = events_after(client, start)
+    assert [(e["type"], e["entity_id"]) for e in events] == [
+        ("mission.created", id) for id in ids
+    ]
+    assert events[0]["data"] == {"complete": False, "targets_total": 1}
+
+
+def test_refused_mutation_logs_nothing(client):
+    cat = client.post("/cats/", json=CAT).json()
+    start = last_seq(client)
+    response = client.patch(
+        f"/cats/{cat['id']}", json={"salary": 5}, headers={"If-Match": '"stale"'}
+    )
+    assert response.status_code == 412
+    assert events_after(client, start) == []
+
+
+def test_long_poll_times_out_empty(client):
+    start = last_seq(client)
+    began = time.perf_counter()
+    response = client.get("/events/", params={"after": start, "wait": 0.2})
+    assert response.json() == []
+    assert time.perf_counter() - began >= 0.2
+
+
+def test_notifier_wakes_waiters_from_other_threads():
+    notifier = EventNotifier()
+
+    async def wait():
+        woken = notifier.subscribe()
+        threading.Timer(0.05, notifier.notify).start()
+        await asyncio.wait_for(woken, 5)
+        notifier.unsubscribe(woken)
+
+    asyncio.run(wait())
+
+
+def test_stream_sends_events_as_sse(client):
+    start = last_seq(client)
+    cat = client.post("/cats/", json=CAT).json()
+    client.patch(f"/cats/{cat['id']}", json={"salary": 1500})
+
+    response = client.get("/events/stream", params={"after": start, "timeout": 0})
+    assert response.headers["content-type"].startswith("text/event-stream")
+    frames = [f for f in response.text.split("\n\n") if f.startswith("id:")]
+    assert [f.splitlines()[1] for f in frames] == [
+        "event: cat.created",
+        "event: cat.salary_changed",
+    ]
+
+    resumed = client.get(
+        "/events/stream",
+        params={"timeout": 0},
+        headers={"Last-Event-ID": frames[0].splitlines()[0][4:]},
+    )
+    assert "event: cat.salary_changed" in resumed.text
+    assert "event: cat.created" not in resumed.text
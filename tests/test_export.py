@@ -0,0 +1,41 @@
+import json
+
+
+def read_ndjson(response):
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
+def test_export_spy_cats_since_id(client, created_spy_cat):
+    since_id = created_spy_cat["id"] - 1
+    response = client.get("/cats/export", params={"since_id": since_id})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    cats = read_ndjson(response)
+    assert cats[0] == created_spy_cat
+    assert all(cat["id"] > since_id for cat in cats)
+
+
+def test_export_missions_includes_targets(client, created_mission):
+    response = client.get(
+        "/missions/export", params={"since_id": created_mission["id"] - 1}
+    )
+    assert response.status_code == 200
+    missions = read_ndjson(response)
+    assert missions[0] == created_mission
+    assert missions[0]["targets"][0]["name"] == "Enemy Base Alpha"
+
+
+def test_export_gzip(client, created_mission):
+    response = client.get(
+        "/missions/export",
+        params={"since_id": created_mission["id"] - 1, "gzip": True},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert read_ndjson(response)[0]["id"] == created_mission["id"]
+
+
+def test_export_past_watermark_is_empty(client, created_spy_cat):
+    response = client.get("/cats/export", params={"since_id": created_spy_cat["id"]})
+    assert response.status_code == 200
+    assert response.text == ""
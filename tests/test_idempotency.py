@@ -0,0 +1,215 @@
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+import pytest
+from sqlalchemy import func, select, update
+
+import services.idempotency as idempotency
+from db.models import IdempotencyKey, SpyCat
+from db.schemas import SpyCatCreate
+from services.idempotency import purge_expired, request_hash
+from services.clock import utcnow
+
+THREADS = 8
+CAT = {"name": "Echo", "breed": "Bombay", "years_of_experience": 2, "salary": 900}
+
+
+def key_header():
+    return {"Idempotency-Key": str(uuid.uuid4())}
+
+
+def cat_count(db_session):
+    return db_session.scalar(select(func.count()).select_from(SpyCat))
+
+
+def test_retry_replays_the_first_response(client, db_session):
+    headers = key_header()
+    first = client.post("/cats/", json=CAT, headers=headers)
+    assert first.status_code == 201
+    count = cat_count(db_session)
+
+    retry = client.post("/cats/", json=CAT, headers=headers)
+
+    assert retry.status_code == 201
+    assert retry.json() == first.json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert cat_count(db_session) == count
+
+
+def test_requests_without_a_key_are_not_deduplicated(client):
+    first = client.post("/cats/", json=CAT).json()
+    second = client.post("/cats/", json=CAT).json()
+    assert first["id"] != second["id"]
+
+
+def test_mission_retry_replays_the_first_response(client, mission_data):
+    headers = key_header()
+    first = client.post("/missions/", json=mission_data, headers=headers)
+    retry = client.post("/missions/", json=mission_data, headers=headers)
+
+    assert first.status_code == retry.status_code == 201
+    assert retry.json() == first.json()
+    # Keys are scoped per endpoint.
+    cat = client.post("/cats/", json=CAT, headers=headers)
+    assert cat.status_code == 201
+    assert "Idempotent-Replayed" not in cat.headers
+
+
+def test_key_reused_with_another_body_is_rejected(client):
+    headers = key_header()
+    client.post("/cats/", json=CAT, headers=headers)
+
+    response = client.post("/cats/", json={**CAT, "salary": 1}, headers=headers)
+
+    assert response.status_code == 422
+
+
+def test_key_still_in_flight_is_refused(client, db_session):
+    headers = key_header()
+    response = client.post("/cats/", json=CAT, headers=headers)
+    db_session.execute(
+        update(IdempotencyKey)
+        .where(IdempotencyKey.key == headers["Idempotency-Key"])
+        .values(status_code=None, body=None)
+    )
+    db_session.commit()
+
+    response = client.post("/cats/", json=CAT, headers=headers)
+
+    assert response.status_code == 409
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_abandoned_claim_is_taken_over(client, db_session):
+    # A request that died before committing leaves only its claim behind.
+    headers = key_header()
+    started = utcnow() - timedelta(hours=1)
+    db_session.add(
+        IdempotencyKey(
+            scope="POST /cats/",
+            key=headers["Idempotency-Key"],
+            request_hash=request_hash(SpyCatCreate(**CAT)),
+            created_at=started,
+            expires_at=started + timedelta(days=1),
+        )
+    )
+    db_session.commit()
+    count = cat_count(db_session)
+
+    response = client.post("/cats/", json=CAT, headers=headers)
+
+    assert response.status_code == 201
+    assert "Idempotent-Replayed" not in response.headers
+    assert cat_count(db_session) == count + 1
+
+
+def test_expired_key_runs_the_request_again(client, db_session):
+    headers = key_header()
+    first = client.post("/cats/", json=CAT, headers=headers).json()
+    db_session.execute(
+        update(IdempotencyKey)
+        .where(IdempotencyKey.key == headers["Idempotency-Key"])
+        .values(expires_at=utcnow() - timedelta(seconds=1))
+    )
+    db_session.commit()
+
+    response = client.post("/cats/", json=CAT, headers=headers)
+
+    assert response.status_code == 201
+    assert "Idempotent-Replayed" not in response.headers
+    assert response.json()["id"] != first["id"]
+
+
+def test_entity_and_stored_response_commit_together(client, db_session, monkeypatch):
+    headers = key_header()
+    count = cat_count(db_session)
+
+    def crash(*args):
+        raise RuntimeError("worker died")
+
+    monkeypatch.setattr(idempotency, "complete", crash)
+    with pytest.raises(RuntimeError):
+        client.post("/cats/", json=CAT, headers=headers)
+    monkeypatch.undo()
+
+    assert cat_count(db_session) == count
+    response = client.post("/cats/", json=CAT, headers=headers)
+    assert response.status_code == 201
+    assert cat_count(db_session) == count + 1
+
+
+def test_request_whose_claim_was_taken_over_creates_nothing(db_session):
+    scope, key = "POST /cats/", str(uuid.uuid4())
+    claim = idempotency.begin(db_session, scope, key, "hash")
+    db_session.execute(
+        update(IdempotencyKey)
+        .where(IdempotencyKey.key == key)
+        .values(created_at=claim.created_at + timedelta(seconds=1))
+    )
+    db_session.commit()
+
+    assert not idempotency.complete(db_session, claim, 201, b"{}")
+    db_session.rollback()
+    # Releasing the lost claim leaves the new owner's claim alone.
+    idempotency.release(db_session, claim)
+    assert db_session.get(IdempotencyKey, (scope, key)) is not None
+
+
+def test_failed_request_releases_its_key(client):
+    headers = key_header()
+    invalid = {**CAT, "breed": "Not A Breed"}
+    assert client.post("/cats/", json=invalid, headers=headers).status_code == 400
+    # Failures are not stored, so the same request runs (and fails) again.
+    assert client.post("/cats/", json=invalid, headers=headers).status_code == 400
+    assert client.post("/cats/", json=CAT, headers=headers).status_code == 201
+
+
+def test_async_endpoints_share_the_stored_responses(client):
+    headers = key_header()
+    first = client.post("/async/cats/", json=CAT, headers=headers)
+    replayed = client.post("/cats/", json=CAT, headers=headers)
+    assert first.status_code == replayed.status_code == 201
+    assert replayed.json() == first.json()
+
+    headers = key_header()
+    mission = {"complete": False, "targets": [{"name": "Dock", "country": "Peru"}]}
+    first = client.post("/missions/", json=mission, headers=headers)
+    replayed = client.post("/async/missions/", json=mission, headers=headers)
+    assert replayed.headers["Idempotent-Replayed"] == "true"
+    assert replayed.json() == first.json()
+
+
+def test_purge_deletes_only_expired_keys(client, db_session):
+    expired, live = key_header(), key_header()
+    client.post("/cats/", json=CAT, headers=expired)
+    client.post("/cats/", json=CAT, headers=live)
+    db_session.execute(
+        update(IdempotencyKey)
+        .where(IdempotencyKey.key == expired["Idempotency-Key"])
+        .values(expires_at=utcnow() - timedelta(seconds=1))
+    )
+    db_session.commit()
+
+    assert purge_expired(db_session) >= 1
+
+    keys = set(db_session.scalars(select(IdempotencyKey.key)))
+    assert expired["Idempotency-Key"] not in keys
+    assert live["Idempotency-Key"] in keys
+
+
+def test_concurrent_duplicates_create_one_cat(client, db_session):
+    headers = key_header()
+    count = cat_count(db_session)
+
+    def post(_):
+        response = client.post("/cats/", json=CAT, headers=headers)
+        return response.status_code, response.json().get("id")
+
+    with ThreadPoolExecutor(max_workers=THREADS) as pool:
+        results = list(pool.map(post, range(THREADS)))
+
+    created = {cat_id for status, cat_id in results if status == 201}
+    assert len(created) == 1
+    assert {status for status, _ in results} <= {201, 409}
+    assert cat_count(db_session) == count + 1
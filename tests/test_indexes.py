@@ -0,0 +1,187 @@
+import pytest
+from sqlalchemy import create_engine, inspect, text
+from sqlalchemy.exc import IntegrityError
+
+from db.migrations import MigrationError, upgrade
+from db.models import Mission
+
+# Schema as created by releases that only indexed primary keys.
+LEGACY_SCHEMA = [
+    "CREATE TABLE spy_cats (id INTEGER NOT NULL PRIMARY KEY, name VARCHAR NOT NULL,"
+    " years_of_experience INTEGER NOT NULL, breed VARCHAR NOT NULL,"
+    " salary FLOAT NOT NULL)",
+    "CREATE TABLE missions (id INTEGER NOT NULL PRIMARY KEY, cat_id INTEGER"
+    " REFERENCES spy_cats (id), complete BOOLEAN NOT NULL)",
+    "CREATE TABLE targets (id INTEGER NOT NULL PRIMARY KEY, mission_id INTEGER NOT"
+    " NULL REFERENCES missions (id), name VARCHAR NOT NULL, country VARCHAR NOT"
+    " NULL, notes TEXT, complete BOOLEAN NOT NULL)",
+]
+
+
+@pytest.fixture
+def legacy_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/legacy.db")
+    with engine.begin() as conn:
+        for statement in LEGACY_SCHEMA:
+            conn.exec_driver_sql(statement)
+        conn.exec_driver_sql(
+            "INSERT INTO spy_cats VALUES (1, 'Tom', 3, 'Bengal', 1000)"
+        )
+    yield engine
+    engine.dispose()
+
+
+def index_names(engine, table):
+    return {index["name"] for index in inspect(engine).get_indexes(table)}
+
+
+def query_plan(engine, sql, **params):
+    with engine.connect() as conn:
+        rows = conn.execute(text(f"EXPLAIN QUERY PLAN {sql}"), params).all()
+    return " ".join(row[-1] for row in rows)
+
+
+def test_upgrade_adds_indexes_to_legacy_database(legacy_engine):
+    upgrade(legacy_engine)
+    upgrade(legacy_engine)
+
+    assert {"ix_missions_cat_id_complete", "uq_missions_active_cat"} <= index_names(
+        legacy_engine, "missions"
+    )
+    assert "ix_targets_mission_id" in index_names(legacy_engine, "targets")
+
+
+def test_upgrade_reports_cats_with_several_active_missions(legacy_engine):
+    with legacy_engine.begin() as conn:
+        conn.exec_driver_sql("INSERT INTO missions VALUES (1, 1, 0), (2, 1, 0)")
+
+    with pytest.raises(MigrationError, match=r"\[1\]"):
+        upgrade(legacy_engine)
+
+
+def test_active_mission_lookup_uses_index(legacy_engine):
+    upgrade(legacy_engine)
+    plan = query_plan(
+        legacy_engine,
+        "SELECT id FROM missions WHERE cat_id = :cat_id AND complete = 0",
+        cat_id=1,
+    )
+    assert "USING" in plan and "INDEX" in plan
+    assert "SCAN missions" not in plan
+
+
+def test_target_lookup_by_mission_uses_index(legacy_engine):
+    upgrade(legacy_engine)
+    plan = query_plan(
+        legacy_engine, "SELECT id FROM targets WHERE mission_id = :id", id=1
+    )
+    assert "ix_targets_mission_id" in plan
+
+
+def test_database_rejects_second_active_mission(legacy_engine):
+    upgrade(legacy_engine)
+    with legacy_engine.begin() as conn:
+        conn.execute(Mission.__table__.insert().values(cat_id=1, complete=False))
+        conn.execute(Mission.__table__.insert().values(cat_id=1, complete=True))
+    with pytest.raises(IntegrityError):
+        with legacy_engine.begin() as conn:
+            conn.execute(Mission.__table__.insert().values(cat_id=1, complete=False))
+
+
+def test_upgrade_adds_version_columns_to_legacy_database(legacy_engine):
+    upgrade(legacy_engine)
+
+    for table in ("spy_cats", "missions", "targets"):
+        columns = {c["name"] for c in inspect(legacy_engine).get_columns(table)}
+        assert "version" in columns
+    with legacy_engine.connect() as conn:
+        assert conn.exec_driver_sql("SELECT version FROM spy_cats").scalar() == 1
+
+
+def test_upgrade_backfills_target_counters(legacy_engine):
+    with legacy_engine.begin() as conn:
+        conn.exec_driver_sql("INSERT INTO missions VALUES (1, NULL, 0)")
+        conn.exec_driver_sql(
+            "INSERT INTO targets VALUES (1, 1, 'A', 'X', '', 1), (2, 1, 'B', 'X', '', 0)"
+        )
+
+    upgrade(legacy_engine)
+
+    with legacy_engine.connect() as conn:
+        counters = conn.exec_driver_sql(
+            "SELECT targets_total, targets_completed FROM missions"
+        ).one()
+    assert tuple(counters) == (2, 1)
+
+
+def test_upgrade_builds_search_index_from_existing_targets(legacy_engine):
+    with legacy_engine.begin() as conn:
+        conn.exec_driver_sql("INSERT INTO missions VALUES (1, NULL, 0)")
+        conn.exec_driver_sql(
+            "INSERT INTO targets VALUES (1, 1, 'Old Mill', 'X', 'hidden cellar', 0)"
+        )
+
+    upgrade(legacy_engine)
+    upgrade(legacy_engine)
+
+    with legacy_engine.connect() as conn:
+        rowids = (
+            conn.exec_driver_sql(
+                "SELECT rowid FROM targets_fts WHERE targets_fts MATCH 'cellar'"
+            )
+            .scalars()
+            .all()
+        )
+    assert rowids == [1]
+
+
+def test_upgrade_backfills_who_completed_missions(legacy_engine):
+    # A database from before missions.completed_by, with its event log.
+    upgrade(legacy_engine)
+    with legacy_engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX ix_missions_completed_by")
+        conn.exec_driver_sql("ALTER TABLE missions DROP COLUMN completed_by")
+        conn.exec_driver_sql("DELETE FROM schema_version")
+        conn.exec_driver_sql(
+            "INSERT INTO missions (id, cat_id, complete) VALUES (1, NULL, 1), (2, 1, 0)"
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO events (type, entity_id, data) VALUES"
+            " ('mission.completed', 1, '{\"cat_id\": 1}'),"
+            " ('mission.assigned', 2, '{\"cat_id\": 1}')"
+        )
+
+    upgrade(legacy_engine)
+
+    with legacy_engine.connect() as conn:
+        completed_by = conn.exec_driver_sql(
+            "SELECT id, completed_by FROM missions ORDER BY id"
+        ).all()
+    assert [tuple(row) for row in completed_by] == [(1, 1), (2, None)]
+
+
+def test_upgrade_stops_sqlite_reusing_mission_and_target_ids(legacy_engine):
+    with legacy_engine.begin() as conn:
+        conn.exec_driver_sql("INSERT INTO missions VALUES (1, NULL, 1), (2, NULL, 1)")
+        conn.exec_driver_sql("INSERT INTO targets VALUES (1, 2, 'A', 'X', 'vault', 1)")
+
+    upgrade(legacy_engine)
+
+    with legacy_engine.begin() as conn:
+        conn.exec_driver_sql("DELETE FROM targets WHERE id = 1")
+        conn.exec_driver_sql("DELETE FROM missions WHERE id = 2")
+        conn.exec_driver_sql(
+            "INSERT INTO missions (cat_id, complete, version) VALUES (NULL, 0, 1)"
+        )
+        conn.exec_driver_sql(
+            "INSERT INTO targets (mission_id, name, country, notes, complete, version)"
+            " VALUES (3, 'B', 'Y', 'vault', 0, 1)"
+        )
+        ids = conn.exec_driver_sql(
+            "SELECT (SELECT max(id) FROM missions), rowid FROM targets_fts"
+            " WHERE targets_fts MATCH 'vault'"
+        ).one()
+    assert tuple(ids) == (3, 2)
+    assert {"ix_missions_cat_id_complete", "ix_missions_completed_at"} <= index_names(
+        legacy_engine, "missions"
+    )
@@ -0,0 +1,73 @@
+from services.metrics import (
+    BREED_VALIDATION_DURATION,
+    REQUEST_DURATION,
+    REQUEST_SQL_STATEMENTS,
+    Histogram,
+    registry,
+)
+
+
+def test_metrics_endpoint_reports_route_latency_and_sql(client, created_mission):
+    mission_id = created_mission["id"]
+    route = ("GET", "/missions/{mission_id}", 304)
+    before = REQUEST_DURATION.count(*route)
+
+    client.get(f"/missions/{mission_id}", headers={"If-None-Match": "*"})
+    assert REQUEST_DURATION.count(*route) == before + 1
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert (
+        'spycats_http_request_duration_seconds_count{method="GET",'
+        'route="/missions/{mission_id}",status="304"}'
+    ) in response.text
+    assert "# TYPE spycats_sql_statement_duration_seconds histogram" in response.text
+
+
+def test_sql_statements_are_attributed_to_the_request(client, created_mission):
+    route = ("GET", "/missions/")
+    before = REQUEST_SQL_STATEMENTS.sum(*route)
+    client.get("/missions/", params={"limit": 5})
+    # One page query plus one selectin query for the targets.
+    assert REQUEST_SQL_STATEMENTS.sum(*route) - before == 2
+
+
+def test_unmatched_paths_share_one_label(client):
+    before = REQUEST_DURATION.count("GET", "unmatched", 404)
+    client.get("/no/such/path/1")
+    client.get("/no/such/path/2")
+    assert REQUEST_DURATION.count("GET", "unmatched", 404) == before + 2
+
+
+def test_breed_validation_is_timed(client, created_spy_cat):
+    before = BREED_VALIDATION_DURATION.count()
+    client.post("/cats/", json={**created_spy_cat, "breed": "Bombay"})
+    assert BREED_VALIDATION_DURATION.count() == before + 1
+
+
+def test_disabled_registry_records_nothing(client):
+    before = REQUEST_DURATION.count("GET", "/")
+    registry.enabled = False
+    try:
+        client.get("/")
+    finally:
+        registry.enabled = True
+    assert REQUEST_DURATION.count("GET", "/") == before
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("demo_seconds", "Demo.", ("route",), buckets=(0.1, 1))
+    histogram.observe(0.05, "/a")
+    histogram.observe(0.5, "/a")
+    histogram.observe(5, "/a")
+
+    assert histogram.collect() == [
+        "# HELP demo_seconds Demo.",
+        "# TYPE demo_seconds histogram",
+        'demo_seconds_bucket{route="/a",le="0.1"} 1',
+        'demo_seconds_bucket{route="/a",le="1"} 2',
+        'demo_seconds_bucket{route="/a",le="+Inf"} 3',
+        'demo_seconds_sum{route="/a"} 5.55',
+        'demo_seconds_count{route="/a"} 3',
+    ]
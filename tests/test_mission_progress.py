@@ -0,0 +1,89 @@
+import config
+
+
+def two_target_mission(client, mission_data, completed=0):
+    targets = [
+        {**mission_data["targets"][0], "name": f"Target {i}", "complete": i < completed}
+        for i in range(2)
+    ]
+    response = client.post("/missions/", json={**mission_data, "targets": targets})
+    assert response.status_code == 201
+    return response.json()
+
+
+def patch_target(client, mission, index, **fields):
+    target_id = mission["targets"][index]["id"]
+    return client.patch(f"/missions/{mission['id']}/targets/{target_id}", json=fields)
+
+
+def test_create_mission_sets_counters(client, mission_data):
+    mission = two_target_mission(client, mission_data, completed=1)
+    assert mission["targets_total"] == 2
+    assert mission["targets_completed"] == 1
+
+    response = client.post("/missions/bulk", json=[mission_data, mission_data])
+    mission_id = response.json()["results"][0]["id"]
+    bulk_mission = client.get(f"/missions/{mission_id}").json()
+    assert (bulk_mission["targets_total"], bulk_mission["targets_completed"]) == (1, 0)
+
+
+def test_target_completion_moves_counter(client, mission_data):
+    mission = two_target_mission(client, mission_data)
+    url = f"/missions/{mission['id']}"
+
+    patch_target(client, mission, 0, complete=True)
+    patch_target(client, mission, 0, complete=True)
+    assert client.get(url).json()["targets_completed"] == 1
+
+    patch_target(client, mission, 0, complete=False)
+    assert client.get(url).json()["targets_completed"] == 0
+    assert client.get(url).json()["complete"] is False
+
+
+def test_last_target_auto_completes_mission(
+    client, mission_data, created_spy_cat, monkeypatch
+):
+    monkeypatch.setattr(config, "MISSION_AUTO_COMPLETE", True)
+    mission = two_target_mission(client, mission_data)
+    url = f"/missions/{mission['id']}"
+    client.patch(f"{url}/assign", json={"cat_id": created_spy_cat["id"]})
+
+    patch_target(client, mission, 0, complete=True)
+    assert client.get(url).json()["complete"] is False
+
+    patch_target(client, mission, 1, complete=True)
+    completed = client.get(url).json()
+    assert completed["complete"] is True
+    assert completed["cat_id"] is None
+
+
+def test_missions_stay_active_without_auto_complete(client, mission_data):
+    mission = two_target_mission(client, mission_data, completed=1)
+    patch_target(client, mission, 1, complete=True)
+    assert client.get(f"/missions/{mission['id']}").json()["complete"] is False
+
+
+def test_summary_reads_only_the_missions_table(
+    client, mission_data, created_spy_cat, count_queries
+):
+    before = client.get("/missions/summary").json()
+    mission = two_target_mission(client, mission_data, completed=1)
+    client.patch(
+        f"/missions/{mission['id']}/assign", json={"cat_id": created_spy_cat["id"]}
+    )
+
+    with count_queries:
+        summary = client.get("/missions/summary").json()
+    assert count_queries.count == 2
+    assert not any(" targets" in s for s in count_queries.statements)
+
+    assert summary["total"] == before["total"] + 1
+    assert summary["active"] == before["active"] + 1
+    assert summary["targets_total"] == before["targets_total"] + 2
+    assert summary["targets_completed"] == before["targets_completed"] + 1
+    assert {
+        "cat_id": created_spy_cat["id"],
+        "active_missions": 1,
+        "targets_total": 2,
+        "targets_completed": 1,
+    } in summary["per_cat"]
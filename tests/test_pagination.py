@@ -0,0 +1,102 @@
+def create_cat(client, name, breed="Bengal"):
+    response = client.post(
+        "/cats/",
+        json={"name": name, "breed": breed, "years_of_experience": 1, "salary": 1000},
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def create_mission(client, country="Nowhere Land"):
+    response = client.post(
+        "/missions/",
+        json={"targets": [{"name": "Target", "country": country}]},
+    )
+    assert response.status_code == 201
+    return response.json()
+
+
+def test_list_spy_cats_pages_by_cursor(client):
+    created = [create_cat(client, f"Pager {i}") for i in range(3)]
+    first_id = created[0]["id"]
+
+    response = client.get("/cats/", params={"cursor": first_id - 1, "limit": 2})
+    assert response.status_code == 200
+    assert [cat["id"] for cat in response.json()] == [first_id, first_id + 1]
+    next_cursor = response.headers["X-Next-Cursor"]
+    assert 'rel="next"' in response.headers["Link"]
+
+    response = client.get("/cats/", params={"cursor": next_cursor, "limit": 2})
+    assert response.json()[0]["id"] == first_id + 2
+
+
+def test_last_page_has_no_next_cursor(client):
+    cat = create_cat(client, "Last Pager")
+    response = client.get("/cats/", params={"cursor": cat["id"] - 1})
+    assert [c["id"] for c in response.json()] == [cat["id"]]
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_list_spy_cats_limit_is_capped(client):
+    assert client.get("/cats/", params={"limit": 0}).status_code == 422
+    assert client.get("/cats/", params={"limit": 100000}).status_code == 422
+
+
+def test_list_spy_cats_filters_by_breed(client):
+    cat = create_cat(client, "Persian Pager", breed="Persian")
+    response = client.get(
+        "/cats/", params={"breed": "persian", "cursor": cat["id"] - 1}
+    )
+    assert [c["id"] for c in response.json()] == [cat["id"]]
+
+
+def test_list_missions_filters(client):
+    cat = create_cat(client, "Filter Cat", breed="Abyssinian")
+    assigned = create_mission(client, country="Atlantis")
+    client.patch(f"/missions/{assigned['id']}/assign", json={"cat_id": cat["id"]})
+    other = create_mission(client, country="Atlantis")
+    after = assigned["id"] - 1
+
+    response = client.get("/missions/", params={"country": "Atlantis", "cursor": after})
+    assert [m["id"] for m in response.json()] == [assigned["id"], other["id"]]
+
+    response = client.get("/missions/", params={"cat_id": cat["id"]})
+    assert [m["id"] for m in response.json()] == [assigned["id"]]
+
+    response = client.get(
+        "/missions/",
+        params={"breed": "Abyssinian", "complete": False, "cursor": after},
+    )
+    assert [m["id"] for m in response.json()] == [assigned["id"]]
+
+    client.patch(f"/missions/{other['id']}", json={"complete": True})
+    response = client.get(
+        "/missions/", params={"country": "Atlantis", "complete": True, "cursor": after}
+    )
+    assert [m["id"] for m in response.json()] == [other["id"]]
+
+
+def test_async_list_missions_paginates(client):
+    first = create_mission(client)
+    create_mission(client)
+    response = client.get(
+        "/async/missions/", params={"cursor": first["id"] - 1, "limit": 1}
+    )
+    assert [m["id"] for m in response.json()] == [first["id"]]
+    assert response.headers["X-Next-Cursor"] == str(first["id"])
+
+
+def test_list_items_match_detail_responses(client):
+    # Lists are serialized from column rows without Pydantic; they must still
+    # render exactly like the schema-validated detail endpoints.
+    cat = create_cat(client, "Column Cat")
+    mission = create_mission(client)
+    client.post("/missions/", json={"targets": [{"name": "A", "country": "X"}]})
+
+    cats = client.get("/cats/", params={"cursor": cat["id"] - 1, "limit": 1}).json()
+    assert cats == [client.get(f"/cats/{cat['id']}").json()]
+
+    missions = client.get(
+        "/missions/", params={"cursor": mission["id"] - 1, "limit": 1}
+    ).json()
+    assert missions == [client.get(f"/missions/{mission['id']}").json()]
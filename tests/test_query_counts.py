@@ -0,0 +1,61 @@
+def create_missions(client, mission_data, count):
+    return [
+        client.post("/missions/", json=mission_data).json()["id"] for _ in range(count)
+    ]
+
+
+def list_missions_query_count(client, count_queries, cursor, limit):
+    with count_queries:
+        response = client.get("/missions/", params={"cursor": cursor, "limit": limit})
+    assert response.status_code == 200
+    assert len(response.json()) == limit
+    return count_queries.count
+
+
+def test_list_missions_does_not_scale_with_row_count(
+    client, count_queries, mission_data
+):
+    mission_data = {**mission_data, "targets": mission_data["targets"] * 3}
+    ids = create_missions(client, mission_data, 12)
+    cursor = ids[0] - 1
+
+    small_page = list_missions_query_count(client, count_queries, cursor, 2)
+    large_page = list_missions_query_count(client, count_queries, cursor, 12)
+
+    assert large_page == small_page
+    assert large_page <= 2
+
+
+def test_get_mission_loads_targets_in_one_query(client, count_queries, mission_data):
+    mission_id = create_missions(client, mission_data, 1)[0]
+    with count_queries:
+        response = client.get(f"/missions/{mission_id}")
+    assert response.status_code == 200
+    assert len(response.json()["targets"]) == 1
+    assert count_queries.count == 1
+
+
+def test_create_mission_query_count_is_bounded(client, count_queries, mission_data):
+    mission_data = {**mission_data, "targets": mission_data["targets"] * 3}
+    with count_queries:
+        response = client.post("/missions/", json=mission_data)
+    assert response.status_code == 201
+    assert len(response.json()["targets"]) == 3
+    selects = [s for s in count_queries.statements if s.startswith("SELECT")]
+    assert len(selects) == 1
+
+
+def test_assign_returns_targets_without_lazy_loads(
+    client, count_queries, mission_data, created_spy_cat
+):
+    mission_id = create_missions(client, mission_data, 1)[0]
+    with count_queries:
+        response = client.patch(
+            f"/missions/{mission_id}/assign", json={"cat_id": created_spy_cat["id"]}
+        )
+    assert response.status_code == 200
+    assert len(response.json()["targets"]) == 1
+    assert not any(
+        s.startswith("SELECT") and "FROM targets" in s and "JOIN" not in s
+        for s in count_queries.statements
+    )
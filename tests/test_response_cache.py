@@ -0,0 +1,119 @@
+import time
+
+from services.cache_stamps import SharedStamps
+from services.response_cache import MemoryBackend, ResponseCache, response_cache
+
+
+def cache_stats(client):
+    return client.get("/stats").json()["response_cache"]
+
+
+def test_get_spy_cat_is_served_from_cache(client, created_spy_cat):
+    cat_id = created_spy_cat["id"]
+    client.get(f"/cats/{cat_id}")
+    hits = cache_stats(client)["hits"]
+
+    response = client.get(f"/cats/{cat_id}")
+    assert response.status_code == 200
+    assert response.json() == created_spy_cat
+    assert cache_stats(client)["hits"] == hits + 1
+
+
+def test_updating_cat_invalidates_cached_response(client, created_spy_cat):
+    cat_id = created_spy_cat["id"]
+    client.get(f"/cats/{cat_id}")
+    client.patch(f"/cats/{cat_id}", json={"salary": 7777})
+    assert client.get(f"/cats/{cat_id}").json()["salary"] == 7777
+
+    client.delete(f"/cats/{cat_id}")
+    assert client.get(f"/cats/{cat_id}").status_code == 404
+
+
+def test_target_update_invalidates_parent_mission(client, created_mission):
+    mission_id = created_mission["id"]
+    target_id = created_mission["targets"][0]["id"]
+    client.get(f"/missions/{mission_id}")
+
+    client.patch(
+        f"/missions/{mission_id}/targets/{target_id}", json={"notes": "Fresh intel"}
+    )
+    mission = client.get(f"/missions/{mission_id}").json()
+    assert mission["targets"][0]["notes"] == "Fresh intel"
+
+
+def test_mission_writes_invalidate_cached_response(
+    client, created_mission, created_spy_cat
+):
+    mission_id = created_mission["id"]
+    client.get(f"/missions/{mission_id}")
+    client.patch(
+        f"/missions/{mission_id}/assign", json={"cat_id": created_spy_cat["id"]}
+    )
+    assert client.get(f"/missions/{mission_id}").json()["cat_id"] == (
+        created_spy_cat["id"]
+    )
+
+    client.patch(f"/missions/{mission_id}", json={"complete": True})
+    assert client.get(f"/missions/{mission_id}").json()["complete"] is True
+
+    client.delete(f"/missions/{mission_id}")
+    assert client.get(f"/missions/{mission_id}").status_code == 404
+
+
+def test_missing_entities_are_not_cached(client):
+    client.get("/cats/424242")
+    assert response_cache.get("cat", 424242) is None
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryBackend(max_entries=2, ttl=60)
+    backend.set("a", b"1")
+    backend.set("b", b"2")
+    backend.get("a")
+    backend.set("c", b"3")
+    assert backend.get("b") is None
+    assert backend.get("a") == b"1"
+
+
+def test_memory_backend_expires_entries():
+    backend = MemoryBackend(max_entries=10, ttl=0.01)
+    backend.set("a", b"1")
+    time.sleep(0.02)
+    assert backend.get("a") is None
+
+
+def test_fill_after_invalidation_is_discarded():
+    cache = ResponseCache(MemoryBackend(max_entries=10, ttl=60))
+    token = cache.token()
+    cache.invalidate("mission", 1)
+    cache.set("mission", 1, b"stale", token)
+    assert cache.get("mission", 1) is None
+    assert cache.stats()["misses"] == 1
+
+
+def worker_caches(tmp_path):
+    """Two caches standing in for two workers sharing a stamp file."""
+    path = str(tmp_path / "cache.stamps")
+    return [
+        ResponseCache(MemoryBackend(max_entries=10, ttl=60), SharedStamps(path, 64))
+        for _ in range(2)
+    ]
+
+
+def test_invalidation_reaches_other_workers(tmp_path):
+    first, second = worker_caches(tmp_path)
+    first.set("cat", 1, b"old", first.token())
+    first.set("cat", 2, b"other", first.token())
+    assert first.get("cat", 1) == b"old"
+
+    second.invalidate("cat", 1)
+    assert first.get("cat", 1) is None
+    assert first.get("cat", 2) == b"other"
+
+
+def test_fill_after_invalidation_by_other_worker_is_discarded(tmp_path):
+    first, second = worker_caches(tmp_path)
+    token = first.token()
+    second.invalidate("mission", 1)
+    first.set("mission", 1, b"stale", token)
+    assert first.get("mission", 1) is None
@@ -0,0 +1,137 @@
+import pytest
+from sqlalchemy import create_engine, event, insert, select
+from sqlalchemy.orm import Session
+
+from db.migrations import upgrade
+from db.models import Event, Mission, SpyCat
+from services.scheduler import schedule_missions
+
+# (years_of_experience, salary) per cat, inserted in this order.
+CATS = [(2, 3000.0), (9, 4000.0), (5, 1000.0)]
+
+
+@pytest.fixture
+def db(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/schedule.db")
+    upgrade(engine)
+    with Session(engine) as session:
+        session.execute(
+            insert(SpyCat),
+            [
+                {
+                    "name": f"Cat {i}",
+                    "breed": "Bengal",
+                    "years_of_experience": y,
+                    "salary": s,
+                }
+                for i, (y, s) in enumerate(CATS)
+            ],
+        )
+        # Mission 1 is complete and mission 2 already has cat 1, so cat 1 is
+        # busy and missions 3-5 are the open backlog.
+        session.execute(
+            insert(Mission),
+            [
+                {"complete": True},
+                {"complete": False, "cat_id": 1},
+                {"complete": False},
+                {"complete": False},
+                {"complete": False},
+            ],
+        )
+        session.commit()
+        yield session
+    engine.dispose()
+
+
+def pairs(result):
+    return [(a["mission_id"], a["cat_id"]) for a in result["assignments"]]
+
+
+@pytest.mark.parametrize(
+    "policy, expected",
+    [
+        ("fifo", [(3, 2), (4, 3)]),
+        ("experience", [(3, 2), (4, 3)]),
+        ("cost", [(3, 3), (4, 2)]),
+    ],
+)
+def test_policies_order_idle_cats(db, policy, expected):
+    result = schedule_missions(db, policy, dry_run=True)
+    assert pairs(result) == expected
+    assert result["idle_cats"] == 2
+    assert set(result["timings"]) == {
+        "select_cats_ms",
+        "select_missions_ms",
+        "match_ms",
+    }
+
+
+def test_dry_run_writes_nothing(db):
+    schedule_missions(db, "fifo", dry_run=True)
+    assert db.scalars(select(Mission.cat_id).where(Mission.id > 2)).all() == [
+        None,
+        None,
+        None,
+    ]
+
+
+def test_schedule_commits_all_assignments_in_one_update(db):
+    statements = []
+    engine = db.get_bind()
+    listener = lambda *args: statements.append(args[2])
+    event.listen(engine, "before_cursor_execute", listener)
+    result = schedule_missions(db, "cost", limit=1)
+    event.remove(engine, "before_cursor_execute", listener)
+
+    assert pairs(result) == [(3, 3)]
+    assert "commit_ms" in result["timings"]
+    assert [s.split()[0] for s in statements] == [
+        "SELECT",
+        "SELECT",
+        "UPDATE",
+        "INSERT",
+    ]
+    mission = db.get(Mission, 3)
+    assert (mission.cat_id, mission.version) == (3, 2)
+    assert db.scalars(select(Event.type).where(Event.entity_id == 3)).all() == [
+        "mission.assigned"
+    ]
+
+    # Cat 3 is busy now; the next run pairs the remaining idle cat.
+    assert pairs(schedule_missions(db, "cost")) == [(4, 2)]
+    assert pairs(schedule_missions(db, "cost")) == []
+
+
+def test_unknown_policy(db):
+    assert schedule_missions(db, "random") == "unknown_policy"
+
+
+def test_schedule_endpoint(client):
+    client.post(
+        "/cats/",
+        json={
+            "name": "Sched",
+            "breed": "Bengal",
+            "years_of_experience": 1,
+            "salary": 1,
+        },
+    )
+    client.post("/missions/", json={"targets": [{"name": "T", "country": "C"}]})
+
+    response = client.post("/missions/schedule", json={"dry_run": True})
+    assert response.status_code == 200
+    planned = response.json()["assignments"]
+    assert planned
+
+    response = client.post("/missions/schedule", json={"policy": "cost"})
+    assert response.status_code == 200
+    first = response.json()["assignments"][0]
+    mission = client.get(f"/missions/{first['mission_id']}").json()
+    assert mission["cat_id"] == first["cat_id"]
+    # A full run leaves nothing that could still be matched.
+    response = client.post("/missions/schedule", json={"dry_run": True})
+    assert response.json()["assignments"] == []
+
+    response = client.post("/missions/schedule", json={"policy": "random"})
+    assert response.status_code == 400
@@ -0,0 +1,90 @@
+import uuid
+
+from services.search_service import fts_query
+
+
+def create_mission(client, *targets):
+    response = client.post("/missions/", json={"targets": list(targets)})
+    assert response.status_code == 201
+    return response.json()
+
+
+def unique(word):
+    # The test database persists between runs; a per-run suffix keeps
+    # earlier runs' targets out of the exact result sets below.
+    return f"{word}{uuid.uuid4().hex}"
+
+
+def search(client, **params):
+    response = client.get("/targets/search", params=params)
+    assert response.status_code == 200, response.text
+    return response
+
+
+def test_fts_query_quotes_terms():
+    assert fts_query('embassy OR "x" NEAR(') == '"embassy" "OR" "x" "NEAR"'
+    assert fts_query("infil*  roof") == '"infil"* "roof"'
+    assert fts_query(" -- ") is None
+
+
+def test_search_matches_notes_and_ranks_names_first(client):
+    word = unique("quokkaville")
+    mission = create_mission(
+        client,
+        {"name": f"{word} Docks", "country": "Norway", "notes": ""},
+        {"name": "Harbour", "country": "Norway", "notes": f"near {word} pier"},
+    )
+    hits = search(client, q=word).json()
+    assert [hit["name"] for hit in hits] == [f"{word} Docks", "Harbour"]
+    assert hits[0]["mission_id"] == mission["id"]
+    assert hits[0]["score"] > hits[1]["score"]
+    assert f"[{word}]" in hits[1]["snippet"]
+
+
+def test_search_prefix_and_country_filter(client):
+    prefix = unique("zephyr")
+    create_mission(
+        client,
+        {"name": f"{prefix}ine Vault", "country": "Kenya", "notes": ""},
+        {"name": f"{prefix}ine Annex", "country": "Japan", "notes": ""},
+    )
+    assert len(search(client, q=f"{prefix}*").json()) == 2
+    assert search(client, q=prefix).json() == []
+    hits = search(client, q=f"{prefix}*", country="Japan").json()
+    assert [hit["name"] for hit in hits] == [f"{prefix}ine Annex"]
+
+
+def test_search_follows_target_updates(client):
+    old, new = unique("xylocarp"), unique("marmalade")
+    mission = create_mission(
+        client, {"name": "Safehouse", "country": "Peru", "notes": old}
+    )
+    target_id = mission["targets"][0]["id"]
+    response = client.patch(
+        f"/missions/{mission['id']}/targets/{target_id}",
+        json={"notes": f"moved to the {new} factory"},
+    )
+    assert response.status_code == 200
+    assert search(client, q=old).json() == []
+    assert [hit["id"] for hit in search(client, q=new).json()] == [target_id]
+
+    assert client.delete(f"/missions/{mission['id']}").status_code == 204
+    assert search(client, q=new).json() == []
+
+
+def test_search_pages_by_offset_cursor(client):
+    word = unique("ocelotine")
+    create_mission(
+        client, *({"name": f"{word} {i}", "country": "Chad"} for i in range(3))
+    )
+    first = search(client, q=word, limit=2)
+    cursor = first.headers["X-Next-Cursor"]
+    second = search(client, q=word, limit=2, cursor=cursor)
+    assert "X-Next-Cursor" not in second.headers
+    ids = [hit["id"] for hit in first.json() + second.json()]
+    assert len(set(ids)) == 3
+
+
+def test_search_rejects_query_without_terms(client):
+    response = client.get("/targets/search", params={"q": "***"})
+    assert response.status_code == 400
@@ -0,0 +1,21 @@
+import config
+from serve import deployment_problems
+
+
+def test_single_worker_needs_no_checks():
+    assert deployment_problems("sqlite://", 1) == []
+
+
+def test_in_memory_sqlite_is_refused_for_several_workers():
+    assert deployment_problems("sqlite://", 2)
+
+
+def test_sqlite_file_needs_wal_for_several_workers(monkeypatch):
+    url = "sqlite:////tmp/spycats.db"
+    assert deployment_problems(url, 4) == []
+    monkeypatch.setattr(config, "SQLITE_JOURNAL_MODE", "DELETE")
+    assert deployment_problems(url, 4)
+
+
+def test_postgres_is_accepted():
+    assert deployment_problems("postgresql://spy@localhost/spycats", 4) == []
@@ -0,0 +1,52 @@
+import os
+
+from sqlalchemy import create_engine, event
+
+from benchmarks.startup import measure
+from db.migrations import SCHEMA_VERSION, stored_schema_version, upgrade
+
+# Generous enough for slow CI machines; the point is to catch regressions
+# such as a heavy import or DDL creeping back into every startup.
+STARTUP_BUDGET_SECONDS = float(os.getenv("STARTUP_BUDGET_SECONDS", "5"))
+
+
+def test_cold_start(tmp_path):
+    path = str(tmp_path / "startup.db")
+    first = measure(path)
+    assert not first["database_created_on_import"]
+    assert os.path.exists(path)
+
+    warm = measure(path)
+    total = sum(
+        warm[key]
+        for key in ("import_seconds", "startup_seconds", "first_request_seconds")
+    )
+    print(f"cold start on a current schema: {warm}")
+    assert total < STARTUP_BUDGET_SECONDS
+    assert not warm["requests_imported"]
+
+
+def test_upgrade_skips_current_schema(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/schema.db")
+    assert upgrade(engine) is True
+    with engine.connect() as conn:
+        assert stored_schema_version(conn) == SCHEMA_VERSION
+
+    statements = []
+    event.listen(
+        engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+    )
+    assert upgrade(engine) is False
+    assert not any(
+        s.lstrip().upper().startswith(("CREATE", "ALTER")) for s in statements
+    )
+    engine.dispose()
+
+
+def test_upgrade_reruns_for_older_schema_version(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/schema.db")
+    upgrade(engine)
+    with engine.begin() as conn:
+        conn.exec_driver_sql("UPDATE schema_version SET version = 0")
+    assert upgrade(engine) is True
+    engine.dispose()